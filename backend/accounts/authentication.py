@@ -0,0 +1,31 @@
+"""
+Account Authentication
+
+Token authentication that loads the user's player in the same query.
+"""
+from rest_framework import authentication, exceptions
+
+
+class PlayerTokenAuthentication(authentication.TokenAuthentication):
+    """
+    DRF token authentication with the player joined in
+
+    Nearly every authenticated endpoint reads request.user.player, so the
+    token lookup pulls the user and player rows in a single SELECT instead
+    of leaving the player to a second lazy query. The squad is joined as
+    well (a one-to-one, so at most one row): the squad endpoints read
+    request.user.player.squad, and a player without one gets None cached
+    rather than a query per hasattr().
+    """
+
+    def authenticate_credentials(self, key):
+        model = self.get_model()
+        try:
+            token = model.objects.select_related('user', 'user__player', 'user__player__squad').get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+
+        return (token.user, token)
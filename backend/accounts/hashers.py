@@ -0,0 +1,17 @@
+"""
+Account Password Hashers
+"""
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with parameters sized for the game server
+
+    Login, registration and password changes are CPU-bound on the hasher.
+    These costs target roughly 50ms per hash; retune if the host changes.
+    Stored hashes with other parameters are re-hashed on the next login.
+    """
+    time_cost = 2
+    memory_cost = 65536  # KiB
+    parallelism = 4
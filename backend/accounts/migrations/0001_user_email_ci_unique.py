@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Upper
+
+
+INDEX_NAME = 'uniq_user_email_ci'
+
+
+def check_case_duplicates(apps, schema_editor):
+    """Refuse to continue while emails differ only by case"""
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+
+    duplicates = list(
+        User.objects.exclude(email='').annotate(email_ci=Upper('email'))
+        .values('email_ci').annotate(n=Count('pk')).filter(n__gt=1)
+        .order_by('email_ci').values_list('email_ci', flat=True)
+    )
+    if duplicates:
+        shown = ', '.join(duplicates[:20])
+        more = f' and {len(duplicates) - 20} more' if len(duplicates) > 20 else ''
+        raise RuntimeError(
+            f'Cannot add {INDEX_NAME}: {len(duplicates)} email(s) are shared by '
+            f'accounts that differ only by case ({shown}{more}). Change or blank '
+            'the extra accounts\' emails, then run the migration again.'
+        )
+
+
+def create_index(apps, schema_editor):
+    """Create the partial UPPER(email) index on the user model's table"""
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    quote = schema_editor.quote_name
+    email = quote(User._meta.get_field('email').column)
+    schema_editor.execute(
+        f"CREATE UNIQUE INDEX {quote(INDEX_NAME)} ON {quote(User._meta.db_table)} "
+        f"(UPPER({email})) WHERE {email} <> ''"
+    )
+
+
+def drop_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX {schema_editor.quote_name(INDEX_NAME)}')
+
+
+class Migration(migrations.Migration):
+    """
+    Case-insensitive unique index on the user email column
+
+    The expression matches what Django emits for email__iexact on
+    PostgreSQL (UPPER(email) = UPPER(%s)), so the registration uniqueness
+    check becomes an index probe. Blank emails are excluded so accounts
+    created without one (e.g. createsuperuser) are unaffected; because the
+    index is partial, lookups must also filter out blank emails
+    (.exclude(email='')) for the planner to use it.
+
+    Uniqueness used to be exact-match only, so existing databases may hold
+    emails that differ only by case. Those are reported before the index
+    is built rather than merged, since picking the account to keep needs a
+    human decision.
+    """
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        # Run after every auth_user change; SQLite rebuilds the table for
+        # column alterations and would drop this index
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_duplicates, migrations.RunPython.noop),
+        migrations.RunPython(create_index, drop_index),
+    ]
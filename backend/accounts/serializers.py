@@ -44,8 +44,10 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return attrs
 
     def validate_email(self, value):
-        """Validate email uniqueness"""
-        if User.objects.filter(email=value).exists():
+        """Validate email uniqueness (case-insensitive)"""
+        # The blank-email exclusion matches the partial index's predicate
+        taken = User.objects.filter(email__iexact=value).exclude(email='')
+        if taken.only('pk').exists():
             raise serializers.ValidationError('Email already in use')
         return value
 
@@ -53,25 +55,18 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         """Create new user"""
         validated_data.pop('password_confirm')
 
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password']
+        user = User(
+            username=User.normalize_username(validated_data['username']),
+            email=User.objects.normalize_email(validated_data['email']),
         )
+        user.set_password(validated_data['password'])
 
-        return user
-
+        # RegisterView creates the player itself with the chosen character
+        # name, so the post_save signal must not insert a default one first
+        user.skip_player_creation = True
+        user.save()
 
-class UserLoginSerializer(serializers.Serializer):
-    """
-    Serializer for user login
-    """
-    username = serializers.CharField(required=True)
-    password = serializers.CharField(
-        required=True,
-        write_only=True,
-        style={'input_type': 'password'}
-    )
+        return user
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
@@ -92,6 +87,23 @@ class UserProfileSerializer(serializers.ModelSerializer):
         fields = ['id', 'username', 'email', 'character_name', 'level', 'date_joined']
         read_only_fields = ['id', 'username', 'date_joined']
 
+    def validate_email(self, value):
+        """Validate email uniqueness against other accounts"""
+        taken = User.objects.filter(email__iexact=value).exclude(email='').exclude(
+            pk=self.instance.pk
+        )
+        if taken.only('pk').exists():
+            raise serializers.ValidationError('Email already in use')
+        return value
+
+    def update(self, instance, validated_data):
+        """Write only the columns that were submitted"""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=list(validated_data))
+        return instance
+
 
 class ChangePasswordSerializer(serializers.Serializer):
     """
@@ -3,21 +3,60 @@ Account Views
 
 Handles user registration, login, and profile management.
 """
+import hashlib
+import re
+from datetime import timedelta
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.authtoken.models import Token
-from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth import login, logout
 from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.utils.encoding import force_str
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from game.models import Player, Room
 from .serializers import (
-    UserRegistrationSerializer, UserLoginSerializer,
+    UserRegistrationSerializer,
     UserProfileSerializer, ChangePasswordSerializer,
     PasswordResetRequestSerializer, PasswordResetConfirmSerializer
 )
 
 User = get_user_model()
 
+STARTING_ROOM_CACHE_KEY = 'starting_room_id'
+
+# Shape of a urlsafe-base64 encoded user pk, as issued by the reset request
+_RESET_UID_RE = re.compile(r'^[A-Za-z0-9_-]{1,32}$')
+
+# How stale last_login may get for token-only logins before it is rewritten
+LAST_LOGIN_UPDATE_INTERVAL = timedelta(minutes=5)
+
+
+def _starting_room_id():
+    """
+    Return the id of the 'start' room, or None if it does not exist
+
+    Cached so registration does not query the room on every call; the game
+    signals drop the cache entry whenever the start room is saved or deleted.
+    A missing room is cached as 0 so it is not re-queried either.
+    """
+    room_id = cache.get(STARTING_ROOM_CACHE_KEY)
+    if room_id is None:
+        room_id = Room.objects.filter(key='start').order_by().values_list('id', flat=True).first() or 0
+        cache.set(STARTING_ROOM_CACHE_KEY, room_id, 3600)
+    return room_id or None
+
 
 class RegisterView(APIView):
     """
@@ -31,38 +70,29 @@ class RegisterView(APIView):
         serializer = UserRegistrationSerializer(data=request.data)
 
         if serializer.is_valid():
-            user = serializer.save()
-
-            # Create auth token
-            token, created = Token.objects.get_or_create(user=user)
-
-            # Create player character
-            from game.models import Player, Room
-            character_name = request.data.get('character_name', user.username)
-
-            # Get starting room (or create a default one if needed)
+            # The serializer's uniqueness checks can race with a concurrent
+            # registration; the unique indexes are the final arbiter.
             try:
-                starting_room = Room.objects.filter(key='start').first()
-            except:
-                starting_room = None
-
-            # Use get_or_create to avoid duplicate player creation
-            player, created = Player.objects.get_or_create(
-                user=user,
-                defaults={
-                    'character_name': character_name,
-                    'location': starting_room,
-                    'home': starting_room
-                }
-            )
-
-            # If player was created by signal, update with custom character_name
-            if not created and character_name != player.character_name:
-                player.character_name = character_name
-                if starting_room:
-                    player.location = starting_room
-                    player.home = starting_room
-                player.save()
+                with transaction.atomic():
+                    user = serializer.save()
+
+                    # Fresh user, so the token cannot exist yet: plain INSERT
+                    token = Token.objects.create(user=user)
+
+                    # Create player character
+                    character_name = serializer.validated_data.get('character_name') or user.username
+                    starting_room_id = _starting_room_id()
+
+                    player = Player.objects.create(
+                        user=user,
+                        character_name=character_name,
+                        location_id=starting_room_id,
+                        home_id=starting_room_id
+                    )
+            except IntegrityError:
+                return Response({
+                    'error': 'An account with this username, email or character name already exists'
+                }, status=status.HTTP_400_BAD_REQUEST)
 
             return Response({
                 'user': {
@@ -81,45 +111,93 @@ class RegisterView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def _login_credentials(data):
+    """
+    Pull username and password out of a login payload
+
+    Stands in for a two-field DRF serializer on the login hot path. Matches
+    CharField defaults: values are whitespace-trimmed and must be non-empty
+    strings, with errors keyed by field like serializer.errors.
+    """
+    if not isinstance(data, dict):
+        return None, None, {'non_field_errors': ['Invalid data. Expected a dictionary.']}
+
+    values = []
+    errors = {}
+    for field in ('username', 'password'):
+        value = data.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+        if not value or not isinstance(value, str):
+            errors[field] = ['This field is required.']
+        values.append(value)
+    return values[0], values[1], errors
+
+
 class LoginView(APIView):
     """
     User login endpoint
 
     POST: Authenticate and get auth token
+
+    Clients that only use the token can send `X-Token-Only: true` to skip
+    creating a session.
     """
     permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'login'
 
     def post(self, request):
-        serializer = UserLoginSerializer(data=request.data)
-
-        if serializer.is_valid():
-            username = serializer.validated_data['username']
-            password = serializer.validated_data['password']
+        username, password, errors = _login_credentials(request.data)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
-            user = authenticate(username=username, password=password)
-
-            if user:
-                # Create or get token
-                token, created = Token.objects.get_or_create(user=user)
+        # One indexed lookup fetches the user together with its token,
+        # replacing authenticate() followed by Token.get_or_create()
+        try:
+            user = User._default_manager.select_related('auth_token').get(
+                **{User.USERNAME_FIELD: username}
+            )
+        except User.DoesNotExist:
+            # Run the hasher anyway so response time does not reveal
+            # whether the username exists (mirrors ModelBackend)
+            User().set_password(password)
+            user = None
 
+        if user and user.check_password(password) and user.is_active:
+            try:
+                token = user.auth_token
+            except Token.DoesNotExist:
+                # Rare path (first login of a session-only account);
+                # get_or_create absorbs a concurrent first login's INSERT
+                token, _ = Token.objects.get_or_create(user=user)
+
+            if request.headers.get('X-Token-Only', '').lower() == 'true':
+                # Token-only clients never use the session, so skip the
+                # session write and cookie rotation; just keep last_login
+                # roughly current with one conditional UPDATE
+                now = timezone.now()
+                User.objects.filter(
+                    Q(last_login__isnull=True) | Q(last_login__lt=now - LAST_LOGIN_UPDATE_INTERVAL),
+                    pk=user.pk,
+                ).update(last_login=now)
+            else:
                 # Update session
                 login(request, user)
 
-                return Response({
-                    'user': {
-                        'id': user.id,
-                        'username': user.username,
-                        'email': user.email,
-                    },
-                    'token': token.key,
-                    'message': 'Login successful'
-                })
-            else:
-                return Response({
-                    'error': 'Invalid credentials'
-                }, status=status.HTTP_401_UNAUTHORIZED)
-
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            return Response({
+                'user': {
+                    'id': user.id,
+                    'username': user.username,
+                    'email': user.email,
+                },
+                'token': token.key,
+                'message': 'Login successful'
+            })
+        else:
+            return Response({
+                'error': 'Invalid credentials'
+            }, status=status.HTTP_401_UNAUTHORIZED)
 
 
 class LogoutView(APIView):
@@ -131,11 +209,8 @@ class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        # Delete user's token
-        try:
-            request.user.auth_token.delete()
-        except:
-            pass
+        # Delete user's token (filtering on user_id skips loading it first)
+        Token.objects.filter(user_id=request.user.pk).delete()
 
         # Logout from session
         logout(request)
@@ -145,6 +220,18 @@ class LogoutView(APIView):
         })
 
 
+def _profile_etag(request):
+    """ETag over the fields UserProfileSerializer exposes"""
+    user = request.user
+    player = getattr(user, 'player', None)
+    parts = (
+        user.pk, user.username, user.email, user.date_joined.isoformat(),
+        player.character_name if player else None,
+        player.level if player else None,
+    )
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
 class ProfileView(APIView):
     """
     User profile endpoint
@@ -154,6 +241,11 @@ class ProfileView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
+    # Clients revalidate every poll; an unchanged profile costs a 304 with
+    # no serialization. The data already arrives with the auth query, so a
+    # server-side copy would only add invalidation work.
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=_profile_etag))
     def get(self, request):
         serializer = UserProfileSerializer(request.user)
         return Response(serializer.data)
@@ -172,6 +264,27 @@ class ProfileView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def _set_password_and_rotate_token(user, new_password):
+    """
+    Save a new password and replace the user's auth token atomically
+
+    Only the password column is written. The token is rotated with a single
+    UPDATE of the existing row so there is no window without a token;
+    Token.key is the primary key, which bulk_create(update_conflicts=True)
+    refuses to update, hence update() with an INSERT fallback.
+
+    Returns the new token key.
+    """
+    key = Token.generate_key()
+    with transaction.atomic():
+        user.set_password(new_password)
+        user.save(update_fields=['password'])
+
+        if not Token.objects.filter(user_id=user.pk).update(key=key, created=timezone.now()):
+            Token.objects.create(user_id=user.pk, key=key)
+    return key
+
+
 class ChangePasswordView(APIView):
     """
     Change password endpoint
@@ -192,17 +305,14 @@ class ChangePasswordView(APIView):
                     'error': 'Invalid old password'
                 }, status=status.HTTP_400_BAD_REQUEST)
 
-            # Set new password
-            user.set_password(serializer.validated_data['new_password'])
-            user.save()
-
-            # Create new token
-            Token.objects.filter(user=user).delete()
-            token = Token.objects.create(user=user)
+            # Set new password and rotate the token in one commit
+            key = _set_password_and_rotate_token(
+                user, serializer.validated_data['new_password']
+            )
 
             return Response({
                 'message': 'Password changed successfully',
-                'token': token.key
+                'token': key
             })
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -215,6 +325,8 @@ class PasswordResetRequestView(APIView):
     POST: Request a password reset token via email
     """
     permission_classes = [AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'password_reset'
 
     def post(self, request):
         serializer = PasswordResetRequestSerializer(data=request.data)
@@ -222,32 +334,35 @@ class PasswordResetRequestView(APIView):
         if serializer.is_valid():
             email = serializer.validated_data['email']
 
-            # Find user by email
-            try:
-                user = User.objects.get(email=email)
-
-                # Generate reset token
-                from django.contrib.auth.tokens import default_token_generator
-                from django.utils.http import urlsafe_base64_encode
-                from django.utils.encoding import force_bytes
-
-                token = default_token_generator.make_token(user)
-                uid = urlsafe_base64_encode(force_bytes(user.pk))
-
-                # TODO: Send email with reset link
-                # For now, return token in response (in production, send via email)
-
-                return Response({
-                    'message': 'Password reset instructions have been sent to your email',
-                    'reset_token': token,  # Remove this in production
-                    'uid': uid  # Remove this in production
-                })
-            except User.DoesNotExist:
-                # Don't reveal that user doesn't exist
+            # Find user by email (only the columns the token hash reads);
+            # iexact matches the UPPER(email) unique index, and excluding
+            # blanks repeats its WHERE clause so the planner can use it
+            user = User.objects.filter(email__iexact=email).exclude(email='').only(
+                'id', 'password', 'last_login', 'email'
+            ).first()
+
+            if user is None:
+                # Don't reveal that user doesn't exist: do the same token
+                # work against a placeholder so timing matches
+                default_token_generator.make_token(User(pk=0, password='!'))
                 return Response({
                     'message': 'Password reset instructions have been sent to your email'
                 })
 
+            # Generate reset token
+            token = default_token_generator.make_token(user)
+            # pk is always an int, so skip force_bytes' lazy-string handling
+            uid = urlsafe_base64_encode(str(user.pk).encode('ascii'))
+
+            # TODO: Send email with reset link
+            # For now, return token in response (in production, send via email)
+
+            return Response({
+                'message': 'Password reset instructions have been sent to your email',
+                'reset_token': token,  # Remove this in production
+                'uid': uid  # Remove this in production
+            })
+
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -260,43 +375,49 @@ class PasswordResetConfirmView(APIView):
     permission_classes = [AllowAny]
 
     def post(self, request):
-        from django.contrib.auth.tokens import default_token_generator
-        from django.utils.http import urlsafe_base64_decode
-        from django.utils.encoding import force_str
+        # Reject malformed uids (and non-object bodies) before any
+        # validation, DB or HMAC work
+        uid = request.data.get('uid') if isinstance(request.data, dict) else None
+        if not isinstance(uid, str) or not _RESET_UID_RE.match(uid):
+            return Response({
+                'error': 'Invalid reset link'
+            }, status=status.HTTP_400_BAD_REQUEST)
 
         serializer = PasswordResetConfirmSerializer(data=request.data)
 
         if serializer.is_valid():
             try:
-                uid = request.data.get('uid')
-                user_id = force_str(urlsafe_base64_decode(uid))
-                user = User.objects.get(pk=user_id)
-
-                # Verify token
-                token = serializer.validated_data['token']
-                if default_token_generator.check_token(user, token):
-                    # Set new password
-                    user.set_password(serializer.validated_data['new_password'])
-                    user.save()
-
-                    # Invalidate all existing tokens
-                    Token.objects.filter(user=user).delete()
-
-                    # Create new token
-                    new_token = Token.objects.create(user=user)
-
-                    return Response({
-                        'message': 'Password reset successful',
-                        'token': new_token.key
-                    })
-                else:
-                    return Response({
-                        'error': 'Invalid or expired reset token'
-                    }, status=status.HTTP_400_BAD_REQUEST)
-
-            except (User.DoesNotExist, ValueError, TypeError):
+                user_id = int(force_str(urlsafe_base64_decode(uid)))
+            except (ValueError, TypeError):
+                user_id = None
+
+            user = None
+            if user_id is not None:
+                user = User.objects.filter(pk=user_id).only(
+                    'id', 'password', 'last_login', 'email', 'is_active'
+                ).first()
+
+            if user is None:
                 return Response({
                     'error': 'Invalid reset link'
                 }, status=status.HTTP_400_BAD_REQUEST)
 
+            # Verify token
+            token = serializer.validated_data['token']
+            if default_token_generator.check_token(user, token):
+                # Set new password; rotating the token invalidates
+                # every existing session token in the same commit
+                key = _set_password_and_rotate_token(
+                    user, serializer.validated_data['new_password']
+                )
+
+                return Response({
+                    'message': 'Password reset successful',
+                    'token': key
+                })
+            else:
+                return Response({
+                    'error': 'Invalid or expired reset token'
+                }, status=status.HTTP_400_BAD_REQUEST)
+
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
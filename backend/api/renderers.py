@@ -0,0 +1,61 @@
+"""
+API Renderers and Parsers
+
+orjson-backed replacements for DRF's JSON renderer and parser.
+"""
+import orjson
+from django.http import HttpResponse
+from rest_framework.utils import encoders
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+# Types orjson can't serialize natively (Decimal, lazy strings, timedelta,
+# querysets...) fall back to DRF's encoder so the output is unchanged
+_drf_encoder = encoders.JSONEncoder()
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using orjson
+
+    Compact output only; indented rendering (e.g. the browsable API)
+    goes through DRF's json.dumps path.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_drf_encoder.default, option=ORJSON_OPTIONS)
+
+        # Match DRF: escape U+2028/U+2029 so output is a strict JS subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+def orjson_response(data, status=200):
+    """
+    HttpResponse with data rendered by ORJSONRenderer
+
+    For hot JSON-only endpoints: skips DRF's content negotiation and
+    Response rendering (and so the browsable API).
+    """
+    return HttpResponse(ORJSONRenderer().render(data), status=status, content_type='application/json')
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSON parser using orjson
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -29,9 +29,11 @@ urlpatterns = [
 
     # Mission endpoints
     path('v1/missions/', mission_views.MissionListView.as_view(), name='mission-list'),
+    # Must precede the <mission_key> routes or they would be taken as keys
+    path('v1/missions/create-private/', mission_views.MissionCreatePrivateView.as_view(), name='mission-create-private'),
+    path('v1/missions/batch/', mission_views.MissionObjectiveBatchCompleteView.as_view(), name='mission-objective-batch'),
     path('v1/missions/<str:mission_key>/', mission_views.MissionDetailView.as_view(), name='mission-detail'),
     path('v1/missions/<str:mission_key>/accept/', mission_views.MissionAcceptView.as_view(), name='mission-accept'),
-    path('v1/missions/create-private/', mission_views.MissionCreatePrivateView.as_view(), name='mission-create-private'),
 
     # Player mission instance endpoints
     path('v1/player-missions/<uuid:player_mission_id>/objectives/<str:objective_key>/complete/',
@@ -3,28 +3,199 @@ Mission API Views
 
 Provides REST API endpoints for mission management
 """
+import hashlib
+import uuid
+
 from rest_framework import status
+from rest_framework.pagination import CursorPagination
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.core.cache import cache
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.core.exceptions import ValidationError
+from django.db import DataError, IntegrityError, transaction
+from django.db.models import Count, Max, OuterRef, Prefetch, Q, Subquery
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from game.cache import MISSION_CATALOG_FIELDS, MissionCache
+from game.models import (
+    Mission, MissionAct, MissionEvent, PlayerMission, Player, NPC, Item
+)
+
+# MissionEvent fields a client may set when creating a private mission
+MISSION_EVENT_FIELDS = (
+    'key', 'name', 'event_type', 'act', 'trigger_type', 'trigger_conditions',
+    'trigger_chance', 'description', 'choices', 'outcomes', 'is_repeatable',
+)
+
+# Columns loaded for active/completed list rows: the player mission and the
+# catalog fields of its mission, without the mission's narrative text
+PLAYER_MISSION_ROW_FIELDS = (
+    *(field.name for field in PlayerMission._meta.concrete_fields),
+    *(f'mission__{name}' for name in MISSION_CATALOG_FIELDS),
+)
+
+def _request_player(request):
+    """
+    The authenticated user's Player
+
+    PlayerTokenAuthentication joins the player into the token lookup, so
+    for token clients this costs no query. Raises Http404 if the user has
+    no player, like the get_object_or_404() it replaces.
+    """
+    try:
+        return request.user.player
+    except Player.DoesNotExist:
+        raise Http404('No Player matches the given query.')
+
+
+MISSION_CATALOG_VERSION_KEY = 'mission_catalog_version'
+
+
+def _mission_catalog_version():
+    """
+    Latest mission edit and mission count
+
+    Catalog edits are rare, so this is cached for a few seconds rather than
+    aggregated on every poll.
+    """
+    version = cache.get(MISSION_CATALOG_VERSION_KEY)
+    if version is None:
+        stats = Mission.objects.aggregate(updated=Max('updated_at'), count=Count('id'))
+        version = (stats['updated'], stats['count'])
+        cache.set(MISSION_CATALOG_VERSION_KEY, version, 5)
+    return version
 
-from game.models import Mission, PlayerMission, Player, NPC
+
+def _missions_etag(request, mission_key=None):
+    """
+    ETag for the mission list and detail responses
+
+    Covers everything the responses depend on: the catalog, and in one
+    query the player's level, missions, squad and items. The squad is
+    tracked by id and version (member saves and deletes bump it), the
+    items by count and latest edit, so swapping one item for another
+    changes the tag too. The current minute is included because time
+    limits and cooldowns in the response count down.
+    """
+    items = Item.objects.filter(owner_player=OuterRef('pk')).order_by().values('owner_player')
+    player_state = Player.objects.filter(user_id=request.user.pk).values_list(
+        'level',
+        Subquery(
+            PlayerMission.objects.filter(player=OuterRef('pk'))
+            .order_by('-updated_at').values('updated_at')[:1]
+        ),
+        'squad__id',
+        'squad__version',
+        Subquery(items.annotate(n=Count('id')).values('n')),
+        Subquery(items.annotate(updated=Max('updated_at')).values('updated')),
+    ).first()
+    if player_state is None:
+        return None
+
+    minute = int(timezone.now().timestamp() // 60)
+    parts = (mission_key, _mission_catalog_version(), player_state, minute)
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+class MissionCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the single-bucket mission list
+
+    The ordering is set per bucket by MissionListView.
+    """
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+
+
+def _mission_row(mission):
+    """Catalog fields shared by every mission list row"""
+    return {
+        'id': mission.id,
+        'key': mission.key,
+        'name': mission.name,
+        'type': mission.mission_type,
+        'difficulty': mission.difficulty,
+        'required_level': mission.required_level,
+        'is_public': mission.is_public,
+        'hook_title': mission.hook_title,
+        'given_by': mission.given_by_npc.name if mission.given_by_npc else None,
+        'time_limit': mission.time_limit,
+        'is_repeatable': mission.is_repeatable,
+    }
+
+
+def _active_row(player_mission):
+    row = _mission_row(player_mission.mission)
+    row['player_mission_id'] = player_mission.id
+    row['status'] = player_mission.status
+    row['progress'] = player_mission.get_progress_summary()
+    return row
+
+
+def _completed_row(player_mission):
+    row = _mission_row(player_mission.mission)
+    row['completed_at'] = player_mission.completed_at
+    row['success_level'] = player_mission.success_level
+    return row
 
 
 class MissionListView(APIView):
     """
     GET /api/v1/missions/
     List all available missions for the player
+
+    Without parameters the whole catalog is returned grouped into
+    available/active/completed. With ?status=available|active|completed
+    only that bucket is returned, cursor-paginated, and only one page of
+    rows is loaded.
     """
     permission_classes = [IsAuthenticated]
 
+    # ?status= bucket -> keyset ordering
+    BUCKET_ORDERING = {
+        'available': ('required_level', 'id'),
+        'active': ('-started_at', 'id'),
+        'completed': ('-completed_at', 'id'),
+    }
+
+    # Clients poll this; an unchanged list costs a 304 with no queries
+    # beyond the ETag's own
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=_missions_etag))
     def get(self, request):
-        player = get_object_or_404(Player, user=request.user)
-
-        # Get all active missions
-        all_missions = Mission.objects.filter(is_active=True)
+        player = _request_player(request)
+
+        bucket = request.query_params.get('status')
+        if bucket is not None:
+            if bucket not in self.BUCKET_ORDERING:
+                return Response(
+                    {'error': f"status must be one of: {', '.join(self.BUCKET_ORDERING)}"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            return self._get_bucket(request, player, bucket)
+
+        # Get all active missions: only the ids come from the database, the
+        # rows themselves (with giver NPC and acts) from the catalog cache
+        mission_ids = list(Mission.objects.filter(is_active=True).values_list('id', flat=True))
+        cached_missions = MissionCache.get_many(mission_ids)
+        all_missions = [cached_missions[mission_id] for mission_id in mission_ids]
+
+        # Load the player's missions in one query rather than one per mission.
+        # Rows arrive in PlayerMission's default ordering and setdefault keeps
+        # the first per mission, matching the old per-mission .first().
+        player_missions = {}
+        for pm in PlayerMission.objects.filter(player=player, mission__is_active=True):
+            player_missions.setdefault(pm.mission_id, pm)
+
+        # Evaluate start requirements for the whole catalog up front
+        eligibility = Mission.bulk_can_player_start(player, all_missions)
 
         # Categorize missions
         available = []
@@ -33,51 +204,25 @@ class MissionListView(APIView):
 
         for mission in all_missions:
             # Check player's relationship with this mission
-            player_mission = PlayerMission.objects.filter(
-                player=player,
-                mission=mission
-            ).first()
-
-            mission_data = {
-                'id': str(mission.id),
-                'key': mission.key,
-                'name': mission.name,
-                'type': mission.mission_type,
-                'difficulty': mission.difficulty,
-                'required_level': mission.required_level,
-                'is_public': mission.is_public,
-                'hook_title': mission.hook_title,
-                'given_by': mission.given_by_npc.name if mission.given_by_npc else None,
-                'time_limit': mission.time_limit,
-                'is_repeatable': mission.is_repeatable,
-            }
-
+            player_mission = player_missions.get(mission.id)
             if player_mission:
+                # Reuse the loaded mission instead of a lazy fetch per row
+                player_mission.mission = mission
+
                 if player_mission.status in ['active', 'in_progress']:
-                    mission_data['player_mission_id'] = str(player_mission.id)
-                    mission_data['status'] = player_mission.status
-                    mission_data['progress'] = player_mission.get_progress_summary()
-                    active.append(mission_data)
-                elif player_mission.status == 'completed':
-                    mission_data['completed_at'] = player_mission.completed_at
-                    mission_data['success_level'] = player_mission.success_level
-                    completed.append(mission_data)
-                else:
-                    # Check if available
-                    can_start, message = mission.can_player_start(player)
-                    if can_start:
-                        mission_data['can_start'] = True
-                        available.append(mission_data)
-                    else:
-                        mission_data['can_start'] = False
-                        mission_data['requirement_message'] = message
-            else:
-                # New mission - check if available
-                can_start, message = mission.can_player_start(player)
-                mission_data['can_start'] = can_start
-                mission_data['requirement_message'] = message if not can_start else None
-                if can_start:
-                    available.append(mission_data)
+                    active.append(_active_row(player_mission))
+                    continue
+                if player_mission.status == 'completed':
+                    completed.append(_completed_row(player_mission))
+                    continue
+
+            # New, failed or abandoned mission - check if available
+            can_start, message = eligibility[mission.id]
+            if can_start:
+                mission_data = _mission_row(mission)
+                mission_data['can_start'] = True
+                mission_data['requirement_message'] = None
+                available.append(mission_data)
 
         return Response({
             'available': available,
@@ -85,6 +230,56 @@ class MissionListView(APIView):
             'completed': completed,
         })
 
+    def _get_bucket(self, request, player, bucket):
+        """One cursor page of a single bucket"""
+        paginator = MissionCursorPagination()
+        paginator.ordering = self.BUCKET_ORDERING[bucket]
+
+        if bucket == 'available':
+            # Rule out in the database what can be: inactive and over-level
+            # missions, and, as in the full list, those whose latest player
+            # row puts them in the active or completed bucket. The remaining
+            # checks (squad, cooldown, prerequisites, items) run on the page,
+            # so a page can hold fewer than page_size rows; follow 'next'
+            # until it is null.
+            latest_status = PlayerMission.objects.filter(
+                player=player, mission=OuterRef('pk')
+            ).order_by(*PlayerMission._meta.ordering).values('status')[:1]
+            queryset = (
+                Mission.objects.filter(is_active=True, required_level__lte=player.level)
+                .annotate(latest_status=Subquery(latest_status))
+                .filter(
+                    Q(latest_status__isnull=True)
+                    | ~Q(latest_status__in=['active', 'in_progress', 'completed'])
+                )
+                .only('id', 'required_level')
+            )
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            cached_missions = MissionCache.get_many([mission.id for mission in page])
+            missions = [cached_missions[mission.id] for mission in page]
+            eligibility = Mission.bulk_can_player_start(player, missions)
+            rows = []
+            for mission in missions:
+                if eligibility[mission.id][0]:
+                    mission_data = _mission_row(mission)
+                    mission_data['can_start'] = True
+                    mission_data['requirement_message'] = None
+                    rows.append(mission_data)
+        else:
+            statuses = ['active', 'in_progress'] if bucket == 'active' else ['completed']
+            queryset = PlayerMission.objects.filter(
+                player=player, status__in=statuses, mission__is_active=True
+            ).select_related('mission__given_by_npc').only(*PLAYER_MISSION_ROW_FIELDS)
+            if bucket == 'active':
+                queryset = queryset.prefetch_related(
+                    Prefetch('mission__acts', queryset=MissionAct.objects.defer('description'))
+                )
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            to_row = _active_row if bucket == 'active' else _completed_row
+            rows = [to_row(player_mission) for player_mission in page]
+
+        return paginator.get_paginated_response(rows)
+
 
 class MissionDetailView(APIView):
     """
@@ -93,9 +288,15 @@ class MissionDetailView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(cache_control(private=True, no_cache=True))
+    @method_decorator(condition(etag_func=_missions_etag))
     def get(self, request, mission_key):
-        player = get_object_or_404(Player, user=request.user)
-        mission = get_object_or_404(Mission, key=mission_key, is_active=True)
+        player = _request_player(request)
+        mission = get_object_or_404(
+            Mission.objects.select_related('given_by_npc').prefetch_related('acts'),
+            key=mission_key,
+            is_active=True
+        )
 
         # Get player's instance of this mission if it exists
         player_mission = PlayerMission.objects.filter(
@@ -107,7 +308,7 @@ class MissionDetailView(APIView):
         can_start, requirement_message = mission.can_player_start(player)
 
         mission_data = {
-            'id': str(mission.id),
+            'id': mission.id,
             'key': mission.key,
             'name': mission.name,
             'type': mission.mission_type,
@@ -157,44 +358,18 @@ class MissionDetailView(APIView):
         if player_mission and player_mission.status in ['active', 'in_progress']:
             mission_data['player_progress'] = player_mission.get_progress_summary()
 
-            # Show current act structure
-            current_act = player_mission.current_act
-            acts = []
-
-            if current_act >= 1:
-                acts.append({
-                    'act': 1,
-                    'title': mission.act1_title,
-                    'description': mission.act1_description,
-                    'objectives': self._get_objectives_with_status(
-                        mission.act1_objectives,
-                        player_mission.objectives_completed
-                    ),
-                })
-
-            if current_act >= 2:
-                acts.append({
-                    'act': 2,
-                    'title': mission.act2_title,
-                    'description': mission.act2_description,
-                    'objectives': self._get_objectives_with_status(
-                        mission.act2_objectives,
-                        player_mission.objectives_completed
-                    ),
-                })
-
-            if current_act >= 3:
-                acts.append({
-                    'act': 3,
-                    'title': mission.act3_title,
-                    'description': mission.act3_description,
-                    'objectives': self._get_objectives_with_status(
-                        mission.act3_objectives,
-                        player_mission.objectives_completed
-                    ),
-                })
-
-            mission_data['acts'] = acts
+            # Show every act the player has reached
+            completed = player_mission.objectives_completed
+            mission_data['acts'] = [
+                {
+                    'act': act.act_number,
+                    'title': act.title,
+                    'description': act.description,
+                    'objectives': self._get_objectives_with_status(act.objectives, completed),
+                }
+                for act in mission.acts.all()
+                if act.act_number <= player_mission.current_act
+            ]
 
         # If completed, show conclusion
         if player_mission and player_mission.status == 'completed':
@@ -210,14 +385,15 @@ class MissionDetailView(APIView):
         return Response(mission_data)
 
     def _get_objectives_with_status(self, objectives, completed_dict):
-        """Add completion status to objectives"""
-        return [
-            {
-                **obj,
-                'completed': completed_dict.get(obj['key'], False)
-            }
-            for obj in objectives
-        ]
+        """
+        Add completion status to objectives
+
+        Marks the dicts in place: they belong to act rows loaded for this
+        request only (not the shared catalog cache), so no copy is needed.
+        """
+        for obj in objectives:
+            obj['completed'] = completed_dict.get(obj['key'], False)
+        return objectives
 
 
 class MissionAcceptView(APIView):
@@ -228,62 +404,94 @@ class MissionAcceptView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, mission_key):
-        player = get_object_or_404(Player, user=request.user)
-        mission = get_object_or_404(Mission, key=mission_key, is_active=True)
-
-        # Check if player already has this mission
-        existing = PlayerMission.objects.filter(
-            player=player,
-            mission=mission,
-            status__in=['active', 'in_progress']
-        ).first()
-
-        if existing:
-            return Response(
-                {'error': 'Mission already in progress'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # Check if player can start
-        can_start, message = mission.can_player_start(player)
-        if not can_start:
-            return Response(
-                {'error': message},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # Create player mission instance
-        player_mission = PlayerMission.objects.create(
-            player=player,
-            mission=mission,
-            status='available'
+        mission = get_object_or_404(
+            Mission.objects.prefetch_related('acts'),
+            key=mission_key,
+            is_active=True
         )
 
-        # Accept the mission
-        success, message = player_mission.accept()
+        try:
+            with transaction.atomic():
+                # Lock the player row so concurrent accepts run one at a time
+                player = get_object_or_404(Player.objects.select_for_update(), user=request.user)
+
+                # Check if player already has this mission (SELECT 1 ... LIMIT 1)
+                if PlayerMission.objects.filter(
+                    player=player,
+                    mission=mission,
+                    status__in=['active', 'in_progress']
+                ).exists():
+                    return Response(
+                        {'error': 'Mission already in progress'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+                # Check if player can start
+                can_start, message = mission.can_player_start(player)
+                if not can_start:
+                    return Response(
+                        {'error': message},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+                # Build the instance and only write it once acceptance succeeds
+                player_mission = PlayerMission(player=player, mission=mission, status='available')
+                success, message = player_mission.accept_inplace()
+                if success:
+                    player_mission.save()
+                    player_mission.consume_required_items()
+        except IntegrityError:
+            # The unique constraint on running missions caught a concurrent accept
+            success, message = False, 'Mission already in progress'
 
         if success:
+            act1 = mission.get_act(1)
             return Response({
                 'message': message,
-                'player_mission_id': str(player_mission.id),
+                'player_mission_id': player_mission.id,
                 'hook': {
                     'title': mission.hook_title,
                     'description': mission.hook_description,
                 },
                 'act1': {
-                    'title': mission.act1_title,
-                    'description': mission.act1_description,
-                    'objectives': mission.act1_objectives,
-                }
+                    'title': act1.title,
+                    'description': act1.description,
+                    'objectives': act1.objectives,
+                } if act1 else None
             })
         else:
-            player_mission.delete()
             return Response(
                 {'error': message},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
 
+def _objective_completed_data(player_mission, message):
+    """Response body for a completed objective"""
+    response_data = {
+        'message': message,
+        'progress': player_mission.get_progress_summary(),
+    }
+
+    # If mission completed, include conclusion
+    if player_mission.status == 'completed':
+        mission = player_mission.mission
+        if player_mission.success_level == 'full':
+            response_data['conclusion'] = mission.conclusion_success
+        elif player_mission.success_level == 'partial':
+            response_data['conclusion'] = mission.conclusion_partial
+
+        # Include rewards if public mission
+        if mission.is_public:
+            response_data['rewards'] = {
+                'xp': player_mission.xp_awarded,
+                'currency': player_mission.currency_awarded,
+                'items': player_mission.items_awarded,
+            }
+
+    return response_data
+
+
 class MissionObjectiveCompleteView(APIView):
     """
     POST /api/v1/player-missions/<id>/objectives/<objective_key>/complete/
@@ -292,7 +500,7 @@ class MissionObjectiveCompleteView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, player_mission_id, objective_key):
-        player = get_object_or_404(Player, user=request.user)
+        player = _request_player(request)
         player_mission = get_object_or_404(
             PlayerMission,
             id=player_mission_id,
@@ -311,28 +519,7 @@ class MissionObjectiveCompleteView(APIView):
         success, message = player_mission.complete_objective(objective_key)
 
         if success:
-            response_data = {
-                'message': message,
-                'progress': player_mission.get_progress_summary(),
-            }
-
-            # If mission completed, include conclusion
-            if player_mission.status == 'completed':
-                mission = player_mission.mission
-                if player_mission.success_level == 'full':
-                    response_data['conclusion'] = mission.conclusion_success
-                elif player_mission.success_level == 'partial':
-                    response_data['conclusion'] = mission.conclusion_partial
-
-                # Include rewards if public mission
-                if mission.is_public:
-                    response_data['rewards'] = {
-                        'xp': player_mission.xp_awarded,
-                        'currency': player_mission.currency_awarded,
-                        'items': player_mission.items_awarded,
-                    }
-
-            return Response(response_data)
+            return Response(_objective_completed_data(player_mission, message))
         else:
             return Response(
                 {'error': message},
@@ -340,6 +527,72 @@ class MissionObjectiveCompleteView(APIView):
             )
 
 
+class MissionObjectiveBatchCompleteView(APIView):
+    """
+    POST /api/v1/missions/batch/
+    Complete several mission objectives in one request
+
+    Body: a list of {"player_mission_id": ..., "objective_key": ...}.
+    Every player mission involved is loaded (and locked) in one query and
+    all completions run in one transaction. Returns one result per entry,
+    in order: {"ok": true, "message", "progress", ...} or
+    {"ok": false, "error"}.
+    """
+    permission_classes = [IsAuthenticated]
+    MAX_BATCH_SIZE = 50
+
+    def post(self, request):
+        player = _request_player(request)
+        entries = request.data
+
+        if not isinstance(entries, list) or not entries:
+            return Response(
+                {'error': 'Expected a non-empty list of objectives'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(entries) > self.MAX_BATCH_SIZE:
+            return Response(
+                {'error': f'At most {self.MAX_BATCH_SIZE} objectives per batch'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            entries = [
+                (uuid.UUID(str(entry['player_mission_id'])), str(entry['objective_key']))
+                for entry in entries
+            ]
+        except (TypeError, KeyError, ValueError):
+            return Response(
+                {'error': 'Each entry needs a player_mission_id and an objective_key'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = []
+        with transaction.atomic():
+            player_missions = {
+                pm.id: pm
+                for pm in PlayerMission.objects.select_for_update(of=('self',))
+                .filter(id__in={pm_id for pm_id, _ in entries}, player=player)
+                .select_related('mission').prefetch_related('mission__acts')
+            }
+            for player_mission in player_missions.values():
+                player_mission.check_time_limit()
+
+            for player_mission_id, objective_key in entries:
+                player_mission = player_missions.get(player_mission_id)
+                if player_mission is None:
+                    results.append({'ok': False, 'error': 'Player mission not found'})
+                    continue
+
+                success, message = player_mission.complete_objective(objective_key)
+                if success:
+                    results.append({'ok': True, **_objective_completed_data(player_mission, message)})
+                else:
+                    results.append({'ok': False, 'error': message})
+
+        return Response(results)
+
+
 class MissionAbandonView(APIView):
     """
     POST /api/v1/player-missions/<id>/abandon/
@@ -348,7 +601,7 @@ class MissionAbandonView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, player_mission_id):
-        player = get_object_or_404(Player, user=request.user)
+        player = _request_player(request)
         player_mission = get_object_or_404(
             PlayerMission,
             id=player_mission_id,
@@ -374,7 +627,7 @@ class MissionEventTriggerView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, player_mission_id, event_key):
-        player = get_object_or_404(Player, user=request.user)
+        player = _request_player(request)
         player_mission = get_object_or_404(
             PlayerMission,
             id=player_mission_id,
@@ -382,7 +635,6 @@ class MissionEventTriggerView(APIView):
         )
 
         # Get the event
-        from game.models import MissionEvent
         event = get_object_or_404(
             MissionEvent,
             mission=player_mission.mission,
@@ -424,7 +676,7 @@ class MissionChoiceView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, player_mission_id, event_key):
-        player = get_object_or_404(Player, user=request.user)
+        player = _request_player(request)
         player_mission = get_object_or_404(
             PlayerMission,
             id=player_mission_id,
@@ -440,7 +692,6 @@ class MissionChoiceView(APIView):
             )
 
         # Get the event
-        from game.models import MissionEvent
         event = get_object_or_404(
             MissionEvent,
             mission=player_mission.mission,
@@ -448,11 +699,7 @@ class MissionChoiceView(APIView):
         )
 
         # Find the choice and its outcome
-        choice_data = None
-        for choice in event.choices:
-            if choice['text'] == choice_text:
-                choice_data = choice
-                break
+        choice_data = event.choices_by_text.get(choice_text) if isinstance(choice_text, str) else None
 
         if not choice_data:
             return Response(
@@ -483,68 +730,83 @@ class MissionCreatePrivateView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        player = get_object_or_404(Player, user=request.user)
+        player = _request_player(request)
 
         # Extract mission data from request
         data = request.data
 
         try:
-            # Create the mission
-            mission = Mission.objects.create(
-                key=f"private_{player.id}_{timezone.now().timestamp()}",
-                name=data.get('name'),
-                mission_type=data.get('mission_type', 'custom'),
-                is_public=False,  # Private mission
-                difficulty=data.get('difficulty', 'moderate'),
-                required_level=player.level,  # Set to player's current level
-
-                # Hook
-                hook_title=data.get('hook_title'),
-                hook_description=data.get('hook_description'),
-
-                # Act 1
-                act1_title=data.get('act1_title', 'Setup'),
-                act1_description=data.get('act1_description'),
-                act1_objectives=data.get('act1_objectives', []),
-
-                # Act 2
-                act2_title=data.get('act2_title', 'Confrontation'),
-                act2_description=data.get('act2_description'),
-                act2_objectives=data.get('act2_objectives', []),
-
-                # Act 3
-                act3_title=data.get('act3_title', 'Climax'),
-                act3_description=data.get('act3_description'),
-                act3_objectives=data.get('act3_objectives', []),
-
-                # Conclusion
-                conclusion_success=data.get('conclusion_success'),
-                conclusion_failure=data.get('conclusion_failure', ''),
-                conclusion_partial=data.get('conclusion_partial', ''),
-
-                # No rewards for private missions
-                reward_xp=0,
-                reward_currency=0,
-                reward_items=[],
-
-                # Parameters
-                time_limit=data.get('time_limit'),
-                can_fail=data.get('can_fail', True),
-                can_abandon=data.get('can_abandon', True),
-                is_repeatable=False,
-            )
+            with transaction.atomic():
+                mission = self._create_mission(player, data)
+
+                # Insert any events in one statement
+                events = [
+                    MissionEvent(mission=mission, **{
+                        field: event[field] for field in MISSION_EVENT_FIELDS if field in event
+                    })
+                    for event in data.get('events') or []
+                ]
+                MissionEvent.objects.bulk_create(events, batch_size=500)
 
             return Response({
                 'message': 'Private mission created',
                 'mission': {
-                    'id': str(mission.id),
+                    'id': mission.id,
                     'key': mission.key,
                     'name': mission.name,
+                    'events': len(events),
                 }
             }, status=status.HTTP_201_CREATED)
 
-        except Exception as e:
+        except (AttributeError, KeyError, TypeError, ValueError, ValidationError, IntegrityError, DataError) as e:
+            # Malformed or invalid mission data; database outages propagate
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+
+    def _create_mission(self, player, data):
+        """Create the private mission (and its acts) from request data"""
+        return Mission.create_with_acts(
+            key=f"private_{player.id}_{uuid.uuid4().hex[:12]}",
+            name=data.get('name'),
+            mission_type=data.get('mission_type', 'custom'),
+            is_public=False,  # Private mission
+            difficulty=data.get('difficulty', 'moderate'),
+            required_level=player.level,  # Set to player's current level
+
+            # Hook
+            hook_title=data.get('hook_title'),
+            hook_description=data.get('hook_description'),
+
+            # Act 1
+            act1_title=data.get('act1_title', 'Setup'),
+            act1_description=data.get('act1_description'),
+            act1_objectives=data.get('act1_objectives', []),
+
+            # Act 2
+            act2_title=data.get('act2_title', 'Confrontation'),
+            act2_description=data.get('act2_description'),
+            act2_objectives=data.get('act2_objectives', []),
+
+            # Act 3
+            act3_title=data.get('act3_title', 'Climax'),
+            act3_description=data.get('act3_description'),
+            act3_objectives=data.get('act3_objectives', []),
+
+            # Conclusion
+            conclusion_success=data.get('conclusion_success'),
+            conclusion_failure=data.get('conclusion_failure', ''),
+            conclusion_partial=data.get('conclusion_partial', ''),
+
+            # No rewards for private missions
+            reward_xp=0,
+            reward_currency=0,
+            reward_items=[],
+
+            # Parameters
+            time_limit=data.get('time_limit'),
+            can_fail=data.get('can_fail', True),
+            can_abandon=data.get('can_abandon', True),
+            is_repeatable=False,
+        )
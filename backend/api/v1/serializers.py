@@ -2,12 +2,161 @@
 API Serializers
 
 Converts model instances to JSON and vice versa.
+
+Serializers that read across relations provide setup_eager_loading(queryset);
+views pass their querysets through it so many=True serialization does not
+fetch each related row separately.
 """
+import copy
+import inspect
+import operator
+
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from game.models import Player, Room, Exit, Item, NPC, Quest, Zone, PlayerQuest, Squad, SquadMember
+from game.models.squad import RANK_ABBREVIATIONS, WEAPON_SHORT_NAMES
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class
+
+    ModelSerializer.get_fields() introspects the model and deep-copies the
+    declared fields every time a serializer is instantiated, which for
+    nested many=True output is once per parent row. The first result is
+    kept per class and each instance gets shallow copies, which bind to
+    it without touching the cached originals.
+
+    Only for serializers whose fields don't depend on the instance or
+    context. Nested serializers share their child between copies; these
+    are read-only and don't use the context.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        fields = CachedFieldsMixin._fields_cache.get(type(self))
+        if fields is None:
+            fields = CachedFieldsMixin._fields_cache[type(self)] = super().get_fields()
+        return {name: copy.copy(field) for name, field in fields.items()}
+
+
+# Field types whose to_representation() returns model column values as-is
+_PASSTHROUGH_FIELDS = (
+    serializers.CharField, serializers.ChoiceField, serializers.IntegerField,
+    serializers.BooleanField, serializers.JSONField,
+)
+
+
+def _render_field(field, instance, ret):
+    """One step of Serializer.to_representation(), for the general case"""
+    try:
+        attribute = field.get_attribute(instance)
+    except SkipField:
+        return
+    check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+    ret[field.field_name] = None if check_for_none is None else field.to_representation(attribute)
+
+
+class CompiledRepresentationMixin:
+    """
+    Render instances with a to_representation generated per class
+
+    The first time a class renders, its readable fields are turned into a
+    straight-line function: model columns are read directly (and passed
+    through untouched when the field type allows it), dotted sources that
+    end in a column go through operator.attrgetter, properties are read
+    directly and converted by their field, and anything else (relations,
+    methods, nested serializers) takes DRF's own per-field path. Output is
+    identical to Serializer.to_representation().
+    """
 
-
-class PlayerSerializer(serializers.ModelSerializer):
+    def to_representation(self, instance):
+        render = type(self).__dict__.get('_compiled_representation')
+        if render is None:
+            render = self._compile_representation()
+            type(self)._compiled_representation = render
+        return render(self, instance)
+
+    def _compile_representation(self):
+        model = self.Meta.model
+        namespace = {'_render_field': _render_field, 'ObjectDoesNotExist': ObjectDoesNotExist}
+        lines = ['def to_representation(self, instance):', '    fields = self.fields', '    ret = {}']
+        for field in self._readable_fields:
+            name = field.field_name
+            source_attrs = field.source_attrs
+            model_field = _source_model_field(model, source_attrs)
+            column = model_field is not None and model_field.concrete and not model_field.is_relation
+            passthrough = column and isinstance(field, _PASSTHROUGH_FIELDS) and not getattr(field, 'binary', False)
+            convert = f'None if value is None else fields[{name!r}].to_representation(value)'
+
+            if len(source_attrs) > 1 and column:
+                # Dotted source through forward relations: one C-level
+                # attrgetter; a missing link (None, DoesNotExist) falls
+                # back to DRF, which decides between None and skipping
+                getter = f'_get_{len(namespace)}'
+                namespace[getter] = operator.attrgetter(field.source)
+                lines += [
+                    '    try:',
+                    f'        value = {getter}(instance)',
+                    '    except (AttributeError, ObjectDoesNotExist):',
+                    f'        _render_field(fields[{name!r}], instance, ret)',
+                    '    else:',
+                    f'        ret[{name!r}] = {"value" if passthrough else convert}',
+                ]
+            elif len(source_attrs) == 1 and passthrough:
+                lines.append(f'    ret[{name!r}] = instance.{source_attrs[0]}')
+            elif len(source_attrs) == 1 and (column or isinstance(
+                    inspect.getattr_static(model, source_attrs[0], None), (property, cached_property))):
+                lines.append(f'    value = instance.{source_attrs[0]}')
+                lines.append(f'    ret[{name!r}] = {convert}')
+            else:
+                lines.append(f'    _render_field(fields[{name!r}], instance, ret)')
+        lines.append('    return ret')
+
+        exec('\n'.join(lines), namespace)
+        return namespace['to_representation']
+
+
+def _source_model_field(model, source_attrs):
+    """
+    The model field a source names, following forward relations for
+    dotted sources; None if any step isn't a model field
+    """
+    for attr in source_attrs[:-1]:
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+        if not (field.concrete and (field.many_to_one or field.one_to_one)):
+            return None
+        model = field.related_model
+    try:
+        return model._meta.get_field(source_attrs[-1]) if source_attrs else None
+    except FieldDoesNotExist:
+        return None
+
+
+class ChoiceDisplayField(serializers.ReadOnlyField):
+    """
+    Label of a choice column, as get_FOO_display() would return it
+
+    Takes the value-to-label dict up front; the model method rebuilds it
+    from the field's choices on every call.
+    """
+
+    def __init__(self, labels, **kwargs):
+        self.labels = labels
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return self.labels.get(value, value)
+
+
+class PlayerSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Player model"""
     username = serializers.CharField(source='user.username', read_only=True)
 
@@ -21,8 +170,13 @@ class PlayerSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the relations this serializer reads (user.username)"""
+        return queryset.select_related('user')
+
 
-class ExitSerializer(serializers.ModelSerializer):
+class ExitSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Exit model"""
     destination_name = serializers.CharField(source='destination.name', read_only=True)
 
@@ -34,7 +188,7 @@ class ExitSerializer(serializers.ModelSerializer):
         ]
 
 
-class RoomSerializer(serializers.ModelSerializer):
+class RoomSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Room model"""
     zone_name = serializers.CharField(source='zone.name', read_only=True)
     exits = ExitSerializer(many=True, source='exits_out', read_only=True)
@@ -47,8 +201,15 @@ class RoomSerializer(serializers.ModelSerializer):
             'is_dark', 'is_safe', 'is_private', 'exits', 'player_count'
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the relations this serializer reads (zone, exits and their destinations)"""
+        return queryset.select_related('zone').prefetch_related(
+            Prefetch('exits_out', queryset=Exit.objects.select_related('destination'))
+        )
+
 
-class ItemSerializer(serializers.ModelSerializer):
+class ItemSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Item model"""
 
     class Meta:
@@ -60,7 +221,7 @@ class ItemSerializer(serializers.ModelSerializer):
         ]
 
 
-class NPCSerializer(serializers.ModelSerializer):
+class NPCSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for NPC model"""
     location_name = serializers.CharField(source='location.name', read_only=True)
 
@@ -72,8 +233,13 @@ class NPCSerializer(serializers.ModelSerializer):
             'is_alive', 'sells_items', 'buys_items', 'greeting_message'
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the relations this serializer reads (location.name)"""
+        return queryset.select_related('location')
 
-class QuestSerializer(serializers.ModelSerializer):
+
+class QuestSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Quest model"""
     quest_giver_name = serializers.CharField(source='quest_giver.name', read_only=True)
 
@@ -85,8 +251,13 @@ class QuestSerializer(serializers.ModelSerializer):
             'experience_reward', 'currency_reward', 'is_repeatable'
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the relations this serializer reads (quest_giver.name)"""
+        return queryset.select_related('quest_giver')
+
 
-class ZoneSerializer(serializers.ModelSerializer):
+class ZoneSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Zone model"""
     room_count = serializers.IntegerField(read_only=True)
 
@@ -100,21 +271,21 @@ class ZoneSerializer(serializers.ModelSerializer):
 
 # Character Sheet Serializers
 
-class EquippedItemSerializer(serializers.ModelSerializer):
+class EquippedItemSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for equipped items on the character sheet"""
     class Meta:
         model = Item
         fields = ['name', 'description', 'item_type', 'equipment_slot', 'stat_modifiers']
 
 
-class InventoryItemSerializer(serializers.ModelSerializer):
+class InventoryItemSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for inventory items on the character sheet"""
     class Meta:
         model = Item
         fields = ['name', 'description', 'item_type']
 
 
-class PlayerQuestSerializer(serializers.ModelSerializer):
+class PlayerQuestSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for active quests on the character sheet"""
     title = serializers.CharField(source='quest.title', read_only=True)
     description = serializers.CharField(source='quest.description', read_only=True)
@@ -124,14 +295,20 @@ class PlayerQuestSerializer(serializers.ModelSerializer):
         fields = ['title', 'description', 'status', 'progress']
 
 
-class SquadMemberSerializer(serializers.ModelSerializer):
+# Choice labels, built once rather than per get_FOO_display() call
+_FIRE_TEAM_LABELS = dict(SquadMember._meta.get_field('fire_team').flatchoices)
+_ROLE_LABELS = dict(SquadMember._meta.get_field('role').flatchoices)
+_SECONDARY_DUTY_LABELS = dict(SquadMember._meta.get_field('secondary_duty').flatchoices)
+
+
+class SquadMemberSerializer(CompiledRepresentationMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for squad members"""
     rank_display = serializers.CharField(read_only=True)
     weapon_display = serializers.CharField(read_only=True)
     health_percentage = serializers.FloatField(read_only=True)
-    role_display = serializers.CharField(source='get_role_display', read_only=True)
-    secondary_duty_display = serializers.CharField(source='get_secondary_duty_display', read_only=True)
-    fire_team_display = serializers.CharField(source='get_fire_team_display', read_only=True)
+    role_display = ChoiceDisplayField(_ROLE_LABELS, source='role')
+    secondary_duty_display = ChoiceDisplayField(_SECONDARY_DUTY_LABELS, source='secondary_duty')
+    fire_team_display = ChoiceDisplayField(_FIRE_TEAM_LABELS, source='fire_team')
 
     class Meta:
         model = SquadMember
@@ -146,15 +323,57 @@ class SquadMemberSerializer(serializers.ModelSerializer):
         ]
 
 
-class SquadSerializer(serializers.ModelSerializer):
-    """Serializer for squad data"""
-    squad_leader = SquadMemberSerializer(read_only=True)
-    alpha_team = SquadMemberSerializer(many=True, read_only=True)
-    bravo_team = SquadMemberSerializer(many=True, read_only=True)
+# SquadMemberSerializer's display fields: field -> (source column, labels)
+_SQUAD_MEMBER_DISPLAYS = {
+    'rank_display': ('rank', RANK_ABBREVIATIONS),
+    'weapon_display': ('primary_weapon', WEAPON_SHORT_NAMES),
+    'fire_team_display': ('fire_team', _FIRE_TEAM_LABELS),
+    'role_display': ('role', _ROLE_LABELS),
+    'secondary_duty_display': ('secondary_duty', _SECONDARY_DUTY_LABELS),
+}
+
+# (output field, source column, labels or None), in Meta.fields order
+_SQUAD_MEMBER_ROW = tuple(
+    (field, *_SQUAD_MEMBER_DISPLAYS.get(field, (field, None)))
+    for field in SquadMemberSerializer.Meta.fields
+)
+
+# SquadMember columns a roster row is built from
+SQUAD_MEMBER_COLUMNS = tuple(
+    field for field in SquadMemberSerializer.Meta.fields if field not in _SQUAD_MEMBER_DISPLAYS
+)
+
+
+def squad_member_row(values):
+    """
+    SquadMemberSerializer's output for a dict of SQUAD_MEMBER_COLUMNS
+
+    Builds the display fields from the raw values with the same label
+    tables, so members can be read with values() instead of as model
+    instances. The row follows SquadMemberSerializer.Meta.fields.
+    """
+    row = {}
+    for field, column, labels in _SQUAD_MEMBER_ROW:
+        value = values[column]
+        row[field] = value if labels is None else labels.get(value, value)
+    return row
+
+
+class SquadSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for squad data
+
+    The members are read once per squad with values() and turned into
+    roster rows directly; the leader, fire teams and member statistics are
+    all derived from those rows.
+    """
+    squad_leader = serializers.SerializerMethodField()
+    alpha_team = serializers.SerializerMethodField()
+    bravo_team = serializers.SerializerMethodField()
     alive_members_count = serializers.SerializerMethodField()
     total_members = serializers.SerializerMethodField()
-    casualty_count = serializers.IntegerField(read_only=True)
-    average_health = serializers.FloatField(read_only=True)
+    casualty_count = serializers.SerializerMethodField()
+    average_health = serializers.SerializerMethodField()
 
     class Meta:
         model = Squad
@@ -168,55 +387,126 @@ class SquadSerializer(serializers.ModelSerializer):
             'average_health'
         ]
 
+    def to_representation(self, instance):
+        # Read by the get_* methods below while this instance renders
+        self._members = [squad_member_row(values) for values in instance.members.values(*SQUAD_MEMBER_COLUMNS)]
+        return super().to_representation(instance)
+
+    def get_squad_leader(self, obj):
+        return next((m for m in self._members if m['role'] == 'squad_leader'), None)
+
+    def get_alpha_team(self, obj):
+        return [m for m in self._members if m['fire_team'] == 'alpha']
+
+    def get_bravo_team(self, obj):
+        return [m for m in self._members if m['fire_team'] == 'bravo']
+
     def get_alive_members_count(self, obj):
-        return obj.alive_members.count()
+        return sum(1 for m in self._members if m['is_alive'])
 
     def get_total_members(self, obj):
-        return obj.members.count()
+        return len(self._members)
+
+    def get_casualty_count(self, obj):
+        return sum(1 for m in self._members if not m['is_alive'])
+
+    def get_average_health(self, obj):
+        alive = [m['health_percentage'] for m in self._members if m['is_alive']]
+        return sum(alive) / len(alive) if alive else 0
+
 
+def _length_errors(message):
+    """error_messages reporting every bad-string case with one message"""
+    return dict.fromkeys(('required', 'null', 'invalid', 'blank', 'min_length', 'max_length'), message)
 
-class CharacterSheetSerializer(serializers.ModelSerializer):
+
+class SquadCustomizationSerializer(serializers.ModelSerializer):
+    """
+    Validates and writes squad name/callsign edits
+
+    Values are trimmed and must be 1-100 (name) or 1-50 (callsign)
+    characters; each field reports a single message, which the view
+    returns as its error.
+    """
+    class Meta:
+        model = Squad
+        fields = ['squad_name', 'callsign']
+        extra_kwargs = {
+            'squad_name': {'min_length': 1, 'error_messages': _length_errors('Squad name must be 1-100 characters')},
+            'callsign': {
+                'min_length': 1, 'allow_blank': False,
+                'error_messages': _length_errors('Callsign must be 1-50 characters'),
+            },
+        }
+
+    def update(self, instance, validated_data):
+        """Write only the submitted columns"""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
+
+
+class CharacterSheetSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Comprehensive serializer for the character sheet"""
-    equipped_items = EquippedItemSerializer(many=True, read_only=True, source='items')
-    inventory = InventoryItemSerializer(many=True, read_only=True, source='items')
-    active_quests = PlayerQuestSerializer(many=True, read_only=True, source='quests')
     squad = SquadSerializer(read_only=True)
-    has_squad = serializers.SerializerMethodField()
 
     class Meta:
         model = Player
+        # equipped_items, inventory and active_quests are added in
+        # to_representation from a single pass over the prefetched rows,
+        # has_squad from the rendered squad
         fields = [
             'character_name', 'description', 'level', 'experience',
             'health', 'max_health', 'mana', 'max_mana',
             'strength', 'dexterity', 'intelligence', 'constitution',
-            'currency', 'equipped_items', 'inventory', 'active_quests',
-            'squad', 'has_squad'
+            'currency', 'squad'
         ]
 
-    def get_has_squad(self, obj):
-        """Check if player has a squad"""
-        return hasattr(obj, 'squad')
+    @staticmethod
+    def prefetch_lookups():
+        """
+        Relations to_representation reads, for prefetch_related() or
+        prefetch_related_objects()
+
+        The squad row is fetched (SquadSerializer reads its members); all
+        items are fetched at once and split in Python; only active quests
+        are fetched, with their quest, into active_player_quests.
+        """
+        return (
+            'items',
+            'squad',
+            Prefetch(
+                'quests',
+                queryset=PlayerQuest.objects.filter(status='active').select_related('quest'),
+                to_attr='active_player_quests'
+            ),
+        )
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Prefetch the squad, items and quests the character sheet shows"""
+        return queryset.prefetch_related(*cls.prefetch_lookups())
 
     def to_representation(self, instance):
-        """Customize representation to filter equipped and inventory items."""
+        """Split items into equipped/inventory and keep only active quests."""
         representation = super().to_representation(instance)
 
-        # Filter for equipped items
-        equipped_items = instance.items.filter(is_equipped=True)
-        representation['equipped_items'] = EquippedItemSerializer(equipped_items, many=True).data
+        # The squad field renders None when the player has no squad
+        representation['has_squad'] = representation['squad'] is not None
 
-        # Filter for inventory items (not equipped)
-        inventory_items = instance.items.filter(is_equipped=False)
-        representation['inventory'] = InventoryItemSerializer(inventory_items, many=True).data
+        items = list(instance.items.all())
+        representation['equipped_items'] = EquippedItemSerializer(
+            [item for item in items if item.is_equipped], many=True
+        ).data
+        representation['inventory'] = InventoryItemSerializer(
+            [item for item in items if not item.is_equipped], many=True
+        ).data
 
-        # Filter for active quests
-        active_quests = instance.quests.filter(status='active')
+        active_quests = getattr(instance, 'active_player_quests', None)
+        if active_quests is None:
+            active_quests = instance.quests.filter(status='active').select_related('quest')
         representation['active_quests'] = PlayerQuestSerializer(active_quests, many=True).data
 
-        # Include squad data if exists
-        if hasattr(instance, 'squad'):
-            representation['squad'] = SquadSerializer(instance.squad).data
-        else:
-            representation['squad'] = None
-
         return representation
@@ -3,34 +3,103 @@ Squad Management API Views
 
 Endpoints for managing and customizing squads.
 """
+import logging
 import random
+from collections import namedtuple
+from django.db import transaction
+from django.db.models import Exists
+from django.utils import timezone
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from game.models import Squad, SquadMember
-from .serializers import SquadSerializer, SquadMemberSerializer
+from game.models import Player, Squad, SquadMember
+from game.models.squad import RANK_ABBREVIATIONS
+from api.renderers import orjson_response
+from .serializers import SquadCustomizationSerializer, SquadSerializer, SquadMemberSerializer
+
+logger = logging.getLogger('game')
 
 
 # Sample names for squad member generation
-FIRST_NAMES = [
+FIRST_NAMES = (
     'James', 'Michael', 'Robert', 'John', 'David', 'William', 'Richard', 'Joseph',
     'Thomas', 'Christopher', 'Daniel', 'Matthew', 'Anthony', 'Mark', 'Donald', 'Steven',
     'Andrew', 'Joshua', 'Kenneth', 'Kevin', 'Brian', 'Timothy', 'Ronald', 'Jason',
     'Paul', 'Ryan', 'Eric', 'Jacob', 'Gary', 'Nicholas', 'Jonathan', 'Larry'
-]
+)
 
-LAST_NAMES = [
+LAST_NAMES = (
     'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
     'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson',
     'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Thompson', 'White',
     'Harris', 'Clark', 'Lewis', 'Robinson', 'Walker', 'Young', 'Hall', 'Allen'
-]
+)
 
-CALLSIGNS = [
+CALLSIGNS = (
     'Havoc', 'Reaper', 'Viper', 'Phantom', 'Nomad', 'Hunter', 'Raven',
     'Ghost', 'Shadow', 'Thunder', 'Talon', 'Wolf', 'Eagle', 'Cobra'
-]
+)
+
+# Fire team slots filled under the squad leader, based on Forgotten Ruin lore
+SquadSlot = namedtuple('SquadSlot', 'rank role weapon secondary fire_team')
+
+SQUAD_COMPOSITION = (
+    # Alpha Team
+    SquadSlot('sergeant', 'team_leader', 'm4a1', '', 'alpha'),
+    SquadSlot('specialist', 'automatic_rifleman', 'm249', '', 'alpha'),
+    SquadSlot('specialist', 'grenadier', 'm4a1_m320', '', 'alpha'),
+    SquadSlot('private_first_class', 'rifleman', 'm4a1', 'medic', 'alpha'),
+    # Bravo Team
+    SquadSlot('sergeant', 'team_leader', 'm4a1', 'talker', 'bravo'),
+    SquadSlot('specialist', 'automatic_rifleman', 'm249', '', 'bravo'),
+    SquadSlot('specialist', 'grenadier', 'm4a1_m320', 'engineer', 'bravo'),
+    SquadSlot('private_first_class', 'rifleman', 'm4a1', 'medic', 'bravo'),
+)
+
+# Inclusive stat ranges for generated members: attributes are 1-20,
+# skills 0-100
+LEADER_STAT_RANGES = {
+    'strength': (11, 13), 'dexterity': (11, 13), 'constitution': (11, 13), 'intelligence': (13, 15),
+    'marksmanship': (55, 65), 'melee_combat': (30, 40), 'explosives': (20, 30),
+    'medical': (10, 20), 'engineering': (10, 20), 'tactics': (55, 65),
+}
+
+BASE_STAT_RANGES = {
+    'strength': (8, 12), 'dexterity': (8, 12), 'constitution': (8, 12), 'intelligence': (8, 12),
+    'marksmanship': (45, 55), 'melee_combat': (25, 35), 'explosives': (15, 25),
+    'medical': (5, 15), 'engineering': (5, 15), 'tactics': (25, 35),
+}
+
+ROLE_STAT_RANGES = {
+    # Strength for the LMG, endurance to carry its ammo
+    'automatic_rifleman': {'strength': (10, 14), 'constitution': (10, 13)},
+    'team_leader': {'intelligence': (11, 14), 'tactics': (45, 55), 'marksmanship': (50, 60)},
+}
+
+# Applied after the role ranges, so they win where both set a stat
+DUTY_STAT_RANGES = {
+    'medic': {'medical': (50, 65), 'intelligence': (10, 13)},
+    'engineer': {'engineering': (50, 65), 'explosives': (40, 55), 'intelligence': (10, 13)},
+    'talker': {'intelligence': (12, 15), 'tactics': (40, 55)},
+}
+
+# Each slot's ranges, resolved once
+SLOT_STAT_RANGES = tuple(
+    {**BASE_STAT_RANGES, **ROLE_STAT_RANGES.get(slot.role, {}), **DUTY_STAT_RANGES.get(slot.secondary, {})}
+    for slot in SQUAD_COMPOSITION
+)
+
+
+def _roll_stats(stat_ranges):
+    """One draw per stat from its inclusive range"""
+    randint = random.randint
+    return {stat: randint(low, high) for stat, (low, high) in stat_ranges.items()}
+
+
+# Secondary duties a member can be assigned ('' clears it)
+VALID_DUTIES = frozenset(('', 'medic', 'engineer', 'talker'))
+INVALID_DUTY_ERROR = 'Invalid secondary duty. Must be one of: , medic, engineer, talker'
 
 
 class SquadCustomizationView(APIView):
@@ -52,37 +121,24 @@ class SquadCustomizationView(APIView):
         try:
             player = request.user.player
             squad = player.squad
-        except:
+        except (Player.DoesNotExist, Squad.DoesNotExist):
             return Response(
                 {'error': 'Player or squad not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Update squad name if provided
-        if 'squad_name' in request.data:
-            squad_name = request.data['squad_name'].strip()
-            if len(squad_name) > 0 and len(squad_name) <= 100:
-                squad.squad_name = squad_name
-            else:
-                return Response(
-                    {'error': 'Squad name must be 1-100 characters'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-
-        # Update callsign if provided
-        if 'callsign' in request.data:
-            callsign = request.data['callsign'].strip()
-            if len(callsign) > 0 and len(callsign) <= 50:
-                squad.callsign = callsign
-            else:
-                return Response(
-                    {'error': 'Callsign must be 1-50 characters'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+        serializer = SquadCustomizationSerializer(squad, data=request.data, partial=True)
+        if not serializer.is_valid():
+            # One message, from the first invalid field
+            errors = next(iter(serializer.errors.values()))
+            return Response(
+                {'error': errors[0]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        squad = serializer.save()
 
-        squad.save()
         serializer = SquadSerializer(squad)
-        return Response(serializer.data)
+        return orjson_response(serializer.data)
 
 
 class SquadMemberCustomizationView(APIView):
@@ -103,19 +159,23 @@ class SquadMemberCustomizationView(APIView):
         """
         try:
             player = request.user.player
-            squad = player.squad
-            member = squad.members.get(id=member_id)
-        except:
+            # The response serializes the whole member, so all its columns
+            # are needed; the squad row is not, so join it instead
+            member = SquadMember.objects.get(id=member_id, squad__player=player)
+        except (Player.DoesNotExist, SquadMember.DoesNotExist):
             return Response(
                 {'error': 'Squad member not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        changed = []
+
         # Update name if provided
         if 'name' in request.data:
             name = request.data['name'].strip()
             if len(name) > 0 and len(name) <= 100:
                 member.name = name
+                changed.append('name')
             else:
                 return Response(
                     {'error': 'Name must be 1-100 characters'},
@@ -123,35 +183,49 @@ class SquadMemberCustomizationView(APIView):
                 )
 
         # Update secondary duty if provided
+        duty_holders = None
         if 'secondary_duty' in request.data:
             duty = request.data['secondary_duty'].strip()
 
             # Validate secondary duty
-            valid_duties = ['', 'medic', 'engineer', 'talker']
-            if duty not in valid_duties:
+            if duty not in VALID_DUTIES:
                 return Response(
-                    {'error': f'Invalid secondary duty. Must be one of: {", ".join(valid_duties)}'},
+                    {'error': INVALID_DUTY_ERROR},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Check if duty is already assigned in this fire team
-            if duty and duty != '':
-                existing = squad.members.filter(
+            # Only one member per fire team may hold a duty
+            if duty:
+                duty_holders = SquadMember.objects.filter(
+                    squad_id=member.squad_id,
                     fire_team=member.fire_team,
                     secondary_duty=duty
                 ).exclude(id=member.id)
 
-                if existing.exists():
-                    return Response(
-                        {'error': f'Another member in {member.get_fire_team_display()} already has {duty} duty'},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-
             member.secondary_duty = duty
+            changed.append('secondary_duty')
+
+        if duty_holders is None:
+            if changed:
+                member.save(update_fields=changed + ['updated_at'])
+        else:
+            # Check and write in one UPDATE: it matches no row if another
+            # member of the fire team already has the duty
+            member.updated_at = timezone.now()
+            updated = SquadMember.objects.filter(id=member.id).filter(~Exists(duty_holders)).update(
+                name=member.name,
+                secondary_duty=member.secondary_duty,
+                updated_at=member.updated_at
+            )
+            if not updated:
+                return Response(
+                    {'error': f'Another member in {member.get_fire_team_display()} already has {member.secondary_duty} duty'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            Squad.bump_versions([member.squad_id])
 
-        member.save()
         serializer = SquadMemberSerializer(member)
-        return Response(serializer.data)
+        return orjson_response(serializer.data)
 
 
 class SquadMemberSwapView(APIView):
@@ -172,6 +246,7 @@ class SquadMemberSwapView(APIView):
         """
         try:
             player = request.user.player
+            # Joined in by the token lookup
             squad = player.squad
 
             member1_id = request.data.get('member1_id')
@@ -183,19 +258,32 @@ class SquadMemberSwapView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            member1 = squad.members.get(id=member1_id)
-            member2 = squad.members.get(id=member2_id)
+            # Both members in one query
+            members = {
+                str(member.id): member
+                for member in squad.members.filter(id__in=[member1_id, member2_id])
+                .only('id', 'role', 'fire_team')
+            }
+            member1 = members.get(str(member1_id))
+            member2 = members.get(str(member2_id))
+            if member1 is None or member2 is None:
+                raise SquadMember.DoesNotExist
 
         except SquadMember.DoesNotExist:
             return Response(
                 {'error': 'One or both squad members not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
-        except:
+        except (Player.DoesNotExist, Squad.DoesNotExist):
             return Response(
                 {'error': 'Squad not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'member1_id and member2_id must be member ids'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         # Can't swap Squad Leader
         if member1.role == 'squad_leader' or member2.role == 'squad_leader':
@@ -223,12 +311,18 @@ class SquadMemberSwapView(APIView):
         member1.fire_team = member2.fire_team
         member2.fire_team = member1_team
 
-        member1.save()
-        member2.save()
+        # One UPDATE for both; bulk_update skips auto_now, so stamp updated_at.
+        # The squad's version is bumped in the same transaction, so a cached
+        # character sheet can't miss the swap
+        member1.updated_at = member2.updated_at = timezone.now()
+        with transaction.atomic():
+            SquadMember.objects.bulk_update([member1, member2], ['fire_team', 'updated_at'])
+            Squad.bump_versions([squad.pk])
 
-        # Return updated squad
+        # Return updated squad; only members changed, and the serializer
+        # reads those fresh
         serializer = SquadSerializer(squad)
-        return Response(serializer.data)
+        return orjson_response(serializer.data)
 
 
 class SquadGenerationView(APIView):
@@ -251,18 +345,12 @@ class SquadGenerationView(APIView):
         """
         try:
             player = request.user.player
-        except:
+        except Player.DoesNotExist:
             return Response(
                 {'error': 'Player not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Delete existing squad if it exists
-        if hasattr(player, 'squad') and player.squad:
-            old_squad_name = player.squad.squad_name
-            player.squad.delete()
-            print(f"Deleted old squad: {old_squad_name}")
-
         # Get custom names or use defaults
         squad_name = request.data.get('squad_name', '').strip()
         if not squad_name:
@@ -272,172 +360,58 @@ class SquadGenerationView(APIView):
         if not callsign:
             callsign = random.choice(CALLSIGNS)
 
-        # Create new squad
-        squad = Squad.objects.create(
-            player=player,
-            squad_name=squad_name,
-            callsign=callsign,
-        )
-
         # Generate squad leader (uses player's character name)
         squad_leader_name = player.character_name
-        SquadMember.objects.create(
-            squad=squad,
+        members = [SquadMember(
             name=f"SSG {squad_leader_name}",
             rank='staff_sergeant',
             fire_team='hq',
             role='squad_leader',
             primary_weapon='m4a1',
             secondary_duty='',
-            strength=random.randint(11, 13),
-            dexterity=random.randint(11, 13),
-            constitution=random.randint(11, 13),
-            intelligence=random.randint(13, 15),
-            marksmanship=random.randint(55, 65),
-            melee_combat=random.randint(30, 40),
-            explosives=random.randint(20, 30),
-            medical=random.randint(10, 20),
-            engineering=random.randint(10, 20),
-            tactics=random.randint(55, 65),
-        )
-
-        # Define squad composition based on Forgotten Ruin lore
-        squad_composition = [
-            # Alpha Team
-            {
-                'rank': 'sergeant',
-                'role': 'team_leader',
-                'weapon': 'm4a1',
-                'secondary': '',
-                'fire_team': 'alpha',
-            },
-            {
-                'rank': 'specialist',
-                'role': 'automatic_rifleman',
-                'weapon': 'm249',
-                'secondary': '',
-                'fire_team': 'alpha',
-            },
-            {
-                'rank': 'specialist',
-                'role': 'grenadier',
-                'weapon': 'm4a1_m320',
-                'secondary': '',
-                'fire_team': 'alpha',
-            },
-            {
-                'rank': 'private_first_class',
-                'role': 'rifleman',
-                'weapon': 'm4a1',
-                'secondary': 'medic',
-                'fire_team': 'alpha',
-            },
-            # Bravo Team
-            {
-                'rank': 'sergeant',
-                'role': 'team_leader',
-                'weapon': 'm4a1',
-                'secondary': 'talker',
-                'fire_team': 'bravo',
-            },
-            {
-                'rank': 'specialist',
-                'role': 'automatic_rifleman',
-                'weapon': 'm249',
-                'secondary': '',
-                'fire_team': 'bravo',
-            },
-            {
-                'rank': 'specialist',
-                'role': 'grenadier',
-                'weapon': 'm4a1_m320',
-                'secondary': 'engineer',
-                'fire_team': 'bravo',
-            },
-            {
-                'rank': 'private_first_class',
-                'role': 'rifleman',
-                'weapon': 'm4a1',
-                'secondary': 'medic',
-                'fire_team': 'bravo',
-            },
-        ]
+            **_roll_stats(LEADER_STAT_RANGES),
+        )]
 
         # Generate all squad members
-        for member_data in squad_composition:
-            # Generate random name
+        for slot, stat_ranges in zip(SQUAD_COMPOSITION, SLOT_STAT_RANGES):
+            # Generate random name with rank prefix
             first_name = random.choice(FIRST_NAMES)
             last_name = random.choice(LAST_NAMES)
+            name = f"{RANK_ABBREVIATIONS[slot.rank]} {first_name} {last_name}"
 
-            # Add rank prefix
-            rank_prefix = {
-                'sergeant': 'SGT',
-                'specialist': 'SPC',
-                'private_first_class': 'PFC',
-            }[member_data['rank']]
-
-            name = f"{rank_prefix} {first_name} {last_name}"
-
-            # Generate base attributes (1-20 range)
-            strength = random.randint(8, 12)
-            dexterity = random.randint(8, 12)
-            constitution = random.randint(8, 12)
-            intelligence = random.randint(8, 12)
-
-            # Generate base skills (0-100 range)
-            marksmanship = random.randint(45, 55)
-            melee = random.randint(25, 35)
-            explosives = random.randint(15, 25)
-            medical = random.randint(5, 15)
-            engineering = random.randint(5, 15)
-            tactics = random.randint(25, 35)
-
-            # Role-based bonuses
-            if member_data['role'] == 'automatic_rifleman':
-                strength = random.randint(10, 14)  # Need strength for LMG
-                constitution = random.randint(10, 13)  # Endurance to carry ammo
-
-            if member_data['role'] == 'team_leader':
-                intelligence = random.randint(11, 14)
-                tactics = random.randint(45, 55)
-                marksmanship = random.randint(50, 60)
-
-            # Secondary duty bonuses
-            if member_data['secondary'] == 'medic':
-                medical = random.randint(50, 65)
-                intelligence = random.randint(10, 13)
-            elif member_data['secondary'] == 'engineer':
-                engineering = random.randint(50, 65)
-                explosives = random.randint(40, 55)
-                intelligence = random.randint(10, 13)
-            elif member_data['secondary'] == 'talker':
-                intelligence = random.randint(12, 15)
-                tactics = random.randint(40, 55)
-
-            # Create the squad member
-            SquadMember.objects.create(
-                squad=squad,
+            # Build the squad member
+            members.append(SquadMember(
                 name=name,
-                rank=member_data['rank'],
-                fire_team=member_data['fire_team'],
-                role=member_data['role'],
-                primary_weapon=member_data['weapon'],
-                secondary_duty=member_data['secondary'],
-                strength=strength,
-                dexterity=dexterity,
-                constitution=constitution,
-                intelligence=intelligence,
-                marksmanship=marksmanship,
-                melee_combat=melee,
-                explosives=explosives,
-                medical=medical,
-                engineering=engineering,
-                tactics=tactics,
+                rank=slot.rank,
+                fire_team=slot.fire_team,
+                role=slot.role,
+                primary_weapon=slot.weapon,
+                secondary_duty=slot.secondary,
+                **_roll_stats(stat_ranges),
+            ))
+
+        # Replace the old squad in one transaction: delete, create, and one
+        # INSERT for all the members
+        with transaction.atomic():
+            # Delete existing squad if it exists
+            if hasattr(player, 'squad') and player.squad:
+                old_squad_name = player.squad.squad_name
+                player.squad.delete()
+                logger.info("Deleted old squad: %s", old_squad_name)
+
+            # Create new squad
+            squad = Squad.objects.create(
+                player=player,
+                squad_name=squad_name,
+                callsign=callsign,
             )
+            for member in members:
+                member.squad = squad
+            SquadMember.objects.bulk_create(members)
 
         # Return the newly created squad
         serializer = SquadSerializer(squad)
-        return Response({
+        return orjson_response({
             'message': f'{squad.squad_name} generated successfully!',
             'squad': serializer.data
         }, status=status.HTTP_201_CREATED)
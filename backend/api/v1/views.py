@@ -3,11 +3,17 @@ API v1 Views
 
 REST API endpoints for game data.
 """
+from django.core.cache import cache
+from django.db.models import Count
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from game.models import Player, Room, Item, NPC, Quest, Zone
+from api.renderers import ORJSONRenderer
 from .serializers import (
     PlayerSerializer, RoomSerializer, ItemSerializer,
     NPCSerializer, QuestSerializer, ZoneSerializer,
@@ -15,6 +21,15 @@ from .serializers import (
 )
 
 
+# Response cache lifetimes (seconds) for the reference-data endpoints,
+# cached with cache_page. It wraps the handler, so DRF's authentication
+# and permission checks still run first; the data is the same for every
+# player. Items, quests and zones rarely change; NPCs die and respawn, so
+# they get the short one.
+SHORT_CACHE_TIMEOUT = 10
+LONG_CACHE_TIMEOUT = 60
+
+
 class PlayerViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for player data
@@ -27,7 +42,7 @@ class PlayerViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         """Return only online players"""
-        return Player.objects.filter(is_online=True)
+        return PlayerSerializer.setup_eager_loading(Player.objects.filter(is_online=True))
 
     @action(detail=False, methods=['get'])
     def me(self, request):
@@ -47,9 +62,10 @@ class PlayerViewSet(viewsets.ReadOnlyModelViewSet):
         """Get current player's inventory"""
         try:
             player = request.user.player
-            items = player.items.all()
-            serializer = ItemSerializer(items, many=True)
-            return Response(serializer.data)
+            # Every ItemSerializer field is a plain column, so values()
+            # rows already have the serialized shape
+            items = player.items.values(*ItemSerializer.Meta.fields)
+            return Response(list(items))
         except Player.DoesNotExist:
             return Response(
                 {'error': 'Player not found'},
@@ -64,7 +80,7 @@ class RoomViewSet(viewsets.ReadOnlyModelViewSet):
     list: Get all rooms (paginated)
     retrieve: Get specific room details
     """
-    queryset = Room.objects.all()
+    queryset = RoomSerializer.setup_eager_loading(Room.objects.all())
     serializer_class = RoomSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -72,11 +88,13 @@ class RoomViewSet(viewsets.ReadOnlyModelViewSet):
     def players(self, request, pk=None):
         """Get players in a specific room"""
         room = self.get_object()
-        players = room.get_players()
+        players = PlayerSerializer.setup_eager_loading(room.get_players())
         serializer = PlayerSerializer(players, many=True)
         return Response(serializer.data)
 
 
+@method_decorator(cache_page(LONG_CACHE_TIMEOUT), name='list')
+@method_decorator(cache_page(LONG_CACHE_TIMEOUT), name='retrieve')
 class ItemViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for item data
@@ -86,40 +104,49 @@ class ItemViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
 
+@method_decorator(cache_page(SHORT_CACHE_TIMEOUT), name='list')
+@method_decorator(cache_page(SHORT_CACHE_TIMEOUT), name='retrieve')
 class NPCViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for NPC data
     """
-    queryset = NPC.objects.filter(is_alive=True)
+    queryset = NPCSerializer.setup_eager_loading(NPC.objects.filter(is_alive=True))
     serializer_class = NPCSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 
+@method_decorator(cache_page(LONG_CACHE_TIMEOUT), name='list')
+@method_decorator(cache_page(LONG_CACHE_TIMEOUT), name='retrieve')
 class QuestViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for quest data
     """
-    queryset = Quest.objects.all()
+    queryset = QuestSerializer.setup_eager_loading(Quest.objects.all())
     serializer_class = QuestSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     @action(detail=False, methods=['get'])
     def available(self, request):
-        """Get quests available to current player"""
+        """Get quests available to current player, paginated like list"""
         try:
             player = request.user.player
-            # Filter quests by level requirement
-            available_quests = Quest.objects.filter(
-                required_level__lte=player.level
-            )
-            serializer = self.get_serializer(available_quests, many=True)
-            return Response(serializer.data)
         except Player.DoesNotExist:
             return Response(
                 {'error': 'Player not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        # Every player of a level sees the same quests, so the serialized
+        # list is cached per level and only the page is cut per request
+        key = 'available_quests:{}'.format(player.level)
+        quests = cache.get(key)
+        if quests is None:
+            queryset = self.get_queryset().filter(required_level__lte=player.level)
+            quests = list(self.get_serializer(queryset, many=True).data)
+            cache.set(key, quests, LONG_CACHE_TIMEOUT)
+
+        return self.get_paginated_response(self.paginate_queryset(quests))
+
 
 class PlayerStatsView(APIView):
     """Get current player statistics"""
@@ -152,14 +179,21 @@ class PlayerStatsView(APIView):
             )
 
 
+@method_decorator(cache_page(LONG_CACHE_TIMEOUT), name='get')
 class ZoneListView(APIView):
     """Get all zones"""
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        zones = Zone.objects.all()
-        serializer = ZoneSerializer(zones, many=True)
-        return Response(serializer.data)
+        # ZoneSerializer's shape straight from values(), with room_count
+        # counted in the same query instead of once per zone. Meta.ordering
+        # doesn't apply to aggregate queries, so order explicitly.
+        zones = (
+            Zone.objects.annotate(room_count=Count('rooms'))
+            .order_by(*Zone._meta.ordering)
+            .values(*ZoneSerializer.Meta.fields)
+        )
+        return Response(list(zones))
 
 
 class CharacterSheetViewSet(viewsets.ReadOnlyModelViewSet):
@@ -168,19 +202,34 @@ class CharacterSheetViewSet(viewsets.ReadOnlyModelViewSet):
     """
     serializer_class = CharacterSheetSerializer
     permission_classes = [permissions.IsAuthenticated]
-    queryset = Player.objects.all()
+    queryset = CharacterSheetSerializer.setup_eager_loading(Player.objects.all())
+
+    # Rendered sheets are keyed on the player and squad versions, so edits
+    # show up at once; the timeout only bounds what the versions don't
+    # cover (e.g. a quest's title being edited)
+    CACHE_TIMEOUT = 300
 
     @action(detail=False, methods=['get'])
     def me(self, request):
         """
         Get the character sheet for the currently authenticated user.
+
+        The rendered JSON is cached and served as-is while the player's
+        and squad's versions are unchanged.
         """
-        try:
-            player = request.user.player
-            serializer = self.get_serializer(player)
-            return Response(serializer.data)
-        except Player.DoesNotExist:
+        versions = Player.objects.filter(user_id=request.user.pk).values_list(
+            'pk', 'version', 'squad__id', 'squad__version'
+        ).first()
+        if versions is None:
             return Response(
                 {'error': 'Player not found for the current user.'},
                 status=status.HTTP_404_NOT_FOUND
             )
+
+        key = 'character_sheet:{}:{}:{}:{}'.format(*versions)
+        content = cache.get(key)
+        if content is None:
+            player = self.get_queryset().get(pk=versions[0])
+            content = ORJSONRenderer().render(self.get_serializer(player).data)
+            cache.set(key, content, self.CACHE_TIMEOUT)
+        return HttpResponse(content, content_type='application/json')
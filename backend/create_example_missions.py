@@ -7,12 +7,6 @@ Creates example public and private missions demonstrating the mission system
 import os
 import django
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
-django.setup()
-
-from game.models import Mission, MissionEvent, NPC, Room
-
 # Color codes
 class Color:
     GREEN = '\033[92m'
@@ -27,28 +21,23 @@ def print_success(msg):
 def print_section(msg):
     print(f"\n{Color.YELLOW}{'='*70}\n{msg}\n{'='*70}{Color.END}")
 
-# Get NPCs
-try:
-    captain_reynolds = NPC.objects.get(key='captain_reynolds')
-    doc_martinez = NPC.objects.get(key='doc_martinez')
-except NPC.DoesNotExist:
-    print("Error: Required NPCs not found. Run setup_outpost_interactive.py first.")
-    exit(1)
+# Missions are collected here and written together in one batch by
+# main(); given_by_npc holds the giver's NPC key until then
+mission_rows = []
 
-print_section("Creating Example Missions")
+def add_mission(key, defaults):
+    mission_rows.append({'key': key, **defaults})
 
 # ============================================================================
 # Mission 1: Recon Patrol (Public Mission)
 # ============================================================================
-print_section("Mission 1: Northern Recon Patrol")
-
-recon_mission, created = Mission.objects.update_or_create(
+add_mission(
     key='mission_recon_north',
     defaults={
         'name': 'Northern Recon Patrol',
         'mission_type': 'recon',
         'is_public': True,
-        'given_by_npc': captain_reynolds,
+        'given_by_npc': 'captain_reynolds',
         'difficulty': 'moderate',
         'required_level': 1,
         'required_squad_size': 2,
@@ -245,20 +234,16 @@ Partial intel is better than no intel. And you survived. That counts for somethi
     }
 )
 
-print_success(f"Created: {recon_mission.name} (Public)")
-
 # ============================================================================
 # Mission 2: Medical Supply Run (Public Mission)
 # ============================================================================
-print_section("Mission 2: Emergency Medical Supply Run")
-
-medical_mission, created = Mission.objects.update_or_create(
+add_mission(
     key='mission_medical_supplies',
     defaults={
         'name': 'Emergency Medical Supply Run',
         'mission_type': 'scavenge',
         'is_public': True,
-        'given_by_npc': doc_martinez,
+        'given_by_npc': 'doc_martinez',
         'difficulty': 'hard',
         'required_level': 3,
         'required_squad_size': 3,
@@ -469,14 +454,10 @@ we can."''',
     }
 )
 
-print_success(f"Created: {medical_mission.name} (Public)")
-
 # ============================================================================
 # Mission 3: Private Mission Example - Personal Patrol
 # ============================================================================
-print_section("Mission 3: Personal Patrol (Private Mission Example)")
-
-private_mission, created = Mission.objects.update_or_create(
+add_mission(
     key='mission_private_patrol_example',
     defaults={
         'name': 'Personal Patrol: Testing Your Skills',
@@ -614,20 +595,51 @@ That's the point of private missions: learning without server-wide consequences.
     }
 )
 
-print_success(f"Created: {private_mission.name} (Private - No Server Impact)")
-
-# Summary
-print_section("Mission Creation Complete")
-print_success(f"Created 3 example missions:")
-print(f"  1. {Color.CYAN}{recon_mission.name}{Color.END} (Public, Moderate)")
-print(f"  2. {Color.CYAN}{medical_mission.name}{Color.END} (Public, Hard)")
-print(f"  3. {Color.CYAN}{private_mission.name}{Color.END} (Private, Easy)")
-print()
-print(f"{Color.BLUE}Public missions award XP, currency, and items{Color.END}")
-print(f"{Color.BLUE}Private missions are personal narratives without server impact{Color.END}")
-print()
-print(f"{Color.YELLOW}Test missions with:{Color.END}")
-print("  GET  /api/v1/missions/")
-print("  GET  /api/v1/missions/<key>/")
-print("  POST /api/v1/missions/<key>/accept/")
-print()
+
+def main():
+    # Setup Django
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+    django.setup()
+
+    from game.models import Mission, NPC
+
+    # Get NPCs
+    npc_keys = sorted({row['given_by_npc'] for row in mission_rows if 'given_by_npc' in row})
+    npcs = {npc.key: npc for npc in NPC.objects.filter(key__in=npc_keys)}
+    missing = [key for key in npc_keys if key not in npcs]
+    if missing:
+        print(f"Error: Required NPCs not found ({', '.join(missing)}). Run setup_outpost_interactive.py first.")
+        exit(1)
+
+    print_section("Creating Example Missions")
+
+    # Write all three missions and their acts
+    missions = Mission.bulk_update_or_create_with_acts([
+        {**row, 'given_by_npc': npcs[row['given_by_npc']]} if 'given_by_npc' in row else row
+        for row in mission_rows
+    ])
+    recon_mission, medical_mission, private_mission = missions.values()
+
+    print_success(f"Created: {recon_mission.name} (Public)")
+    print_success(f"Created: {medical_mission.name} (Public)")
+    print_success(f"Created: {private_mission.name} (Private - No Server Impact)")
+
+    # Summary
+    print_section("Mission Creation Complete")
+    print_success(f"Created 3 example missions:")
+    print(f"  1. {Color.CYAN}{recon_mission.name}{Color.END} (Public, Moderate)")
+    print(f"  2. {Color.CYAN}{medical_mission.name}{Color.END} (Public, Hard)")
+    print(f"  3. {Color.CYAN}{private_mission.name}{Color.END} (Private, Easy)")
+    print()
+    print(f"{Color.BLUE}Public missions award XP, currency, and items{Color.END}")
+    print(f"{Color.BLUE}Private missions are personal narratives without server impact{Color.END}")
+    print()
+    print(f"{Color.YELLOW}Test missions with:{Color.END}")
+    print("  GET  /api/v1/missions/")
+    print("  GET  /api/v1/missions/<key>/")
+    print("  POST /api/v1/missions/<key>/accept/")
+    print()
+
+
+if __name__ == '__main__':
+    main()
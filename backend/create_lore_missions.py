@@ -7,12 +7,6 @@ Creates three compelling public missions based on Forgotten Ruin lore
 import os
 import django
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
-django.setup()
-
-from game.models import Mission, MissionEvent, NPC, Room
-
 # Color codes
 class Color:
     GREEN = '\033[92m'
@@ -28,29 +22,29 @@ def print_success(msg):
 def print_section(msg):
     print(f"\n{Color.YELLOW}{'='*70}\n{msg}\n{'='*70}{Color.END}")
 
-# Get NPCs
-try:
-    captain_reynolds = NPC.objects.get(key='captain_reynolds')
-    corporal_chen = NPC.objects.get(key='corporal_chen')
-    doc_martinez = NPC.objects.get(key='doc_martinez')
-except NPC.DoesNotExist:
-    print("Error: Required NPCs not found. Run setup_outpost_interactive.py first.")
-    exit(1)
+# Missions are collected here and written together in one batch by
+# main(); given_by_npc holds the giver's NPC key until then
+mission_rows = []
+
+def add_mission(key, defaults):
+    mission_rows.append({'key': key, **defaults})
 
-print_section("Creating Lore-Based Missions for Forgotten Ruin")
+# Events are collected the same way; mission holds the mission's key
+event_rows = []
+
+def add_event(mission, key, defaults):
+    event_rows.append({'mission': mission, 'key': key, **defaults})
 
 # ============================================================================
 # Mission 1: Wraith Rider Ambush (High-Stakes Combat)
 # ============================================================================
-print_section("Mission 1: Wraith Rider Ambush")
-
-wraith_mission, created = Mission.objects.update_or_create(
+add_mission(
     key='mission_wraith_riders',
     defaults={
         'name': 'Wraith Rider Ambush',
         'mission_type': 'defense',
         'is_public': True,
-        'given_by_npc': corporal_chen,
+        'given_by_npc': 'corporal_chen',
         'difficulty': 'very_hard',
         'required_level': 5,
         'required_squad_size': 4,
@@ -351,44 +345,16 @@ anyway. That's what Rangers do.''',
     }
 )
 
-print_success(f"Created: {wraith_mission.name} (Public, Very Hard)")
-
-# Create event for the wraith leader duel
-wraith_duel_event = MissionEvent.objects.update_or_create(
-    mission=wraith_mission,
-    key='wraith_leader_duel',
-    defaults={
-        'name': 'Duel with Wraith Leader',
-        'event_type': 'combat',
-        'act': 3,
-        'trigger_type': 'objective_complete',
-        'trigger_conditions': {'objective_key': 'final_defense'},
-        'trigger_chance': 1.0,
-        'description': '''The wraith leader challenges you to single combat.
-
-This is personal now. The wraith sees you as the one who killed its riders. It wants
-revenge. Rangers and wraith riders - old enemies in a new war.
-
-You can accept the duel or have your squad focus fire. But there's something to be said
-for answering a challenge. Rangers don't back down.''',
-        'is_repeatable': False,
-    }
-)
-
-print_success(f"  └─ Created event: Wraith Leader Duel")
-
 # ============================================================================
 # Mission 2: The Crashed Ranger Bird (Discovery & Rescue)
 # ============================================================================
-print_section("Mission 2: The Crashed Ranger Bird")
-
-helicopter_mission, created = Mission.objects.update_or_create(
+add_mission(
     key='mission_ranger_helicopter',
     defaults={
         'name': 'The Crashed Ranger Bird',
         'mission_type': 'rescue',
         'is_public': True,
-        'given_by_npc': captain_reynolds,
+        'given_by_npc': 'captain_reynolds',
         'difficulty': 'hard',
         'required_level': 4,
         'required_squad_size': 3,
@@ -713,43 +679,16 @@ Rangers take care of their own. You did your best. Sometimes that's all you can
     }
 )
 
-print_success(f"Created: {helicopter_mission.name} (Public, Hard)")
-
-# Create event for discovering the survivors
-survivor_discovery = MissionEvent.objects.update_or_create(
-    mission=helicopter_mission,
-    key='survivor_discovery',
-    defaults={
-        'name': 'Discover Survivors',
-        'event_type': 'discovery',
-        'act': 2,
-        'trigger_type': 'objective_complete',
-        'trigger_conditions': {'objective_key': 'follow_trail'},
-        'trigger_chance': 1.0,
-        'description': '''You hear M4A1 gunfire in the distance.
-
-That's Ranger weapons. That means Rangers are alive and fighting. Twenty-three days after
-their helicopter crashed, survivors are still out here.
-
-Your squad immediately moves toward the sound. Rangers help Rangers. Always.''',
-        'is_repeatable': False,
-    }
-)
-
-print_success(f"  └─ Created event: Survivor Discovery")
-
 # ============================================================================
 # Mission 3: Strike the Dark Wizard Coven (Assassination/Raid)
 # ============================================================================
-print_section("Mission 3: Strike the Dark Wizard Coven")
-
-wizard_mission, created = Mission.objects.update_or_create(
+add_mission(
     key='mission_wizard_coven_strike',
     defaults={
         'name': 'Strike the Dark Wizard Coven',
         'mission_type': 'assassination',
         'is_public': True,
-        'given_by_npc': captain_reynolds,
+        'given_by_npc': 'captain_reynolds',
         'difficulty': 'extreme',
         'required_level': 7,
         'required_squad_size': 6,
@@ -1121,11 +1060,56 @@ Mission accomplished. At terrible cost. But accomplished.''',
     }
 )
 
-print_success(f"Created: {wizard_mission.name} (Public, Extreme)")
+# ============================================================================
+# Mission Events
+# ============================================================================
+
+# Create event for the wraith leader duel
+add_event(
+    mission='mission_wraith_riders',
+    key='wraith_leader_duel',
+    defaults={
+        'name': 'Duel with Wraith Leader',
+        'event_type': 'combat',
+        'act': 3,
+        'trigger_type': 'objective_complete',
+        'trigger_conditions': {'objective_key': 'final_defense'},
+        'trigger_chance': 1.0,
+        'description': '''The wraith leader challenges you to single combat.
+
+This is personal now. The wraith sees you as the one who killed its riders. It wants
+revenge. Rangers and wraith riders - old enemies in a new war.
+
+You can accept the duel or have your squad focus fire. But there's something to be said
+for answering a challenge. Rangers don't back down.''',
+        'is_repeatable': False,
+    }
+)
+
+# Create event for discovering the survivors
+add_event(
+    mission='mission_ranger_helicopter',
+    key='survivor_discovery',
+    defaults={
+        'name': 'Discover Survivors',
+        'event_type': 'discovery',
+        'act': 2,
+        'trigger_type': 'objective_complete',
+        'trigger_conditions': {'objective_key': 'follow_trail'},
+        'trigger_chance': 1.0,
+        'description': '''You hear M4A1 gunfire in the distance.
+
+That's Ranger weapons. That means Rangers are alive and fighting. Twenty-three days after
+their helicopter crashed, survivors are still out here.
+
+Your squad immediately moves toward the sound. Rangers help Rangers. Always.''',
+        'is_repeatable': False,
+    }
+)
 
 # Create choice event for wizard encounter
-wizard_choice = MissionEvent.objects.update_or_create(
-    mission=wizard_mission,
+add_event(
+    mission='mission_wizard_coven_strike',
     key='wizard_surrender_offer',
     defaults={
         'name': 'The Surviving Wizard\'s Offer',
@@ -1194,38 +1178,81 @@ all six dark wizards dead.''',
     }
 )
 
-print_success(f"  └─ Created event: Wizard Surrender Offer")
-
-# Summary
-print_section("Mission Creation Complete!")
-print()
-print_success(f"Created 3 lore-based missions:")
-print()
-print(f"{Color.CYAN}1. Wraith Rider Ambush{Color.END}")
-print(f"   Type: Defense | Difficulty: Very Hard | Level: 5+ | Squad: 4+")
-print(f"   {Color.MAGENTA}Defend a civilian settlement from elite Dark Army cavalry{Color.END}")
-print(f"   Rewards: 1500 XP, Iron Blessed Blade, Wraith Trophy")
-print()
-print(f"{Color.CYAN}2. The Crashed Ranger Bird{Color.END}")
-print(f"   Type: Rescue | Difficulty: Hard | Level: 4+ | Squad: 3+")
-print(f"   {Color.MAGENTA}Recover a lost Ranger helicopter crew from hostile territory{Color.END}")
-print(f"   Rewards: 1200 XP, Black Box, Dog Tags, Survival Kit")
-print()
-print(f"{Color.CYAN}3. Strike the Dark Wizard Coven{Color.END}")
-print(f"   Type: Assassination | Difficulty: Extreme | Level: 7+ | Squad: 6+")
-print(f"   {Color.MAGENTA}Eliminate six dark wizards before they complete a dark ritual{Color.END}")
-print(f"   Rewards: 2000 XP, Wizard Staff, Ritual Tome, Valor Medal")
-print()
-print(f"{Color.YELLOW}Features:{Color.END}")
-print("  ✓ Rich narrative based on Forgotten Ruin lore")
-print("  ✓ Three-act cinematic structure")
-print("  ✓ Multiple difficulty levels (Hard, Very Hard, Extreme)")
-print("  ✓ Optional events with player choices")
-print("  ✓ Success/Failure/Partial outcomes")
-print("  ✓ Strategic consequences for server state")
-print()
-print(f"{Color.BLUE}Test with:{Color.END}")
-print("  python manage.py makemigrations")
-print("  python manage.py migrate")
-print("  python create_lore_missions.py")
-print()
+
+def main():
+    # Setup Django
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+    django.setup()
+
+    from django.db import transaction
+    from game.models import Mission, MissionEvent, NPC
+
+    # Get NPCs
+    npc_keys = sorted({row['given_by_npc'] for row in mission_rows if 'given_by_npc' in row})
+    npcs = {npc.key: npc for npc in NPC.objects.filter(key__in=npc_keys)}
+    missing = [key for key in npc_keys if key not in npcs]
+    if missing:
+        print(f"Error: Required NPCs not found ({', '.join(missing)}). Run setup_outpost_interactive.py first.")
+        exit(1)
+
+    print_section("Creating Lore-Based Missions for Forgotten Ruin")
+
+    # Write the missions, their acts and events in one transaction
+    with transaction.atomic():
+        missions = Mission.bulk_update_or_create_with_acts([
+            {**row, 'given_by_npc': npcs[row['given_by_npc']]} if 'given_by_npc' in row else row
+            for row in mission_rows
+        ])
+        wraith_mission, helicopter_mission, wizard_mission = missions.values()
+
+        print_success(f"Created: {wraith_mission.name} (Public, Very Hard)")
+        print_success(f"Created: {helicopter_mission.name} (Public, Hard)")
+        print_success(f"Created: {wizard_mission.name} (Public, Extreme)")
+
+        print_section("Mission Events")
+
+        MissionEvent.bulk_update_or_create([
+            {**row, 'mission': missions[row['mission']]} for row in event_rows
+        ])
+
+        print_success(f"  └─ Created event: Wraith Leader Duel")
+        print_success(f"  └─ Created event: Survivor Discovery")
+        print_success(f"  └─ Created event: Wizard Surrender Offer")
+
+    # Summary
+    print_section("Mission Creation Complete!")
+    print()
+    print_success(f"Created 3 lore-based missions:")
+    print()
+    print(f"{Color.CYAN}1. Wraith Rider Ambush{Color.END}")
+    print(f"   Type: Defense | Difficulty: Very Hard | Level: 5+ | Squad: 4+")
+    print(f"   {Color.MAGENTA}Defend a civilian settlement from elite Dark Army cavalry{Color.END}")
+    print(f"   Rewards: 1500 XP, Iron Blessed Blade, Wraith Trophy")
+    print()
+    print(f"{Color.CYAN}2. The Crashed Ranger Bird{Color.END}")
+    print(f"   Type: Rescue | Difficulty: Hard | Level: 4+ | Squad: 3+")
+    print(f"   {Color.MAGENTA}Recover a lost Ranger helicopter crew from hostile territory{Color.END}")
+    print(f"   Rewards: 1200 XP, Black Box, Dog Tags, Survival Kit")
+    print()
+    print(f"{Color.CYAN}3. Strike the Dark Wizard Coven{Color.END}")
+    print(f"   Type: Assassination | Difficulty: Extreme | Level: 7+ | Squad: 6+")
+    print(f"   {Color.MAGENTA}Eliminate six dark wizards before they complete a dark ritual{Color.END}")
+    print(f"   Rewards: 2000 XP, Wizard Staff, Ritual Tome, Valor Medal")
+    print()
+    print(f"{Color.YELLOW}Features:{Color.END}")
+    print("  ✓ Rich narrative based on Forgotten Ruin lore")
+    print("  ✓ Three-act cinematic structure")
+    print("  ✓ Multiple difficulty levels (Hard, Very Hard, Extreme)")
+    print("  ✓ Optional events with player choices")
+    print("  ✓ Success/Failure/Partial outcomes")
+    print("  ✓ Strategic consequences for server state")
+    print()
+    print(f"{Color.BLUE}Test with:{Color.END}")
+    print("  python manage.py makemigrations")
+    print("  python manage.py migrate")
+    print("  python create_lore_missions.py")
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Game Caches
+
+Shared-cache copies of near-static game data.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+
+from .models import Mission, MissionAct
+
+# Mission columns kept in the catalog cache: what the mission list, the
+# start requirement checks and the progress summaries read. The long
+# narrative text columns stay deferred.
+MISSION_CATALOG_FIELDS = (
+    'id', 'key', 'name', 'mission_type', 'difficulty', 'required_level',
+    'required_squad_size', 'is_public', 'hook_title', 'time_limit',
+    'is_repeatable', 'cooldown_hours', 'required_missions_completed',
+    'required_items', 'given_by_npc', 'given_by_npc__name',
+)
+
+
+class MissionCache:
+    """
+    Mission catalog rows cached one entry per mission
+
+    Entries are Mission instances loaded with MISSION_CATALOG_FIELDS, the
+    giver NPC and the acts (without descriptions), so callers can use the
+    normal model methods on them. Signals drop an entry whenever its
+    mission is saved or deleted.
+    """
+    TIMEOUT = 300
+
+    @staticmethod
+    def key(mission_id):
+        return f'mission:{mission_id}'
+
+    @classmethod
+    def get_many(cls, mission_ids):
+        """
+        Return {mission_id: Mission} for the given ids
+
+        Hits come from the cache; misses are loaded in one query (plus one
+        for their acts) and written back.
+        """
+        keys = {cls.key(mission_id): mission_id for mission_id in mission_ids}
+        missions = {keys[key]: mission for key, mission in cache.get_many(keys).items()}
+
+        missing = [mission_id for mission_id in mission_ids if mission_id not in missions]
+        if missing:
+            loaded = (
+                Mission.objects.filter(id__in=missing)
+                .select_related('given_by_npc')
+                .only(*MISSION_CATALOG_FIELDS)
+                .prefetch_related(Prefetch('acts', queryset=MissionAct.objects.defer('description')))
+            )
+            fresh = {}
+            for mission in loaded:
+                # Fill the per-instance memos before they are pickled
+                mission.total_objectives
+                fresh[mission.id] = mission
+            cache.set_many({cls.key(mission_id): m for mission_id, m in fresh.items()}, cls.TIMEOUT)
+            missions.update(fresh)
+
+        return missions
+
+    @classmethod
+    def invalidate(cls, mission_id):
+        cache.delete(cls.key(mission_id))
+
+    @classmethod
+    def invalidate_bulk_write(cls, mission_ids):
+        """
+        Drop the entries and the catalog version after a bulk write
+
+        Bulk upserts send no post_save, so they call this instead of the
+        signal handlers. Like them it drops the keys now and again on
+        commit. The version key must match
+        api.v1.mission_views.MISSION_CATALOG_VERSION_KEY.
+        """
+        keys = [cls.key(mission_id) for mission_id in mission_ids] + ['mission_catalog_version']
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,116 @@
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+ACT_FIELDS = ('title', 'description', 'objectives')
+
+
+def copy_acts_to_rows(apps, schema_editor):
+    """Move the act1_* .. act3_* columns into MissionAct rows"""
+    Mission = apps.get_model('game', 'Mission')
+    MissionAct = apps.get_model('game', 'MissionAct')
+
+    columns = [f'act{n}_{name}' for n in (1, 2, 3) for name in ACT_FIELDS]
+    acts = []
+    for row in Mission.objects.values('id', *columns).iterator():
+        for n in (1, 2, 3):
+            acts.append(MissionAct(
+                mission_id=row['id'],
+                act_number=n,
+                **{name: row[f'act{n}_{name}'] for name in ACT_FIELDS}
+            ))
+    MissionAct.objects.bulk_create(acts, batch_size=500)
+
+
+def copy_rows_to_acts(apps, schema_editor):
+    """Reverse: write MissionAct rows back onto the act columns"""
+    Mission = apps.get_model('game', 'Mission')
+    MissionAct = apps.get_model('game', 'MissionAct')
+
+    updates = {}
+    for act in MissionAct.objects.iterator():
+        fields = updates.setdefault(act.mission_id, {})
+        for name in ACT_FIELDS:
+            fields[f'act{act.act_number}_{name}'] = getattr(act, name)
+    for mission_id, fields in updates.items():
+        Mission.objects.filter(id=mission_id).update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0003_mission_missiontemplate_missiondialogue_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MissionAct',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('act_number', models.IntegerField(choices=[(1, 'Act 1'), (2, 'Act 2'), (3, 'Act 3')])),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(help_text='Narrative for this act')),
+                ('objectives', models.JSONField(default=list, help_text="List of objectives: [{'key': 'obj1', 'description': '...', 'required': true}]")),
+                ('mission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='acts', to='game.mission')),
+            ],
+            options={
+                'ordering': ['mission', 'act_number'],
+                'unique_together': {('mission', 'act_number')},
+            },
+        ),
+        migrations.RunPython(copy_acts_to_rows, copy_rows_to_acts),
+        # Give the descriptions a default so the columns can be re-added to
+        # existing rows when migrating backwards
+        migrations.AlterField(
+            model_name='mission',
+            name='act1_description',
+            field=models.TextField(default='', help_text='Setup and rising action'),
+        ),
+        migrations.AlterField(
+            model_name='mission',
+            name='act2_description',
+            field=models.TextField(default='', help_text='Main conflict and complications'),
+        ),
+        migrations.AlterField(
+            model_name='mission',
+            name='act3_description',
+            field=models.TextField(default='', help_text='Climactic confrontation'),
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act1_description',
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act1_objectives',
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act1_title',
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act2_description',
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act2_objectives',
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act2_title',
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act3_description',
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act3_objectives',
+        ),
+        migrations.RemoveField(
+            model_name='mission',
+            name='act3_title',
+        ),
+    ]
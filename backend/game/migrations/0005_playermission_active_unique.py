@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:32
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+RUNNING = ('active', 'in_progress')
+
+
+def abandon_duplicate_running(apps, schema_editor):
+    """Keep the newest running row per (player, mission); abandon the rest"""
+    PlayerMission = apps.get_model('game', 'PlayerMission')
+
+    seen = set()
+    stale = []
+    rows = PlayerMission.objects.filter(status__in=RUNNING).order_by(
+        'player_id', 'mission_id', '-created_at', '-id'
+    ).values_list('id', 'player_id', 'mission_id')
+    for pk, player_id, mission_id in rows.iterator():
+        if (player_id, mission_id) in seen:
+            stale.append(pk)
+        else:
+            seen.add((player_id, mission_id))
+    for start in range(0, len(stale), 500):
+        PlayerMission.objects.filter(id__in=stale[start:start + 500]).update(
+            status='abandoned', completed_at=timezone.now()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0004_missionact'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='playermission',
+            index=models.Index(fields=['player', 'mission', 'status'], name='game_player_player__7c3e4b_idx'),
+        ),
+        migrations.RunPython(abandon_duplicate_running, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='playermission',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['active', 'in_progress'])), fields=('player', 'mission'), name='uniq_active_player_mission'),
+        ),
+    ]
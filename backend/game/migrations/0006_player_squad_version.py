@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 07:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0005_playermission_active_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='player',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Bumped when the player, their items or quests change'),
+        ),
+        migrations.AddField(
+            model_name='squad',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Bumped when the squad or its members change'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:02
+
+from django.db import migrations, models
+
+
+def fill_health_percentage(apps, schema_editor):
+    """Compute health_percentage for existing members"""
+    SquadMember = apps.get_model('game', 'SquadMember')
+    SquadMember.objects.filter(max_health__gt=0).update(
+        health_percentage=models.ExpressionWrapper(
+            models.F('health') * 100.0 / models.F('max_health'),
+            output_field=models.FloatField()
+        )
+    )
+    SquadMember.objects.filter(max_health__lte=0).update(health_percentage=0.0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0006_player_squad_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='squadmember',
+            name='health_percentage',
+            field=models.FloatField(default=100.0, editable=False, help_text='Health as a percentage of max health (kept in step by save())'),
+        ),
+        migrations.RunPython(fill_health_percentage, migrations.RunPython.noop),
+    ]
@@ -11,6 +11,7 @@ Contains all database models for game entities:
 - Room
 - Zone
 - Mission (cinematic three-act missions)
+- MissionAct (one act of a mission)
 - PlayerMission (player progress through missions)
 """
 
@@ -22,7 +23,7 @@ from .item import Item
 from .room import Room, Exit
 from .zone import Zone
 from .quest import Quest, PlayerQuest
-from .mission import Mission, MissionTemplate, MissionEvent, MissionDialogue
+from .mission import Mission, MissionAct, MissionTemplate, MissionEvent, MissionDialogue
 from .player_mission import PlayerMission
 
 __all__ = [
@@ -38,6 +39,7 @@ __all__ = [
     'Quest',
     'PlayerQuest',
     'Mission',
+    'MissionAct',
     'MissionTemplate',
     'MissionEvent',
     'MissionDialogue',
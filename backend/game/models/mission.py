@@ -4,15 +4,16 @@ Mission System Models
 Supports both public missions (server-impacting, award XP/assets) and private missions
 (personal narratives without server impact).
 
-Missions follow a cinematic three-act structure:
+Missions follow a cinematic three-act structure (acts are MissionAct rows):
 - Hook: Introduction and motivation
 - Act 1: Setup and rising action
 - Act 2: Confrontation and complications
 - Act 3: Climax and resolution
 - Conclusion: Satisfying wrap-up and rewards
 """
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
+from django.utils.functional import cached_property
 import uuid
 
 
@@ -87,29 +88,7 @@ class Mission(models.Model):
     hook_title = models.CharField(max_length=200, help_text="Compelling hook title")
     hook_description = models.TextField(help_text="Opening scene that hooks the player")
 
-    # Narrative Structure - Act 1 (Setup)
-    act1_title = models.CharField(max_length=200, default="Setup")
-    act1_description = models.TextField(help_text="Setup and rising action")
-    act1_objectives = models.JSONField(
-        default=list,
-        help_text="List of objectives for Act 1: [{'key': 'obj1', 'description': '...', 'required': true}]"
-    )
-
-    # Narrative Structure - Act 2 (Confrontation)
-    act2_title = models.CharField(max_length=200, default="Confrontation")
-    act2_description = models.TextField(help_text="Main conflict and complications")
-    act2_objectives = models.JSONField(
-        default=list,
-        help_text="List of objectives for Act 2"
-    )
-
-    # Narrative Structure - Act 3 (Climax)
-    act3_title = models.CharField(max_length=200, default="Climax")
-    act3_description = models.TextField(help_text="Climactic confrontation")
-    act3_objectives = models.JSONField(
-        default=list,
-        help_text="List of objectives for Act 3"
-    )
+    # Narrative Structure - Acts 1-3 are MissionAct rows (mission.acts)
 
     # Conclusion
     conclusion_success = models.TextField(
@@ -186,94 +165,294 @@ class Mission(models.Model):
         mission_visibility = "Public" if self.is_public else "Private"
         return f"{self.name} ({mission_visibility}, {self.get_difficulty_display()})"
 
+    @cached_property
+    def acts_by_number(self):
+        """This mission's acts keyed by act number (uses prefetched acts if present)"""
+        return {act.act_number: act for act in self.acts.all()}
+
+    def get_act(self, act_number):
+        """Return the MissionAct for an act number, or None"""
+        return self.acts_by_number.get(act_number)
+
+    @cached_property
+    def total_objectives(self):
+        """Total number of objectives across all acts (computed once per instance)"""
+        return sum(len(act.objectives) for act in self.acts_by_number.values())
+
     def get_total_objectives(self):
         """Return total number of objectives across all acts"""
-        return (
-            len(self.act1_objectives) +
-            len(self.act2_objectives) +
-            len(self.act3_objectives)
-        )
+        return self.total_objectives
+
+    def get_act_title(self, act_number):
+        """Return the title of an act (0 is the hook, 4 the conclusion)"""
+        if act_number == 0:
+            return 'Hook'
+        if act_number > 3:
+            return 'Conclusion'
+        act = self.get_act(act_number)
+        return act.title if act else MissionAct.DEFAULT_TITLES[act_number]
+
+    @staticmethod
+    def pop_act_fields(data):
+        """
+        Remove flat actN_title/description/objectives keys from a dict
+
+        Lets callers keep describing a mission as one flat dict (seed
+        scripts, templates, the private mission API). Missing titles fall
+        back to the act's default title.
+
+        Returns:
+            list: MissionAct field dicts for each act mentioned in data
+        """
+        acts = []
+        for number, default_title in MissionAct.DEFAULT_TITLES.items():
+            fields = {
+                name: data.pop(f'act{number}_{name}')
+                for name in ('title', 'description', 'objectives')
+                if f'act{number}_{name}' in data
+            }
+            if fields:
+                fields.setdefault('title', default_title)
+                fields.setdefault('description', '')
+                fields.setdefault('objectives', [])
+                acts.append({'act_number': number, **fields})
+        return acts
+
+    def set_acts(self, acts):
+        """Insert or update this mission's acts (dicts from pop_act_fields) in one query"""
+        MissionAct.bulk_upsert([MissionAct(mission=self, **fields) for fields in acts])
+        # Drop anything cached from the old acts
+        for attr in ('acts_by_number', 'total_objectives'):
+            self.__dict__.pop(attr, None)
+        getattr(self, '_prefetched_objects_cache', {}).pop('acts', None)
+
+    @classmethod
+    def create_with_acts(cls, **fields):
+        """Mission.objects.create() that also accepts flat actN_* fields"""
+        acts = cls.pop_act_fields(fields)
+        with transaction.atomic():
+            mission = cls.objects.create(**fields)
+            mission.set_acts(acts)
+        return mission
+
+    @classmethod
+    def update_or_create_with_acts(cls, defaults=None, **lookup):
+        """Mission.objects.update_or_create() that also accepts flat actN_* defaults"""
+        defaults = dict(defaults or {})
+        acts = cls.pop_act_fields(defaults)
+        with transaction.atomic():
+            mission, created = cls.objects.update_or_create(defaults=defaults, **lookup)
+            mission.set_acts(acts)
+        return mission, created
+
+    @classmethod
+    def bulk_update_or_create_with_acts(cls, missions):
+        """
+        update_or_create_with_acts() for many missions, matched on key
+
+        Each dict holds one mission's flat fields, key included. The
+        missions are written with one INSERT ... ON CONFLICT per 100 and
+        their acts with one per 500. Fields missing from every dict keep their
+        current value; a field given for some missions only is reset to
+        its default on the others.
+
+        Returns:
+            dict: {key: Mission} in the order given
+        """
+        from game.cache import MissionCache
+
+        missions = [dict(fields) for fields in missions]
+        acts = {fields['key']: cls.pop_act_fields(fields) for fields in missions}
+        update_fields = sorted({name for fields in missions for name in fields} - {'key'})
+
+        with transaction.atomic():
+            cls.objects.bulk_create(
+                [cls(**fields) for fields in missions],
+                update_conflicts=True,
+                unique_fields=['key'],
+                update_fields=[*update_fields, 'updated_at'],
+                # Narrative-heavy rows: keep each INSERT to a few MB
+                batch_size=100,
+            )
+            # Missions that already existed keep their old id, not the one
+            # generated above, so read the saved rows back
+            saved = cls.objects.in_bulk(list(acts), field_name='key')
+            MissionAct.bulk_upsert([
+                MissionAct(mission=saved[key], **fields)
+                for key, mission_acts in acts.items()
+                for fields in mission_acts
+            ])
+            MissionCache.invalidate_bulk_write([mission.id for mission in saved.values()])
+        return {key: saved[key] for key in acts}
 
     def can_player_start(self, player):
         """Check if player meets requirements to start this mission"""
+        return Mission.bulk_can_player_start(player, [self])[self.id]
+
+    @classmethod
+    def bulk_can_player_start(cls, player, missions):
+        """
+        Check start requirements for many missions at once
+
+        Loads the player's squad strength, mission history and required
+        items up front (a handful of queries in total) and evaluates every
+        mission against them in Python.
+
+        Returns:
+            dict: {mission.id: (can_start, message)}
+        """
+        from django.db.models import Count, Q
+        from game.models import Item, Squad
         from .player_mission import PlayerMission
 
+        missions = list(missions)
+
+        # Alive squad members (None if the player has no squad)
+        alive_count = Squad.objects.filter(player=player).annotate(
+            alive=Count('members', filter=Q(members__health__gt=0))
+        ).values_list('alive', flat=True).first()
+
+        # Player's mission history
+        in_progress_ids = set()
+        completed_ids = set()
+        completed_keys = set()
+        last_completed_at = {}
+        history = PlayerMission.objects.filter(player=player).values_list(
+            'mission_id', 'mission__key', 'status', 'completed_at'
+        )
+        for mission_id, mission_key, pm_status, completed_at in history:
+            if pm_status in ('active', 'in_progress'):
+                in_progress_ids.add(mission_id)
+            elif pm_status == 'completed':
+                completed_ids.add(mission_id)
+                completed_keys.add(mission_key)
+                if completed_at and (
+                    mission_id not in last_completed_at or completed_at > last_completed_at[mission_id]
+                ):
+                    last_completed_at[mission_id] = completed_at
+
+        # Counts of the player's items that any mission asks for
+        item_keys = {req.get('item_key') for m in missions for req in m.required_items}
+        item_counts = {}
+        if item_keys:
+            item_counts = dict(
+                Item.objects.filter(owner_player=player, key__in=item_keys).order_by()
+                .values('key').annotate(n=Count('id')).values_list('key', 'n')
+            )
+
+        now = timezone.now()
+        results = {}
+        missing_prereqs = {}
+        for mission in missions:
+            results[mission.id] = mission._check_start(
+                player, alive_count, in_progress_ids, completed_ids,
+                completed_keys, last_completed_at, item_counts, now
+            )
+            if results[mission.id] is None:
+                missing_prereqs[mission.id] = next(
+                    k for k in mission.required_missions_completed if k not in completed_keys
+                )
+
+        # Name the first missing prerequisite of each blocked mission
+        if missing_prereqs:
+            names = dict(
+                cls.objects.filter(key__in=set(missing_prereqs.values())).values_list('key', 'name')
+            )
+            for mission_id, prereq_key in missing_prereqs.items():
+                if prereq_key in names:
+                    results[mission_id] = (False, f"Requires completion of: {names[prereq_key]}")
+                else:
+                    results[mission_id] = (False, f"Requires prerequisite mission: {prereq_key}")
+
+        return results
+
+    def _check_start(self, player, alive_count, in_progress_ids, completed_ids,
+                     completed_keys, last_completed_at, item_counts, now):
+        """
+        Evaluate start requirements against preloaded player state
+
+        Returns (can_start, message), or None when the only failure is a
+        missing prerequisite (named by the caller).
+        """
         # Check level requirement
         if player.level < self.required_level:
             return False, f"Requires level {self.required_level}"
 
         # Check squad size
-        if player.squad:
-            alive_members = [m for m in player.squad.members.all() if m.health > 0]
-            if len(alive_members) < self.required_squad_size:
+        if alive_count is not None:
+            if alive_count < self.required_squad_size:
                 return False, f"Requires {self.required_squad_size} squad members"
         elif self.required_squad_size > 1:
             return False, f"Requires {self.required_squad_size} squad members"
 
         # Check if already active
-        active_mission = PlayerMission.objects.filter(
-            player=player,
-            mission=self,
-            status__in=['active', 'in_progress']
-        ).first()
-        if active_mission:
+        if self.id in in_progress_ids:
             return False, "Mission already in progress"
 
         # Check if on cooldown
         if not self.is_repeatable:
-            completed = PlayerMission.objects.filter(
-                player=player,
-                mission=self,
-                status='completed'
-            ).exists()
-            if completed:
+            if self.id in completed_ids:
                 return False, "Mission already completed"
         else:
-            # Check cooldown
-            last_completion = PlayerMission.objects.filter(
-                player=player,
-                mission=self,
-                status='completed'
-            ).order_by('-completed_at').first()
-
+            last_completion = last_completed_at.get(self.id)
             if last_completion and self.cooldown_hours > 0:
-                cooldown_end = last_completion.completed_at + timezone.timedelta(hours=self.cooldown_hours)
-                if timezone.now() < cooldown_end:
-                    remaining = cooldown_end - timezone.now()
+                cooldown_end = last_completion + timezone.timedelta(hours=self.cooldown_hours)
+                if now < cooldown_end:
+                    remaining = cooldown_end - now
                     hours = int(remaining.total_seconds() / 3600)
                     return False, f"On cooldown for {hours} more hours"
 
         # Check prerequisite missions
-        if self.required_missions_completed:
-            for prereq_key in self.required_missions_completed:
-                completed = PlayerMission.objects.filter(
-                    player=player,
-                    mission__key=prereq_key,
-                    status='completed'
-                ).exists()
-                if not completed:
-                    try:
-                        prereq_mission = Mission.objects.get(key=prereq_key)
-                        return False, f"Requires completion of: {prereq_mission.name}"
-                    except Mission.DoesNotExist:
-                        return False, f"Requires prerequisite mission: {prereq_key}"
+        if not completed_keys.issuperset(self.required_missions_completed):
+            return None
 
         # Check required items
-        if self.required_items:
-            from game.models import Item
-            for item_req in self.required_items:
-                item_key = item_req.get('item_key')
-                quantity = item_req.get('quantity', 1)
+        for item_req in self.required_items:
+            item_key = item_req.get('item_key')
+            quantity = item_req.get('quantity', 1)
+            if item_counts.get(item_key, 0) < quantity:
+                return False, f"Requires {quantity}x {item_key}"
 
-                player_items = Item.objects.filter(
-                    player=player,
-                    key=item_key
-                ).count()
+        return True, "Requirements met"
 
-                if player_items < quantity:
-                    return False, f"Requires {quantity}x {item_key}"
 
-        return True, "Requirements met"
+class MissionAct(models.Model):
+    """
+    One act of a mission's three-act structure
+    """
+    DEFAULT_TITLES = {1: 'Setup', 2: 'Confrontation', 3: 'Climax'}
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    mission = models.ForeignKey(Mission, on_delete=models.CASCADE, related_name='acts')
+    act_number = models.IntegerField(choices=[(1, 'Act 1'), (2, 'Act 2'), (3, 'Act 3')])
+
+    title = models.CharField(max_length=200)
+    description = models.TextField(help_text="Narrative for this act")
+    objectives = models.JSONField(
+        default=list,
+        help_text="List of objectives: [{'key': 'obj1', 'description': '...', 'required': true}]"
+    )
+
+    class Meta:
+        ordering = ['mission', 'act_number']
+        unique_together = ['mission', 'act_number']
+
+    def __str__(self):
+        return f"{self.mission.name} - Act {self.act_number}: {self.title}"
+
+    @classmethod
+    def bulk_upsert(cls, acts):
+        """Insert acts, or update the ones a mission already has, 500 per query"""
+        from game.cache import MissionCache
+
+        cls.objects.bulk_create(
+            acts,
+            update_conflicts=True,
+            unique_fields=['mission', 'act_number'],
+            update_fields=['title', 'description', 'objectives'],
+            batch_size=500,
+        )
+        MissionCache.invalidate_bulk_write({act.mission_id for act in acts})
 
 
 class MissionTemplate(models.Model):
@@ -323,7 +502,7 @@ class MissionTemplate(models.Model):
         mission_data = self._replace_variables(self.template_data, variables)
 
         # Create mission
-        mission = Mission.objects.create(**mission_data)
+        mission = Mission.create_with_acts(**mission_data)
         return mission
 
     def _replace_variables(self, data, variables):
@@ -414,6 +593,28 @@ class MissionEvent(models.Model):
     def __str__(self):
         return f"{self.mission.name} - {self.name} (Act {self.act})"
 
+    @classmethod
+    def bulk_update_or_create(cls, events):
+        """
+        update_or_create() for many events, matched on (mission, key)
+
+        Each dict holds one event's fields, mission and key included. The
+        events are written with one INSERT ... ON CONFLICT per 500.
+        """
+        update_fields = sorted({name for fields in events for name in fields} - {'mission', 'key'})
+        cls.objects.bulk_create(
+            [cls(**fields) for fields in events],
+            update_conflicts=True,
+            unique_fields=['mission', 'key'],
+            update_fields=update_fields,
+            batch_size=500,
+        )
+
+    @cached_property
+    def choices_by_text(self):
+        """This event's choices keyed by their text"""
+        return {choice['text']: choice for choice in self.choices or []}
+
 
 class MissionDialogue(models.Model):
     """
@@ -8,11 +8,12 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from .versioned import VersionedModelMixin
 
 User = get_user_model()
 
 
-class Player(models.Model):
+class Player(VersionedModelMixin, models.Model):
     """
     Player character model
 
@@ -185,6 +186,19 @@ class Player(models.Model):
         help_text="Custom attributes and flags"
     )
 
+    # Columns the cached character sheet shows; saves of anything else
+    # (is_online, last_action, location...) keep its cache entry
+    VERSIONED_FIELDS = frozenset({
+        'character_name', 'description', 'level', 'experience',
+        'health', 'max_health', 'mana', 'max_mana',
+        'strength', 'dexterity', 'intelligence', 'constitution', 'currency',
+    })
+
+    version = models.PositiveIntegerField(
+        default=0,
+        help_text="Bumped when the player, their items or quests change"
+    )
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
@@ -89,6 +89,15 @@ class PlayerMission(models.Model):
         indexes = [
             models.Index(fields=['player', 'status']),
             models.Index(fields=['mission', 'status']),
+            models.Index(fields=['player', 'mission', 'status']),
+        ]
+        constraints = [
+            # At most one running instance of a mission per player
+            models.UniqueConstraint(
+                fields=['player', 'mission'],
+                condition=models.Q(status__in=['active', 'in_progress']),
+                name='uniq_active_player_mission',
+            ),
         ]
 
     def __str__(self):
@@ -96,51 +105,68 @@ class PlayerMission(models.Model):
 
     def accept(self):
         """Player accepts the mission"""
-        if self.status != 'available':
-            return False, "Mission already accepted"
-
         # Check if player can start
         can_start, message = self.mission.can_player_start(self.player)
         if not can_start:
             return False, message
 
+        success, message = self.accept_inplace()
+        if success:
+            self.save()
+            self.consume_required_items()
+        return success, message
+
+    def accept_inplace(self):
+        """
+        Apply acceptance to this instance without saving
+
+        Start requirements are not checked here; callers check them first
+        (see accept()). Saving and consuming required items is left to the
+        caller so a failed accept writes nothing.
+
+        Returns:
+            tuple: (success, message)
+        """
+        if self.status != 'available':
+            return False, "Mission already accepted"
+
+        now = timezone.now()
         self.status = 'active'
-        self.accepted_at = timezone.now()
+        self.accepted_at = now
         self.current_act = 0  # Start at hook
 
         # Set time limit if applicable
         if self.mission.time_limit:
-            self.time_limit_expires = timezone.now() + timezone.timedelta(seconds=self.mission.time_limit)
+            self.time_limit_expires = now + timezone.timedelta(seconds=self.mission.time_limit)
 
         # Take squad snapshot
-        if self.player.squad:
+        squad = getattr(self.player, 'squad', None)
+        if squad:
             self.squad_snapshot = {
-                'squad_name': self.player.squad.name,
+                'squad_name': squad.squad_name,
                 'members': [
                     {
                         'name': member.name,
-                        'level': member.level,
+                        'rank': member.rank,
                         'health': member.health,
                     }
-                    for member in self.player.squad.members.all()
+                    for member in squad.members.all()
                 ]
             }
 
-        # Consume required items if specified
-        if self.mission.required_items:
-            from game.models import Item
-            for item_req in self.mission.required_items:
-                if item_req.get('consumed', False):
-                    item_key = item_req['item_key']
-                    quantity = item_req.get('quantity', 1)
-
-                    items = Item.objects.filter(player=self.player, key=item_key)[:quantity]
-                    for item in items:
-                        item.delete()
-
-        self.save()
         return True, f"Mission accepted: {self.mission.name}"
 
+    def consume_required_items(self):
+        """Delete the player's items that the mission consumes on accept"""
+        from game.models import Item
+        for item_req in self.mission.required_items:
+            if item_req.get('consumed', False):
+                item_ids = Item.objects.filter(
+                    owner_player=self.player,
+                    key=item_req['item_key']
+                ).values_list('id', flat=True)[:item_req.get('quantity', 1)]
+                Item.objects.filter(id__in=list(item_ids)).delete()
+
     def start_act(self, act_number):
         """Begin a specific act"""
         if self.current_act >= act_number:
@@ -181,13 +207,8 @@ class PlayerMission(models.Model):
             return
 
         # Get objectives for current act
-        act_objectives = []
-        if self.current_act == 1:
-            act_objectives = self.mission.act1_objectives
-        elif self.current_act == 2:
-            act_objectives = self.mission.act2_objectives
-        elif self.current_act == 3:
-            act_objectives = self.mission.act3_objectives
+        act = self.mission.get_act(self.current_act)
+        act_objectives = act.objectives if act else []
 
         # Check if all required objectives are complete
         required_objectives = [obj for obj in act_objectives if obj.get('required', True)]
@@ -309,14 +330,15 @@ class PlayerMission(models.Model):
 
     def get_progress_summary(self):
         """Get a summary of mission progress"""
-        total_objectives = self.mission.get_total_objectives()
-        completed_count = sum(1 for completed in self.objectives_completed.values() if completed)
+        mission = self.mission
+        total_objectives = mission.total_objectives
+        completed_count = sum(map(bool, self.objectives_completed.values()))
 
         return {
-            'mission_name': self.mission.name,
+            'mission_name': mission.name,
             'status': self.get_status_display(),
             'current_act': self.current_act,
-            'act_name': self.mission.get_act_title(self.current_act) if self.current_act > 0 else 'Hook',
+            'act_name': mission.get_act_title(self.current_act) if self.current_act > 0 else 'Hook',
             'objectives_completed': completed_count,
             'total_objectives': total_objectives,
             'progress_percent': int((completed_count / total_objectives * 100)) if total_objectives > 0 else 0,
@@ -6,9 +6,24 @@ Based on the Forgotten Ruin lore.
 """
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
+from .versioned import VersionedModelMixin
 
+# Short forms shown in the squad roster
+RANK_ABBREVIATIONS = {
+    'staff_sergeant': 'SSG',
+    'sergeant': 'SGT',
+    'specialist': 'SPC',
+    'private_first_class': 'PFC',
+}
 
-class Squad(models.Model):
+WEAPON_SHORT_NAMES = {
+    'm4a1': 'M4A1 Carbine',
+    'm4a1_m320': 'M4A1 w/ M320 GL',
+    'm249': 'M249 LMG',
+}
+
+
+class Squad(VersionedModelMixin, models.Model):
     """
     A 9-person Ranger squad controlled by a player
 
@@ -101,6 +116,16 @@ class Squad(models.Model):
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Columns the cached character sheet shows for the squad
+    VERSIONED_FIELDS = frozenset({
+        'squad_name', 'callsign', 'morale', 'cohesion', 'total_kills', 'missions_completed',
+        'ammunition_556mm', 'ammunition_556mm_belt', 'grenades_frag', 'grenades_40mm', 'medkits',
+    })
+
+    version = models.PositiveIntegerField(
+        default=0,
+        help_text="Bumped when the squad or its members change"
+    )
 
     class Meta:
         ordering = ['-created_at']
@@ -256,6 +281,12 @@ class SquadMember(models.Model):
         help_text="Whether member is alive"
     )
 
+    health_percentage = models.FloatField(
+        default=100.0,
+        editable=False,
+        help_text="Health as a percentage of max health (kept in step by save())"
+    )
+
     # Status effects
     is_wounded = models.BooleanField(
         default=False,
@@ -365,31 +396,24 @@ class SquadMember(models.Model):
     def __str__(self):
         return f"{self.name} ({self.get_role_display()}) - {self.squad.squad_name}"
 
-    @property
-    def health_percentage(self):
-        """Get health as percentage"""
-        return (self.health / self.max_health) * 100 if self.max_health > 0 else 0
+    def save(self, *args, **kwargs):
+        """Recompute health_percentage whenever health or max_health is written"""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or not {'health', 'max_health'}.isdisjoint(update_fields):
+            self.health_percentage = (self.health / self.max_health) * 100 if self.max_health > 0 else 0.0
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'health_percentage'}
+        super().save(*args, **kwargs)
 
     @property
     def rank_display(self):
         """Get abbreviated rank"""
-        rank_abbrev = {
-            'staff_sergeant': 'SSG',
-            'sergeant': 'SGT',
-            'specialist': 'SPC',
-            'private_first_class': 'PFC',
-        }
-        return rank_abbrev.get(self.rank, self.rank)
+        return RANK_ABBREVIATIONS.get(self.rank, self.rank)
 
     @property
     def weapon_display(self):
         """Get weapon display name"""
-        weapons = {
-            'm4a1': 'M4A1 Carbine',
-            'm4a1_m320': 'M4A1 w/ M320 GL',
-            'm249': 'M249 LMG',
-        }
-        return weapons.get(self.primary_weapon, self.primary_weapon)
+        return WEAPON_SHORT_NAMES.get(self.primary_weapon, self.primary_weapon)
 
     def take_damage(self, amount):
         """Apply damage to squad member"""
@@ -0,0 +1,44 @@
+"""
+Versioned Model Mixin
+
+Row version counters for keying cached renders.
+"""
+from django.db import models
+
+
+class VersionedModelMixin:
+    """
+    Bumps the model's `version` column on every update
+
+    The increment is done in the database (F('version') + 1) so concurrent
+    saves can't both write the same version. Afterwards the attribute is
+    dropped from the instance and reloaded on next access.
+
+    Saves limited by update_fields to columns outside VERSIONED_FIELDS
+    (bookkeeping like last_action) leave the version alone. Full saves
+    always bump it.
+
+    Queryset update()/bulk_update() calls bypass save() and must bump the
+    version themselves, with bump_versions().
+    """
+    # Columns the cached render shows; None means every column
+    VERSIONED_FIELDS = None
+
+    @classmethod
+    def bump_versions(cls, pks):
+        """Bump the version of the rows with the given primary keys"""
+        cls.objects.filter(pk__in=pks).update(version=models.F('version') + 1)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if self._state.adding or (update_fields is not None and (
+            not update_fields
+            or (self.VERSIONED_FIELDS is not None and self.VERSIONED_FIELDS.isdisjoint(update_fields))
+        )):
+            return super().save(*args, **kwargs)
+
+        self.version = models.F('version') + 1
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version'}
+        super().save(*args, **kwargs)
+        del self.__dict__['version']
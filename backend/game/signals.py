@@ -3,10 +3,14 @@ Django Signals for Game Events
 
 Handles automatic actions triggered by model events.
 """
-from django.db.models.signals import post_save, pre_delete
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_init, post_save, post_delete, pre_delete
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from .models import Player
+from .cache import MissionCache
+from .models import Item, Mission, Player, PlayerQuest, Room, Squad, SquadMember
 
 User = get_user_model()
 
@@ -18,8 +22,12 @@ def create_player_for_user(sender, instance, created, **kwargs):
 
     Note: This signal is bypassed during user registration via the API,
     as the registration view handles player creation with custom character names.
+    The registration serializer sets `skip_player_creation` on the instance.
     """
     if created:
+        if getattr(instance, 'skip_player_creation', False):
+            return
+
         # Skip if this is being called from a signal (check if raw flag is set)
         # or if player creation should be handled elsewhere (like registration)
         if kwargs.get('raw', False):
@@ -27,19 +35,20 @@ def create_player_for_user(sender, instance, created, **kwargs):
 
         # Only create if player doesn't exist
         if not hasattr(instance, 'player'):
-            from .models import Room
             # Try to get starting room
             starting_room = Room.objects.filter(key='start').first()
 
             # This will be skipped if player is created by registration view
+            # Savepoint, so a clash leaves any surrounding transaction usable
             try:
-                Player.objects.create(
-                    user=instance,
-                    character_name=instance.username,
-                    location=starting_room,
-                    home=starting_room
-                )
-            except:
+                with transaction.atomic():
+                    Player.objects.create(
+                        user=instance,
+                        character_name=instance.username,
+                        location=starting_room,
+                        home=starting_room
+                    )
+            except IntegrityError:
                 # Player might have been created by another process (e.g., registration view)
                 pass
 
@@ -51,3 +60,82 @@ def cleanup_player_items(sender, instance, **kwargs):
     """
     # Delete all items owned by player
     instance.items.all().delete()
+
+
+@receiver([post_save, post_delete], sender=Room)
+def invalidate_starting_room_cache(sender, instance, **kwargs):
+    """
+    Drop the cached starting room id used by registration
+
+    Key must match accounts.views.STARTING_ROOM_CACHE_KEY.
+    """
+    if instance.key == 'start':
+        cache.delete('starting_room_id')
+
+
+@receiver([post_save, post_delete], sender=Mission)
+def invalidate_mission_catalog_version(sender, instance, **kwargs):
+    """
+    Drop the cached mission catalog version used for mission ETags
+
+    Key must match api.v1.mission_views.MISSION_CATALOG_VERSION_KEY.
+    """
+    cache.delete('mission_catalog_version')
+
+
+@receiver([post_save, post_delete], sender=Mission)
+def invalidate_mission_cache(sender, instance, **kwargs):
+    """
+    Drop the mission's catalog cache entry
+
+    Dropped again on commit so a reader that re-cached the old row while
+    the transaction was open (e.g. before its acts were written) does not
+    leave it stale.
+    """
+    MissionCache.invalidate(instance.id)
+    transaction.on_commit(lambda: MissionCache.invalidate(instance.id))
+
+
+@receiver(post_init, sender=Item)
+def remember_item_owner(sender, instance, **kwargs):
+    """
+    Remember the owner an item was loaded with
+
+    So moving an item out of a player's inventory bumps that player too.
+    Read from __dict__ so a deferred owner isn't loaded.
+    """
+    instance._loaded_owner_player_id = instance.__dict__.get('owner_player_id')
+
+
+@receiver([post_save, post_delete], sender=Item)
+def bump_item_owner_version(sender, instance, **kwargs):
+    """
+    Bump the version of the player(s) holding the item
+
+    Player.version keys the cached character sheet, which lists items.
+    """
+    owners = {instance.owner_player_id, getattr(instance, '_loaded_owner_player_id', None)} - {None}
+    if owners:
+        Player.bump_versions(owners)
+    instance._loaded_owner_player_id = instance.owner_player_id
+
+
+@receiver([post_save, post_delete], sender=PlayerQuest)
+def bump_quest_player_version(sender, instance, **kwargs):
+    """Bump the player's version; the character sheet lists active quests"""
+    Player.bump_versions([instance.player_id])
+
+
+@receiver([post_save, post_delete], sender=SquadMember)
+def bump_member_squad_version(sender, instance, origin=None, **kwargs):
+    """
+    Bump the squad's version; the character sheet renders every member
+
+    Squad is the member's only foreign key, so a delete that started
+    anywhere but a SquadMember (Squad.delete(), a Player cascade) is
+    taking the squad with it and there is nothing left to bump.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin is not None and origin_model is not SquadMember:
+        return
+    Squad.bump_versions([instance.squad_id])
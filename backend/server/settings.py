@@ -102,6 +102,25 @@ else:
         }
     }
 
+# Cache (Redis, shared by all workers: throttles, mission catalog, lookups)
+# Use in-memory cache for testing
+if os.environ.get('TESTING'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://{}:{}/1'.format(
+                os.environ.get('REDIS_HOST', '127.0.0.1'),
+                int(os.environ.get('REDIS_PORT', 6379))
+            ),
+        },
+    }
+
 # Channel Layers (Redis for WebSocket)
 # Use in-memory channel layer for testing
 if os.environ.get('TESTING'):
@@ -141,8 +160,9 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 # Password hashing
+# Argon2 first; PBKDF2 entries only verify (and upgrade) older hashes
 PASSWORD_HASHERS = [
-    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'accounts.hashers.TunedArgon2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2PasswordHasher',
     'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
 ]
@@ -168,14 +188,28 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'accounts.authentication.PlayerTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
+    # Per-IP limits for unauthenticated, hash-heavy endpoints (ScopedRateThrottle)
+    'DEFAULT_THROTTLE_RATES': {
+        'login': '10/min',
+        'password_reset': '5/min',
+    },
 }
 
 # CORS settings (adjust for production)
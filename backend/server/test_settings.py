@@ -42,6 +42,13 @@ else:
         }
     }
 
+# Use in-memory cache for testing
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
 # Use in-memory channel layer for testing
 CHANNEL_LAYERS = {
     'default': {
@@ -5,6 +5,7 @@ This file contains common fixtures used across all tests.
 """
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from rest_framework.authtoken.models import Token
 from game.models import Player, Room, Zone
@@ -156,6 +157,14 @@ def enable_db_access_for_all_tests(db):
     pass
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Reset the cache so throttles and cached lookups don't leak between tests"""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture(scope='function')
 def django_db_setup(django_db_setup, django_db_blocker):
     """Override database setup to handle async tests better"""
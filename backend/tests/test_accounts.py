@@ -87,6 +87,20 @@ class TestUserRegistration:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'email' in response.data
 
+    def test_duplicate_email_case_insensitive(self, api_client, user):
+        """REG-008: Test registration with duplicate email in different case"""
+        data = {
+            'username': 'differentuser',
+            'email': user.email.upper(),
+            'password': 'SecurePassword123!',
+            'password_confirm': 'SecurePassword123!'
+        }
+
+        response = api_client.post('/auth/register/', data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'email' in response.data
+
     def test_password_mismatch(self, api_client):
         """REG-004: Test registration with mismatched passwords"""
         data = {
@@ -148,6 +162,19 @@ class TestUserLogin:
         assert 'user' in response.data
         assert response.data['user']['username'] == user.username
 
+    def test_valid_login_json(self, api_client, user):
+        """LOG-007: Test login with a JSON body and JSON response"""
+        data = {
+            'username': user.username,
+            'password': 'TestPassword123!'
+        }
+
+        response = api_client.post('/auth/login/', data, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/json'
+        assert response.json()['user']['id'] == user.id
+
     def test_invalid_username(self, api_client):
         """LOG-002: Test login with invalid username"""
         data = {
@@ -172,6 +199,62 @@ class TestUserLogin:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert 'error' in response.data
 
+    def test_missing_credentials(self, api_client):
+        """Test login without a password"""
+        response = api_client.post('/auth/login/', {'username': 'someone'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'password' in response.data
+
+    def test_login_non_object_body(self, api_client):
+        """LOG-008: Test login with a JSON body that is not an object"""
+        response = api_client.post('/auth/login/', [1, 2], format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'non_field_errors': ['Invalid data. Expected a dictionary.']}
+
+    def test_login_reuses_token(self, authenticated_client, user):
+        """LOG-004: Test login returns the user's existing token"""
+        data = {
+            'username': user.username,
+            'password': 'TestPassword123!'
+        }
+
+        response = authenticated_client.post('/auth/login/', data)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['token'] == authenticated_client.token.key
+        assert Token.objects.filter(user=user).count() == 1
+
+    def test_token_only_login(self, api_client, user):
+        """LOG-006: Test token-only login skips the session"""
+        data = {
+            'username': user.username,
+            'password': 'TestPassword123!'
+        }
+
+        response = api_client.post('/auth/login/', data, HTTP_X_TOKEN_ONLY='true')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'token' in response.data
+        assert 'sessionid' not in response.cookies
+
+        user.refresh_from_db()
+        assert user.last_login is not None
+
+    def test_inactive_user_login(self, api_client, user):
+        """LOG-005: Test login for a deactivated account"""
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+        data = {
+            'username': user.username,
+            'password': 'TestPassword123!'
+        }
+
+        response = api_client.post('/auth/login/', data)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
 
 @pytest.mark.django_db
 class TestUserLogout:
@@ -196,6 +279,43 @@ class TestUserLogout:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+@pytest.mark.django_db
+class TestChangePassword:
+    """Tests for password change endpoint"""
+
+    def test_change_password(self, authenticated_client, user):
+        """PWD-005: Test password change rotates the auth token"""
+        old_key = authenticated_client.token.key
+        data = {
+            'old_password': 'TestPassword123!',
+            'new_password': 'NewSecurePassword123!',
+            'new_password_confirm': 'NewSecurePassword123!'
+        }
+
+        response = authenticated_client.post('/auth/change-password/', data)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['token'] != old_key
+        assert not Token.objects.filter(key=old_key).exists()
+        assert Token.objects.get(user=user).key == response.data['token']
+
+        user.refresh_from_db()
+        assert user.check_password('NewSecurePassword123!')
+
+    def test_change_password_wrong_old_password(self, authenticated_client):
+        """PWD-006: Test password change with wrong old password"""
+        data = {
+            'old_password': 'WrongPassword123!',
+            'new_password': 'NewSecurePassword123!',
+            'new_password_confirm': 'NewSecurePassword123!'
+        }
+
+        response = authenticated_client.post('/auth/change-password/', data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'error' in response.data
+
+
 @pytest.mark.django_db
 class TestPasswordReset:
     """Tests for password reset functionality"""
@@ -212,6 +332,13 @@ class TestPasswordReset:
         assert 'reset_token' in response.data
         assert 'uid' in response.data
 
+    def test_password_reset_email_case_insensitive(self, api_client, user):
+        """Test password reset matches email regardless of case"""
+        response = api_client.post('/auth/password-reset/', {'email': user.email.upper()})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'reset_token' in response.data
+
     def test_password_reset_invalid_email(self, api_client):
         """PWD-002: Test password reset with non-existent email"""
         data = {'email': 'nonexistent@example.com'}
@@ -222,6 +349,16 @@ class TestPasswordReset:
         assert response.status_code == status.HTTP_200_OK
         assert 'message' in response.data
 
+    def test_password_reset_throttled(self, api_client, user):
+        """PWD-007: Test repeated reset requests are rate limited"""
+        for _ in range(5):
+            response = api_client.post('/auth/password-reset/', {'email': user.email})
+            assert response.status_code == status.HTTP_200_OK
+
+        response = api_client.post('/auth/password-reset/', {'email': user.email})
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
     def test_password_reset_confirm_valid(self, api_client, user):
         """PWD-003: Test password reset confirmation with valid token"""
         # First request reset
@@ -263,6 +400,28 @@ class TestPasswordReset:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_password_reset_confirm_malformed_uid(self, api_client, user):
+        """PWD-008: Test password reset with a malformed uid"""
+        data = {
+            'uid': '../../not a uid',
+            'token': 'invalid-token-12345',
+            'new_password': 'NewSecurePassword123!',
+            'new_password_confirm': 'NewSecurePassword123!'
+        }
+
+        response = api_client.post('/auth/password-reset-confirm/', data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == 'Invalid reset link'
+
+    def test_password_reset_confirm_non_object_body(self, api_client):
+        """PWD-009: Test password reset confirm with a JSON body that is not an object"""
+        for body in ([1, 2], 'uid'):
+            response = api_client.post('/auth/password-reset-confirm/', body, format='json')
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.data['error'] == 'Invalid reset link'
+
 
 @pytest.mark.django_db
 class TestPlayerCreation:
@@ -359,6 +518,22 @@ class TestUserProfile:
         assert 'character_name' in response.data
         assert 'level' in response.data
 
+    def test_get_profile_not_modified(self, authenticated_client, player):
+        """Test conditional profile GET returns 304 when unchanged"""
+        response = authenticated_client.get('/auth/profile/')
+        etag = response['ETag']
+
+        response = authenticated_client.get('/auth/profile/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        player.level = 2
+        player.save(update_fields=['level'])
+        response = authenticated_client.get('/auth/profile/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['level'] == 2
+
     def test_update_profile(self, authenticated_client):
         """Test updating user profile"""
         data = {'email': 'newemail@example.com'}
@@ -373,3 +548,33 @@ class TestUserProfile:
         response = api_client.get('/auth/profile/')
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestTokenAuthentication:
+    """Tests for the player-aware token authenticator"""
+
+    def test_profile_single_query(self, authenticated_client, player, django_assert_num_queries):
+        """Test token, user and player are loaded in one query"""
+        with django_assert_num_queries(1):
+            response = authenticated_client.get('/auth/profile/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['character_name'] == player.character_name
+
+    def test_invalid_token(self, api_client):
+        """Test request with unknown token is rejected"""
+        api_client.credentials(HTTP_AUTHORIZATION='Token not-a-real-token')
+
+        response = api_client.get('/auth/profile/')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_inactive_user(self, authenticated_client, user):
+        """Test token of a deactivated user is rejected"""
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+
+        response = authenticated_client.get('/auth/profile/')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,300 @@
+"""
+Unit Tests for Game Data API
+
+Tests for the player, room, NPC and quest endpoints.
+"""
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers, status
+from rest_framework.test import APIClient
+from api.v1.serializers import (
+    SQUAD_MEMBER_COLUMNS, EquippedItemSerializer, ItemSerializer, NPCSerializer, PlayerQuestSerializer,
+    PlayerSerializer, QuestSerializer, RoomSerializer, SquadMemberSerializer, SquadSerializer, ZoneSerializer,
+    squad_member_row
+)
+from game.models import Exit, Item, NPC, Player, PlayerQuest, Quest, Squad, SquadMember, Zone
+
+
+def count_queries(client, url):
+    """Return (response, number of queries) for a GET request"""
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    return response, len(queries)
+
+
+@pytest.mark.django_db
+class TestEagerLoading:
+    """Test that list endpoints don't query once per row"""
+
+    def test_player_list_query_count(self, authenticated_client, player, create_player):
+        """API-001: Test player list joins the user for each username"""
+        Player.objects.update(is_online=True)
+        _, baseline = count_queries(authenticated_client, '/api/v1/players/')
+
+        for _ in range(3):
+            create_player()
+        Player.objects.update(is_online=True)
+        response, queries = count_queries(authenticated_client, '/api/v1/players/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == Player.objects.count()
+        assert all(row['username'] for row in response.data['results'])
+        assert queries == baseline
+
+    def test_room_list_query_count(self, authenticated_client, player, create_room):
+        """API-002: Test room list prefetches zones, exits and destinations"""
+        _, baseline = count_queries(authenticated_client, '/api/v1/rooms/')
+
+        rooms = [create_room(key=f'room_{i}', name=f'Room {i}') for i in range(3)]
+        for source, destination in zip(rooms, rooms[1:]):
+            Exit.objects.create(source=source, destination=destination, direction='north')
+        response, queries = count_queries(authenticated_client, '/api/v1/rooms/')
+
+        assert response.status_code == status.HTTP_200_OK
+        exits = [exit for row in response.data['results'] for exit in row['exits']]
+        assert {exit['destination_name'] for exit in exits} == {'Room 1', 'Room 2'}
+        # player_count is still counted per room
+        assert queries == baseline + 3
+
+    def test_npc_and_quest_list_query_count(self, authenticated_client, player, starting_room):
+        """API-003: Test NPC and quest lists join their related names"""
+        def make_rows(start, stop):
+            for i in range(start, stop):
+                npc = NPC.objects.create(key=f'npc_{i}', name=f'NPC {i}', description='', location=starting_room)
+                Quest.objects.create(key=f'quest_{i}', title=f'Quest {i}', description='', quest_giver=npc, objectives=[])
+
+        make_rows(0, 1)
+        _, npc_baseline = count_queries(authenticated_client, '/api/v1/npcs/')
+        _, quest_baseline = count_queries(authenticated_client, '/api/v1/quests/')
+
+        make_rows(1, 4)
+        cache.clear()  # the lists are response-cached
+        npc_response, npc_queries = count_queries(authenticated_client, '/api/v1/npcs/')
+        quest_response, quest_queries = count_queries(authenticated_client, '/api/v1/quests/')
+
+        assert npc_response.data['results'][0]['location_name'] == starting_room.name
+        assert quest_response.data['results'][0]['quest_giver_name'].startswith('NPC')
+        assert npc_queries == npc_baseline
+        assert quest_queries == quest_baseline
+
+    def test_reference_lists_are_cached(self, authenticated_client, player, starting_room):
+        """API-010: Test reference lists are served from the response cache to authenticated users only"""
+        npc = NPC.objects.create(key='npc', name='NPC', description='', location=starting_room)
+        Quest.objects.create(key='quest', title='Quest', description='', quest_giver=npc, objectives=[])
+
+        for url in ('/api/v1/npcs/', '/api/v1/quests/', '/api/v1/items/', '/api/v1/world/zones/'):
+            first, _ = count_queries(authenticated_client, url)
+            second, queries = count_queries(authenticated_client, url)
+
+            assert second.status_code == status.HTTP_200_OK
+            assert second.content == first.content
+            # Only the token lookup
+            assert queries == 1, url
+            assert APIClient().get(url).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_value_lists_match_serializers(self, authenticated_client, player, zone, create_zone, create_room):
+        """API-011: Test inventory and zone rows built with values() match the serializers"""
+        Item.objects.create(key='rifle', name='Rifle', description='', owner_player=player,
+                            stat_modifiers={'dexterity': 1}, weight=3.5)
+        create_room(key='second', name='Second')
+        create_zone(key='empty_zone', name='Empty Zone')
+
+        inventory = authenticated_client.get('/api/v1/players/inventory/').json()
+        zones = authenticated_client.get('/api/v1/world/zones/').json()
+
+        assert inventory == ItemSerializer(player.items.all(), many=True).data
+        assert zones == ZoneSerializer(Zone.objects.all(), many=True).data
+        assert sorted(z['room_count'] for z in zones) == [0, 2]
+
+    def test_available_quests_paginated_and_cached(self, authenticated_client, player, starting_room):
+        """API-012: Test available quests are filtered by level, paginated and cached per level"""
+        npc = NPC.objects.create(key='npc', name='NPC', description='', location=starting_room)
+        for level in (1, 2, 5):
+            Quest.objects.create(key=f'quest_{level}', title=f'Quest {level}', description='',
+                                 quest_giver=npc, objectives=[], required_level=level)
+        player.level = 2
+        player.save()
+
+        first, _ = count_queries(authenticated_client, '/api/v1/quests/available/')
+        second, queries = count_queries(authenticated_client, '/api/v1/quests/available/')
+
+        assert first.status_code == status.HTTP_200_OK
+        assert first.data['count'] == 2
+        assert [q['key'] for q in first.data['results']] == ['quest_1', 'quest_2']
+        assert second.data == first.data
+        # Only the token lookup
+        assert queries == 1
+
+
+@pytest.mark.django_db
+class TestCharacterSheet:
+    """Test the character sheet endpoint"""
+
+    def test_character_sheet_partitions_items(self, authenticated_client, player, starting_room):
+        """API-004: Test items and active quests are each loaded in one query"""
+        Item.objects.create(key='rifle', name='Rifle', description='', owner_player=player,
+                            item_type='weapon', is_equipped=True, equipment_slot='weapon')
+        Item.objects.create(key='ration', name='Ration', description='', owner_player=player)
+        giver = NPC.objects.create(key='giver', name='Giver', description='', location=starting_room)
+        for key, quest_status in (('active_quest', 'active'), ('done_quest', 'completed')):
+            quest = Quest.objects.create(key=key, title=key.replace('_', ' ').title(), description='',
+                                         quest_giver=giver, objectives=[])
+            PlayerQuest.objects.create(player=player, quest=quest, status=quest_status)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get('/api/v1/character/me/')
+
+        data = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        assert [item['name'] for item in data['equipped_items']] == ['Rifle']
+        assert [item['name'] for item in data['inventory']] == ['Ration']
+        assert [quest['title'] for quest in data['active_quests']] == ['Active Quest']
+        assert data['squad'] is None
+        assert data['has_squad'] is False
+        for table in ('game_item', 'game_playerquest'):
+            assert len([q for q in queries.captured_queries if f'FROM "{table}"' in q['sql']]) == 1
+
+    def test_character_sheet_nested_squad(self, authenticated_client, player):
+        """API-005: Test repeated requests render the nested squad the same way"""
+        squad = Squad.objects.create(player=player, squad_name='Test Squad')
+        for name, fire_team, role in (('SSG Lead', 'hq', 'squad_leader'), ('SGT Alpha', 'alpha', 'team_leader')):
+            SquadMember.objects.create(squad=squad, name=name, rank='sergeant', fire_team=fire_team,
+                                       role=role, primary_weapon='m4a1')
+
+        first = authenticated_client.get('/api/v1/character/me/').json()
+        second = authenticated_client.get('/api/v1/character/me/').json()
+
+        assert first == second
+        assert first['has_squad'] is True
+        assert first['squad']['squad_leader']['name'] == 'SSG Lead'
+        assert [member['name'] for member in first['squad']['alpha_team']] == ['SGT Alpha']
+        assert first['squad']['total_members'] == 2
+        assert first['squad']['alive_members_count'] == 2
+
+        # The squad row, then its members in one values() query
+        squad.members.filter(role='team_leader').update(is_alive=False)
+        with CaptureQueriesContext(connection) as queries:
+            data = SquadSerializer(Squad.objects.get(pk=squad.pk)).data
+        assert (data['total_members'], data['alive_members_count'], data['casualty_count']) == (2, 1, 1)
+        assert data['average_health'] == 100
+        assert len(queries) == 2
+
+    def test_character_sheet_cache_follows_versions(self, authenticated_client, player):
+        """API-008: Test cached sheets are reused until the player, an item or a squad member changes"""
+        squad = Squad.objects.create(player=player, squad_name='Test Squad')
+        member = SquadMember.objects.create(squad=squad, name='SGT Alpha', rank='sergeant', fire_team='alpha',
+                                            role='team_leader', primary_weapon='m4a1')
+        url = '/api/v1/character/me/'
+        authenticated_client.get(url)
+
+        # A hit is the token lookup and the version lookup, nothing else
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/json'
+        assert len(queries) == 2
+
+        player.health = 50
+        player.save(update_fields=['health'])
+        assert authenticated_client.get(url).json()['health'] == 50
+
+        item = Item.objects.create(key='ration', name='Ration', description='', owner_player=player)
+        assert [i['name'] for i in authenticated_client.get(url).json()['inventory']] == ['Ration']
+        item.owner_player = None
+        item.save()
+        assert authenticated_client.get(url).json()['inventory'] == []
+
+        member.name = 'SGT Renamed'
+        member.save()
+        assert authenticated_client.get(url).json()['squad']['alpha_team'][0]['name'] == 'SGT Renamed'
+
+        response = authenticated_client.patch('/api/v1/squad/customize/', {'callsign': 'Havoc'}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert authenticated_client.get(url).json()['squad']['callsign'] == 'Havoc'
+
+    def test_bookkeeping_saves_keep_version(self, player):
+        """API-013: Test saves of fields the character sheet doesn't show leave the version alone"""
+        version = Player.objects.get(pk=player.pk).version
+
+        player.save(update_fields=['last_action'])
+        player.save(update_fields=['is_online', 'last_login'])
+        assert Player.objects.get(pk=player.pk).version == version
+
+        player.save(update_fields=['last_action', 'experience'])
+        assert Player.objects.get(pk=player.pk).version == version + 1
+
+    def test_squad_delete_skips_member_bumps(self, player):
+        """API-014: Test deleting a squad doesn't bump its version once per member"""
+        squad = Squad.objects.create(player=player, squad_name='Test Squad')
+        members = [
+            SquadMember.objects.create(squad=squad, name=f'PFC {i}', rank='private_first_class',
+                                       fire_team='alpha', role='rifleman', primary_weapon='m4a1')
+            for i in range(3)
+        ]
+
+        version = Squad.objects.get(pk=squad.pk).version
+        members[0].delete()
+        SquadMember.objects.filter(pk=members[1].pk).delete()
+        assert Squad.objects.get(pk=squad.pk).version == version + 2
+
+        with CaptureQueriesContext(connection) as queries:
+            squad.delete()
+        assert not any(q['sql'].startswith('UPDATE') for q in queries.captured_queries)
+
+
+class TestSerializers:
+    """Test serializer fast paths"""
+
+    def test_instances_get_their_own_bound_fields(self):
+        """API-006: Test cached fields are copied and bound per serializer instance"""
+        first, second = PlayerSerializer(), PlayerSerializer()
+
+        assert list(first.fields) == list(second.fields)
+        assert first.fields['username'] is not second.fields['username']
+        assert first.fields['username'].parent is first
+        assert second.fields['username'].parent is second
+        assert second.fields['username'].source_attrs == ['user', 'username']
+
+    def test_compiled_representation_matches_fields(self, player, starting_room, create_room):
+        """API-007: Test generated to_representation output matches DRF's field-by-field output"""
+        squad = Squad.objects.create(player=player, squad_name='Test Squad')
+        member = SquadMember.objects.create(squad=squad, name='SPC Medic', rank='specialist', fire_team='bravo',
+                                            role='rifleman', primary_weapon='m4a1', secondary_duty='medic')
+        Exit.objects.create(source=starting_room, destination=create_room(key='north', name='North'), direction='north')
+        npc = NPC.objects.create(key='npc', name='NPC', description='', location=starting_room)
+        quest = Quest.objects.create(key='quest', title='Quest', description='', quest_giver=npc, objectives=[])
+        item = Item.objects.create(key='rifle', name='Rifle', description='', owner_player=player)
+        player_quest = PlayerQuest.objects.create(player=player, quest=quest, status='active')
+        # A dotted source with a missing link renders as None
+        unsaved_quest = Quest(key='orphan', title='Orphan', description='', objectives=[])
+
+        cases = [
+            (PlayerSerializer, player), (SquadMemberSerializer, member), (RoomSerializer, starting_room),
+            (NPCSerializer, npc), (QuestSerializer, quest), (ItemSerializer, item),
+            (EquippedItemSerializer, item), (PlayerQuestSerializer, player_quest), (QuestSerializer, unsaved_quest),
+        ]
+        for serializer_class, instance in cases:
+            serializer = serializer_class()
+            fast = serializer.to_representation(instance)
+            slow = serializers.ModelSerializer.to_representation(serializer, instance)
+            assert list(fast.items()) == list(slow.items()), serializer_class.__name__
+
+    def test_squad_member_rows_match_serializer(self, player):
+        """API-009: Test roster rows built from values() match SquadMemberSerializer"""
+        squad = Squad.objects.create(player=player, squad_name='Test Squad')
+        SquadMember.objects.create(squad=squad, name='SSG Lead', rank='staff_sergeant', fire_team='hq',
+                                   role='squad_leader', primary_weapon='m4a1')
+        SquadMember.objects.create(squad=squad, name='SPC Gunner', rank='specialist', fire_team='bravo',
+                                   role='grenadier', primary_weapon='m4a1_m320', secondary_duty='engineer',
+                                   health=0, max_health=0, is_alive=False)
+
+        rows = [squad_member_row(values) for values in squad.members.values(*SQUAD_MEMBER_COLUMNS)]
+        expected = [SquadMemberSerializer(member).data for member in squad.members.all()]
+        assert [list(row.items()) for row in rows] == [list(data.items()) for data in expected]
+        for row, member in zip(rows, squad.members.all()):
+            assert row['role_display'] == member.get_role_display()
+            assert row['fire_team_display'] == member.get_fire_team_display()
+            assert row['secondary_duty_display'] == member.get_secondary_duty_display()
+
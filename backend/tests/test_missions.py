@@ -0,0 +1,616 @@
+"""
+Unit Tests for Mission API
+
+Tests for mission listing, detail, acceptance, and progress endpoints.
+"""
+from datetime import timedelta
+
+import pytest
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from game.models import Item, Mission, MissionAct, MissionEvent, Player, PlayerMission, NPC, Squad, SquadMember
+
+
+@pytest.fixture
+def squad(player):
+    """Give the test player a squad with its leader"""
+    squad = Squad.objects.create(player=player, squad_name='Test Squad')
+    SquadMember.objects.create(
+        squad=squad,
+        name='SSG Test',
+        rank='staff_sergeant',
+        fire_team='hq',
+        role='squad_leader',
+        primary_weapon='m4a1'
+    )
+    return squad
+
+
+@pytest.fixture
+def npc(starting_room):
+    """Create a mission giver"""
+    return NPC.objects.create(
+        key='test_giver',
+        name='Test Giver',
+        description='Hands out missions.',
+        location=starting_room
+    )
+
+
+@pytest.fixture
+def create_mission(db):
+    """Factory fixture for creating missions"""
+    def make_mission(key='test_mission', **kwargs):
+        defaults = {
+            'name': key.replace('_', ' ').title(),
+            'hook_title': 'A Hook',
+            'hook_description': 'Something is wrong.',
+            'act1_description': 'Setup',
+            'act1_objectives': [{'key': f'{key}_a1', 'description': 'Do it', 'required': True}],
+            'act2_description': 'Confrontation',
+            'act2_objectives': [{'key': f'{key}_a2', 'description': 'Do more', 'required': True}],
+            'act3_description': 'Climax',
+            'act3_objectives': [{'key': f'{key}_a3', 'description': 'Finish', 'required': True}],
+            'conclusion_success': 'Well done.',
+        }
+        defaults.update(kwargs)
+        return Mission.create_with_acts(key=key, **defaults)
+    return make_mission
+
+
+@pytest.mark.django_db
+class TestMissionList:
+    """Tests for the mission list endpoint"""
+
+    def test_list_categorizes_missions(self, authenticated_client, player, squad, npc, create_mission):
+        """MIS-001: Test missions are split into available, active and completed"""
+        available = create_mission('open_mission', given_by_npc=npc)
+        active = create_mission('active_mission')
+        done = create_mission('done_mission')
+        create_mission('locked_mission', required_level=50)
+        PlayerMission.objects.create(player=player, mission=active, status='active')
+        PlayerMission.objects.create(player=player, mission=done, status='completed', success_level='full')
+
+        response = authenticated_client.get('/api/v1/missions/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [m['key'] for m in response.data['available']] == [available.key]
+        assert response.data['available'][0]['given_by'] == 'Test Giver'
+        assert [m['key'] for m in response.data['active']] == [active.key]
+        assert response.data['active'][0]['progress']['total_objectives'] == 3
+        assert [m['key'] for m in response.data['completed']] == [done.key]
+        assert response.data['completed'][0]['success_level'] == 'full'
+
+    def test_list_query_count_independent_of_catalog(self, authenticated_client, player, squad, create_mission):
+        """MIS-002: Test listing does not issue queries per mission"""
+        create_mission('first_mission')
+        with CaptureQueriesContext(connection) as one:
+            authenticated_client.get('/api/v1/missions/')
+
+        for i in range(5):
+            create_mission(f'extra_mission_{i}', given_by_npc=None)
+        with CaptureQueriesContext(connection) as many:
+            response = authenticated_client.get('/api/v1/missions/')
+
+        assert len(response.data['available']) == 6
+        assert len(many) == len(one)
+        # Narrative text stays deferred in the listing
+        assert not any('hook_description' in q['sql'] for q in many.captured_queries)
+
+    def test_list_without_squad(self, authenticated_client, player, create_mission):
+        """MIS-003: Test players without a squad can list solo missions"""
+        create_mission('solo_mission')
+        create_mission('team_mission', required_squad_size=4)
+
+        response = authenticated_client.get('/api/v1/missions/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [m['key'] for m in response.data['available']] == ['solo_mission']
+
+    def test_list_prerequisites(self, authenticated_client, player, squad, create_mission):
+        """MIS-004: Test prerequisite missions gate availability"""
+        first = create_mission('first_mission')
+        create_mission('second_mission', required_missions_completed=['first_mission'])
+
+        response = authenticated_client.get('/api/v1/missions/')
+        assert [m['key'] for m in response.data['available']] == ['first_mission']
+
+        PlayerMission.objects.create(player=player, mission=first, status='completed')
+        response = authenticated_client.get('/api/v1/missions/')
+        assert [m['key'] for m in response.data['available']] == ['second_mission']
+
+    def test_can_player_start_messages(self, player, squad, create_mission):
+        """MIS-005: Test single-mission requirement messages"""
+        first = create_mission('first_mission')
+        second = create_mission('second_mission', required_missions_completed=['first_mission'])
+        gated = create_mission('gated_mission', required_items=[{'item_key': 'keycard', 'quantity': 1}])
+
+        assert second.can_player_start(player) == (False, 'Requires completion of: First Mission')
+        assert gated.can_player_start(player) == (False, 'Requires 1x keycard')
+        assert first.can_player_start(player) == (True, 'Requirements met')
+
+    def test_list_progress_mid_mission(self, authenticated_client, player, squad, create_mission):
+        """MIS-006: Test progress summary for a mission past the hook"""
+        mission = create_mission('running_mission', act2_title='The Push')
+        PlayerMission.objects.create(
+            player=player, mission=mission, status='in_progress', current_act=2,
+            objectives_completed={'running_mission_a1': True}
+        )
+
+        response = authenticated_client.get('/api/v1/missions/')
+
+        progress = response.data['active'][0]['progress']
+        assert progress['act_name'] == 'The Push'
+        assert progress['objectives_completed'] == 1
+        assert progress['progress_percent'] == 33
+
+
+@pytest.mark.django_db
+class TestMissionDetail:
+    """Tests for the mission detail endpoint"""
+
+    def test_detail_shows_reached_acts(self, authenticated_client, player, squad, create_mission):
+        """MIS-007: Test detail lists acts up to the current act with objective status"""
+        mission = create_mission('running_mission')
+        PlayerMission.objects.create(
+            player=player, mission=mission, status='in_progress', current_act=2,
+            objectives_completed={'running_mission_a1': True}
+        )
+
+        response = authenticated_client.get('/api/v1/missions/running_mission/')
+
+        assert response.status_code == status.HTTP_200_OK
+        acts = response.data['acts']
+        assert [a['act'] for a in acts] == [1, 2]
+        assert acts[0]['title'] == 'Setup'
+        assert acts[0]['objectives'][0]['completed'] is True
+        assert acts[1]['objectives'][0]['completed'] is False
+        # The stored objective definitions are not modified
+        assert 'completed' not in MissionAct.objects.get(mission=mission, act_number=1).objectives[0]
+
+    def test_detail_hides_acts_before_accept(self, authenticated_client, player, squad, create_mission):
+        """MIS-008: Test acts are hidden until the mission is accepted"""
+        create_mission('new_mission')
+
+        response = authenticated_client.get('/api/v1/missions/new_mission/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['acts'] is None
+        assert response.data['can_start'] is True
+
+
+@pytest.mark.django_db
+class TestMissionCreatePrivate:
+    """Tests for the private mission endpoint"""
+
+    def test_create_private_with_events(self, authenticated_client, player):
+        """MIS-009: Test a private mission is created with its acts and events"""
+        data = {
+            'name': 'Solo Training',
+            'hook_title': 'Train',
+            'hook_description': 'Time to train.',
+            'act1_description': 'Warm up',
+            'act2_description': 'Spar',
+            'act3_description': 'Cool down',
+            'conclusion_success': 'Done.',
+            'events': [
+                {'key': 'ambush', 'name': 'Ambush', 'event_type': 'ambush', 'act': 2,
+                 'trigger_type': 'manual', 'description': 'Orcs!'},
+                {'key': 'rescue', 'name': 'Rescue', 'event_type': 'rescue', 'act': 3,
+                 'trigger_type': 'manual', 'description': 'Help arrives.'},
+            ],
+        }
+
+        response = authenticated_client.post('/api/v1/missions/create-private/', data, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        mission = Mission.objects.get(key=response.data['mission']['key'])
+        assert mission.is_public is False
+        assert mission.acts.count() == 3
+        assert sorted(mission.events.values_list('key', flat=True)) == ['ambush', 'rescue']
+
+    def test_create_private_rolls_back_on_bad_event(self, authenticated_client, player):
+        """MIS-010: Test a failing event insert leaves no mission behind"""
+        data = {
+            'name': 'Broken',
+            'hook_title': 'Oops',
+            'hook_description': 'Oops.',
+            'act1_description': 'a',
+            'act2_description': 'b',
+            'act3_description': 'c',
+            'conclusion_success': 'Done.',
+            'events': [{'key': 'bad', 'name': 'Bad', 'act': 1, 'description': None}],
+        }
+
+        response = authenticated_client.post('/api/v1/missions/create-private/', data, format='json')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Mission.objects.filter(name='Broken').exists()
+
+
+@pytest.mark.django_db
+class TestMissionAccept:
+    """Tests for accepting missions"""
+
+    def test_accept_already_in_progress(self, authenticated_client, player, squad, create_mission):
+        """MIS-011: Test a running mission cannot be accepted again"""
+        mission = create_mission('running_mission')
+        PlayerMission.objects.create(player=player, mission=mission, status='in_progress')
+
+        response = authenticated_client.post('/api/v1/missions/running_mission/accept/')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == 'Mission already in progress'
+        assert PlayerMission.objects.filter(player=player, mission=mission).count() == 1
+
+    def test_one_running_instance_per_player(self, player, create_mission):
+        """MIS-012: Test the database allows only one running instance per mission"""
+        mission = create_mission('running_mission', is_repeatable=True)
+        PlayerMission.objects.create(player=player, mission=mission, status='completed')
+        PlayerMission.objects.create(player=player, mission=mission, status='active')
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            PlayerMission.objects.create(player=player, mission=mission, status='in_progress')
+
+    def test_accept_mission(self, authenticated_client, player, squad, create_mission):
+        """MIS-013: Test accepting a mission starts it and snapshots the squad"""
+        create_mission('new_mission', time_limit=3600)
+
+        response = authenticated_client.post('/api/v1/missions/new_mission/accept/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['act1']['title'] == 'Setup'
+        player_mission = PlayerMission.objects.get(id=response.data['player_mission_id'])
+        assert player_mission.status == 'active'
+        assert player_mission.time_limit_expires is not None
+        assert player_mission.squad_snapshot['squad_name'] == 'Test Squad'
+        assert player_mission.squad_snapshot['members'][0]['rank'] == 'staff_sergeant'
+
+    def test_accept_failure_writes_nothing(self, authenticated_client, player, create_mission):
+        """MIS-014: Test a rejected accept leaves no player mission behind"""
+        create_mission('hard_mission', required_level=50)
+
+        response = authenticated_client.post('/api/v1/missions/hard_mission/accept/')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == 'Requires level 50'
+        assert not PlayerMission.objects.filter(player=player).exists()
+
+
+@pytest.mark.django_db
+class TestMissionChoice:
+    """Tests for mission event choices"""
+
+    @pytest.fixture
+    def choice_event(self, player, create_mission):
+        mission = create_mission('choice_mission')
+        player_mission = PlayerMission.objects.create(player=player, mission=mission, status='active')
+        MissionEvent.objects.create(
+            mission=mission, key='fork', name='Fork', event_type='choice', act=1,
+            trigger_type='manual', description='Left or right?',
+            choices=[{'text': 'Go left', 'outcome': 'left'}, {'text': 'Go right', 'outcome': 'right'}],
+            outcomes={'right': {'description': 'You find a cache.', 'effects': {'ammo': 50}}}
+        )
+        return player_mission
+
+    def test_make_choice(self, authenticated_client, choice_event):
+        """MIS-015: Test a valid choice returns its outcome and is recorded"""
+        url = f'/api/v1/player-missions/{choice_event.id}/events/fork/choice/'
+
+        response = authenticated_client.post(url, {'choice': 'Go right'}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['outcome']['description'] == 'You find a cache.'
+        choice_event.refresh_from_db()
+        assert choice_event.choices_made[0]['outcome'] == 'right'
+
+    def test_invalid_choice(self, authenticated_client, choice_event):
+        """MIS-016: Test unknown or malformed choices are rejected"""
+        url = f'/api/v1/player-missions/{choice_event.id}/events/fork/choice/'
+
+        for choice in ('Go up', ['Go left']):
+            response = authenticated_client.post(url, {'choice': choice}, format='json')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.data['error'] == 'Invalid choice'
+
+
+@pytest.mark.django_db
+class TestMissionConditionalGet:
+    """Tests for mission list/detail ETags"""
+
+    def test_list_not_modified(self, authenticated_client, player, squad, create_mission):
+        """MIS-017: Test an unchanged mission list revalidates with 304"""
+        create_mission('open_mission')
+        response = authenticated_client.get('/api/v1/missions/')
+        etag = response['ETag']
+
+        response = authenticated_client.get('/api/v1/missions/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_changes_with_player_state(self, authenticated_client, player, squad, create_mission):
+        """MIS-018: Test catalog and player mission changes produce a new ETag"""
+        mission = create_mission('open_mission')
+        etag = authenticated_client.get('/api/v1/missions/')['ETag']
+
+        create_mission('new_mission')
+        response = authenticated_client.get('/api/v1/missions/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response['ETag']
+
+        PlayerMission.objects.create(player=player, mission=mission, status='active')
+        response = authenticated_client.get('/api/v1/missions/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert [m['key'] for m in response.data['active']] == ['open_mission']
+
+    def test_detail_etag_is_per_mission(self, authenticated_client, player, squad, create_mission):
+        """MIS-019: Test one mission's ETag does not validate another"""
+        create_mission('first_mission')
+        create_mission('second_mission')
+        etag = authenticated_client.get('/api/v1/missions/first_mission/')['ETag']
+
+        response = authenticated_client.get('/api/v1/missions/second_mission/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_etag_follows_items_and_squad(self, authenticated_client, player, squad, create_mission):
+        """MIS-033: Test swapping an item or losing a squad member produces a new ETag"""
+        create_mission('gated_mission', required_items=[{'item_key': 'keycard', 'quantity': 1}])
+        decoy = Item.objects.create(key='ration', name='Ration', description='', owner_player=player)
+        etag = authenticated_client.get('/api/v1/missions/')['ETag']
+
+        # Same item count, different items
+        decoy.delete()
+        Item.objects.create(key='keycard', name='Keycard', description='', owner_player=player)
+        response = authenticated_client.get('/api/v1/missions/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert [m['key'] for m in response.data['available']] == ['gated_mission']
+        etag = response['ETag']
+
+        squad.members.get().delete()
+        response = authenticated_client.get('/api/v1/missions/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestMissionCache:
+    """Tests for the mission catalog cache"""
+
+    def test_list_served_from_cache(self, authenticated_client, player, squad, create_mission):
+        """MIS-020: Test a warm catalog cache skips loading mission rows"""
+        create_mission('open_mission')
+        authenticated_client.get('/api/v1/missions/')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get('/api/v1/missions/')
+
+        assert [m['key'] for m in response.data['available']] == ['open_mission']
+        assert not any('game_missionact' in q['sql'] for q in queries.captured_queries)
+
+    def test_mission_save_invalidates_cache(self, authenticated_client, player, squad, create_mission):
+        """MIS-021: Test edits to a mission show up in the next listing"""
+        mission = create_mission('open_mission')
+        authenticated_client.get('/api/v1/missions/')
+
+        mission.name = 'Renamed Mission'
+        mission.save()
+        response = authenticated_client.get('/api/v1/missions/')
+
+        assert response.data['available'][0]['name'] == 'Renamed Mission'
+
+
+@pytest.mark.django_db
+class TestMissionPlayerLookup:
+    """Tests for resolving the requesting player"""
+
+    def test_player_from_token_lookup(self, authenticated_client, player, squad, create_mission):
+        """MIS-022: Test mission views reuse the player loaded with the token"""
+        mission = create_mission('running_mission')
+        player_mission = PlayerMission.objects.create(player=player, mission=mission, status='active')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.post(f'/api/v1/player-missions/{player_mission.id}/abandon/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any(q['sql'].startswith('SELECT') and 'FROM "game_player"' in q['sql']
+                       for q in queries.captured_queries)
+
+    def test_user_without_player(self, authenticated_client):
+        """MIS-023: Test a user without a player gets a 404"""
+        Player.objects.filter(user=authenticated_client.user).delete()
+
+        response = authenticated_client.get('/api/v1/missions/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestMissionListBuckets:
+    """Tests for the single-bucket, cursor-paginated mission list"""
+
+    def test_available_bucket_pages(self, authenticated_client, player, squad, create_mission):
+        """MIS-024: Test ?status=available pages through startable missions by level"""
+        for i in range(5):
+            create_mission(f'open_{i}')
+        create_mission('locked_mission', required_level=50)
+        active = create_mission('active_mission')
+        PlayerMission.objects.create(player=player, mission=active, status='active')
+
+        response = authenticated_client.get('/api/v1/missions/', {'status': 'available', 'page_size': 3})
+        assert response.status_code == status.HTTP_200_OK
+        keys = [m['key'] for m in response.data['results']]
+        assert len(keys) == 3
+        assert all(m['can_start'] for m in response.data['results'])
+
+        response = authenticated_client.get(response.data['next'])
+        keys += [m['key'] for m in response.data['results']]
+        assert response.data['next'] is None
+        assert sorted(keys) == [f'open_{i}' for i in range(5)]
+
+    def test_active_and_completed_buckets(self, authenticated_client, player, squad, create_mission):
+        """MIS-025: Test ?status=active and ?status=completed list only the player's missions"""
+        active = create_mission('active_mission')
+        done = create_mission('done_mission')
+        create_mission('other_mission')
+        pm = PlayerMission.objects.create(player=player, mission=active, status='in_progress')
+        PlayerMission.objects.create(player=player, mission=done, status='completed', success_level='partial')
+
+        response = authenticated_client.get('/api/v1/missions/', {'status': 'active'})
+        assert [m['player_mission_id'] for m in response.data['results']] == [pm.id]
+        # UUIDs are rendered as strings
+        assert response.json()['results'][0]['player_mission_id'] == str(pm.id)
+        assert response.data['results'][0]['progress']['total_objectives'] == 3
+
+        response = authenticated_client.get('/api/v1/missions/', {'status': 'completed'})
+        assert [m['key'] for m in response.data['results']] == [done.key]
+        assert response.data['results'][0]['success_level'] == 'partial'
+
+    def test_available_bucket_matches_full_list(self, authenticated_client, player, squad, create_mission):
+        """MIS-034: Test completed repeatable missions land in the same bucket as in the full list"""
+        now = timezone.now()
+        done = create_mission('done_repeatable', is_repeatable=True)
+        cooling = create_mission('cooling_repeatable', is_repeatable=True, cooldown_hours=24)
+        ready = create_mission('ready_repeatable', is_repeatable=True, cooldown_hours=24)
+        PlayerMission.objects.create(player=player, mission=done, status='completed', completed_at=now)
+        # Replays abandoned after the last completion fall back to the cooldown rule
+        for mission, completed_at in ((cooling, now), (ready, now - timedelta(hours=48))):
+            PlayerMission.objects.create(
+                player=player, mission=mission, status='completed',
+                started_at=completed_at - timedelta(hours=1), completed_at=completed_at
+            )
+            PlayerMission.objects.create(
+                player=player, mission=mission, status='abandoned', started_at=now + timedelta(minutes=1)
+            )
+
+        full = authenticated_client.get('/api/v1/missions/').data
+        response = authenticated_client.get('/api/v1/missions/', {'status': 'available'})
+
+        assert [m['key'] for m in response.data['results']] == ['ready_repeatable']
+        assert [m['key'] for m in full['available']] == ['ready_repeatable']
+        assert [m['key'] for m in full['completed']] == ['done_repeatable']
+
+    def test_unknown_bucket(self, authenticated_client, player):
+        """MIS-026: Test an unknown status is rejected"""
+        response = authenticated_client.get('/api/v1/missions/', {'status': 'failed'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'error' in response.data
+
+    def test_buckets_skip_narrative_columns(self, authenticated_client, player, npc, create_mission):
+        """MIS-031: Test active and completed rows are loaded without the mission narrative"""
+        for i in range(3):
+            mission = create_mission(f'mission_{i}', given_by_npc=npc)
+            PlayerMission.objects.create(player=player, mission=mission, status='in_progress', current_act=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get('/api/v1/missions/', {'status': 'active'})
+
+        assert len(response.data['results']) == 3
+        assert response.data['results'][0]['given_by'] == 'Test Giver'
+        assert response.data['results'][0]['progress']['act_name'] == 'Setup'
+        sql = ' '.join(query['sql'] for query in queries.captured_queries)
+        assert 'hook_description' not in sql
+        assert 'conclusion_success' not in sql
+        assert '"game_missionact"."description"' not in sql
+
+
+@pytest.mark.django_db
+class TestMissionObjectiveBatch:
+    """Tests for the batch objective completion endpoint"""
+
+    def test_batch_completes_objectives(self, authenticated_client, player, squad, create_player, create_mission):
+        """MIS-027: Test a batch completes objectives in order with per-entry results"""
+        mission = create_mission('batch_mission')
+        pm = PlayerMission.objects.create(player=player, mission=mission, status='in_progress', current_act=1)
+        # Another player's mission is reported as not found
+        other = PlayerMission.objects.create(player=create_player(), mission=mission, status='in_progress')
+
+        response = authenticated_client.post('/api/v1/missions/batch/', [
+            {'player_mission_id': str(pm.id), 'objective_key': 'batch_mission_a1'},
+            {'player_mission_id': str(pm.id), 'objective_key': 'batch_mission_a2'},
+            {'player_mission_id': str(pm.id), 'objective_key': 'batch_mission_a1'},
+            {'player_mission_id': str(other.id), 'objective_key': 'batch_mission_a1'},
+        ], format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [r['ok'] for r in response.data] == [True, True, False, False]
+        assert response.data[1]['progress']['objectives_completed'] == 2
+        assert response.data[2]['error'] == 'Objective already completed'
+        assert response.data[3]['error'] == 'Player mission not found'
+        pm.refresh_from_db()
+        assert pm.current_act == 3
+        assert pm.objectives_completed == {'batch_mission_a1': True, 'batch_mission_a2': True}
+
+    def test_batch_rejects_malformed_body(self, authenticated_client, player):
+        """MIS-028: Test malformed batches are rejected"""
+        bodies = [
+            [],
+            {'player_mission_id': 'x'},
+            [{'objective_key': 'a'}],
+            [{'player_mission_id': 'nope', 'objective_key': 'a'}],
+        ]
+        for body in bodies:
+            response = authenticated_client.post('/api/v1/missions/batch/', body, format='json')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestMissionSeeding:
+    """Tests for writing seed missions in bulk"""
+
+    def test_bulk_update_or_create_with_acts(self, create_mission):
+        """MIS-029: Test missions and their acts are upserted by key in a fixed number of queries"""
+        existing = create_mission('existing_mission')
+        rows = [
+            {'key': 'existing_mission', 'name': 'Renamed', 'act1_description': 'New setup'},
+            {'key': 'new_mission', 'name': 'New', 'act2_objectives': [{'key': 'b', 'required': True}]},
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            missions = Mission.bulk_update_or_create_with_acts(rows)
+
+        # Upsert missions, read them back, upsert acts (plus the savepoint)
+        assert len(queries) == 5
+        assert list(missions) == ['existing_mission', 'new_mission']
+        assert missions['existing_mission'].pk == existing.pk
+        existing.refresh_from_db()
+        assert existing.name == 'Renamed'
+        # Fields not in any row are left alone
+        assert existing.hook_title == 'A Hook'
+        assert existing.get_act(1).description == 'New setup'
+        assert existing.get_act(2).description == 'Confrontation'
+        assert missions['new_mission'].get_act(2).objectives == [{'key': 'b', 'required': True}]
+        assert MissionAct.objects.filter(mission=missions['new_mission']).count() == 1
+
+    def test_event_bulk_update_or_create(self, create_mission):
+        """MIS-030: Test events are upserted by mission and key in one query"""
+        mission = create_mission('event_mission')
+        other = create_mission('other_mission')
+        existing = MissionEvent.objects.create(mission=mission, key='ambush', name='Ambush', event_type='combat', act=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            MissionEvent.bulk_update_or_create([
+                {'mission': mission, 'key': 'ambush', 'name': 'Bigger Ambush', 'event_type': 'combat', 'act': 2},
+                {'mission': other, 'key': 'ambush', 'name': 'Other Ambush', 'event_type': 'combat', 'act': 1},
+            ])
+
+        assert len(queries) == 1
+        existing.refresh_from_db()
+        assert (existing.name, existing.act) == ('Bigger Ambush', 2)
+        assert MissionEvent.objects.get(mission=other, key='ambush').name == 'Other Ambush'
+
+    def test_reseed_invalidates_mission_caches(self, authenticated_client, player, squad, create_mission):
+        """MIS-032: Test a bulk reseed shows up in the next listing despite the caches and ETag"""
+        create_mission('seeded_mission')
+        etag = authenticated_client.get('/api/v1/missions/')['ETag']
+
+        Mission.bulk_update_or_create_with_acts([
+            {'key': 'seeded_mission', 'name': 'Reseeded Mission', 'hook_title': 'A New Hook'},
+        ])
+        response = authenticated_client.get('/api/v1/missions/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['available'][0]['name'] == 'Reseeded Mission'
+        assert response.data['available'][0]['hook_title'] == 'A New Hook'
@@ -0,0 +1,208 @@
+"""
+Unit Tests for Squad API
+
+Tests for squad customization and fire team management endpoints.
+"""
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from game.models import Squad, SquadMember
+
+
+@pytest.fixture
+def squad(player):
+    """A squad with a leader and one team leader per fire team"""
+    squad = Squad.objects.create(player=player, squad_name='Test Squad')
+    for name, fire_team, role in (
+        ('SSG Lead', 'hq', 'squad_leader'),
+        ('SGT Alpha', 'alpha', 'team_leader'),
+        ('SGT Bravo', 'bravo', 'team_leader'),
+    ):
+        SquadMember.objects.create(
+            squad=squad, name=name, rank='sergeant', fire_team=fire_team,
+            role=role, primary_weapon='m4a1'
+        )
+    return squad
+
+
+@pytest.mark.django_db
+class TestSquadMemberSwap:
+    """Tests for swapping members between fire teams"""
+
+    def test_swap_team_leaders(self, authenticated_client, squad):
+        """SQD-001: Test two team leaders swap fire teams in one update"""
+        alpha = squad.members.get(name='SGT Alpha')
+        bravo = squad.members.get(name='SGT Bravo')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.post(
+                '/api/v1/squad/swap/', {'member1_id': alpha.id, 'member2_id': bravo.id}, format='json'
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [m['name'] for m in response.json()['alpha_team']] == ['SGT Bravo']
+        assert [m['name'] for m in response.json()['bravo_team']] == ['SGT Alpha']
+        updates = [q for q in queries.captured_queries if q['sql'].startswith('UPDATE "game_squadmember"')]
+        assert len(updates) == 1
+
+    def test_swap_rejections(self, authenticated_client, squad):
+        """SQD-002: Test swaps with missing members, the leader or the same member are rejected"""
+        leader = squad.members.get(role='squad_leader')
+        alpha = squad.members.get(name='SGT Alpha')
+
+        cases = [
+            ({'member1_id': alpha.id, 'member2_id': 999999}, status.HTTP_404_NOT_FOUND),
+            ({'member1_id': alpha.id, 'member2_id': leader.id}, status.HTTP_400_BAD_REQUEST),
+            ({'member1_id': alpha.id, 'member2_id': alpha.id}, status.HTTP_400_BAD_REQUEST),
+            ({'member1_id': alpha.id}, status.HTTP_400_BAD_REQUEST),
+            ({'member1_id': alpha.id, 'member2_id': 'abc'}, status.HTTP_400_BAD_REQUEST),
+        ]
+        for body, expected in cases:
+            response = authenticated_client.post('/api/v1/squad/swap/', body, format='json')
+            assert response.status_code == expected
+        alpha.refresh_from_db()
+        assert alpha.fire_team == 'alpha'
+
+
+@pytest.mark.django_db
+class TestSquadMemberCustomization:
+    """Tests for renaming members and assigning secondary duties"""
+
+    def test_invalid_duty(self, authenticated_client, squad):
+        """SQD-003: Test an unknown secondary duty is rejected"""
+        member = squad.members.get(name='SGT Alpha')
+
+        response = authenticated_client.patch(
+            f'/api/v1/squad/member/{member.id}/', {'secondary_duty': 'cook'}, format='json'
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == 'Invalid secondary duty. Must be one of: , medic, engineer, talker'
+
+    def test_duty_unique_per_fire_team(self, authenticated_client, squad):
+        """SQD-004: Test a duty held in the fire team is refused and otherwise saved in one UPDATE"""
+        alpha = squad.members.get(name='SGT Alpha')
+        SquadMember.objects.create(
+            squad=squad, name='PFC Medic', rank='private_first_class', fire_team='alpha',
+            role='rifleman', primary_weapon='m4a1', secondary_duty='medic'
+        )
+        url = f'/api/v1/squad/member/{alpha.id}/'
+
+        response = authenticated_client.patch(url, {'name': 'SGT Renamed', 'secondary_duty': 'medic'}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        alpha.refresh_from_db()
+        assert (alpha.name, alpha.secondary_duty) == ('SGT Alpha', '')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.patch(url, {'name': 'SGT Renamed', 'secondary_duty': 'engineer'}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.json()['name'], response.json()['secondary_duty']) == ('SGT Renamed', 'engineer')
+        assert not any(q['sql'].startswith('SELECT') and 'secondary_duty" = ' in q['sql'] for q in queries.captured_queries)
+        alpha.refresh_from_db()
+        assert (alpha.name, alpha.secondary_duty) == ('SGT Renamed', 'engineer')
+
+    def test_other_players_member(self, authenticated_client, squad, create_player):
+        """SQD-005: Test members of another player's squad can't be edited"""
+        other_squad = Squad.objects.create(player=create_player(), squad_name='Other Squad')
+        other = SquadMember.objects.create(
+            squad=other_squad, name='SGT Other', rank='sergeant', fire_team='alpha',
+            role='team_leader', primary_weapon='m4a1'
+        )
+
+        response = authenticated_client.patch(f'/api/v1/squad/member/{other.id}/', {'name': 'Mine'}, format='json')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        other.refresh_from_db()
+        assert other.name == 'SGT Other'
+
+
+@pytest.mark.django_db
+class TestSquadCustomization:
+    """Tests for renaming the squad"""
+
+    def test_update_writes_changed_columns(self, authenticated_client, squad):
+        """SQD-006: Test a squad rename only writes the changed columns"""
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.patch('/api/v1/squad/customize/', {'callsign': 'Havoc'}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['callsign'] == 'Havoc'
+        update = next(q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE "game_squad"'))
+        assert '"callsign"' in update and '"squad_name"' not in update and '"morale"' not in update
+        # The squad row comes with the token lookup
+        assert not any('FROM "game_squad"' in q['sql'] for q in queries.captured_queries)
+
+    def test_update_validation(self, authenticated_client, squad):
+        """SQD-008: Test squad names and callsigns are trimmed and length-checked"""
+        url = '/api/v1/squad/customize/'
+        cases = [
+            ({'squad_name': '   '}, 'Squad name must be 1-100 characters'),
+            ({'squad_name': 'x' * 101}, 'Squad name must be 1-100 characters'),
+            ({'callsign': ''}, 'Callsign must be 1-50 characters'),
+            ({'squad_name': 'Fine', 'callsign': 'x' * 51}, 'Callsign must be 1-50 characters'),
+        ]
+        for data, error in cases:
+            response = authenticated_client.patch(url, data, format='json')
+            assert response.status_code == status.HTTP_400_BAD_REQUEST, data
+            assert response.data['error'] == error
+
+        squad.refresh_from_db()
+        assert squad.squad_name == 'Test Squad'
+
+        response = authenticated_client.patch(url, {'squad_name': '  Renamed  '}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['squad_name'] == 'Renamed'
+
+
+@pytest.mark.django_db
+class TestSquadLookup:
+    """Tests for players without a squad"""
+
+    def test_views_without_squad(self, authenticated_client, player):
+        """SQD-007: Test squad endpoints return 404 when the player has no squad"""
+        responses = [
+            authenticated_client.patch('/api/v1/squad/customize/', {'callsign': 'Havoc'}, format='json'),
+            authenticated_client.patch('/api/v1/squad/member/1/', {'name': 'Someone'}, format='json'),
+            authenticated_client.post('/api/v1/squad/swap/', {'member1_id': 1, 'member2_id': 2}, format='json'),
+        ]
+
+        assert [response.status_code for response in responses] == [status.HTTP_404_NOT_FOUND] * 3
+
+
+@pytest.mark.django_db
+class TestSquadMemberHealth:
+    """Tests for the stored health percentage"""
+
+    def test_health_percentage_follows_health(self, squad):
+        """SQD-009: Test damage and healing keep the stored health percentage in step"""
+        member = squad.members.get(name='SGT Alpha')
+        member.take_damage(30)
+        assert SquadMember.objects.get(pk=member.pk).health_percentage == 70.0
+
+        member.max_health = 200
+        member.save(update_fields=['max_health'])
+        member.heal(10)
+        assert SquadMember.objects.values_list('health_percentage', flat=True).get(pk=member.pk) == 40.0
+
+
+@pytest.mark.django_db
+class TestSquadGeneration:
+    """Tests for generating a new squad"""
+
+    def test_generate_replaces_squad(self, authenticated_client, squad):
+        """SQD-010: Test generation replaces the old squad and inserts all members at once"""
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.post('/api/v1/squad/generate/', {'callsign': 'Reaper'}, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()['squad']
+        assert data['callsign'] == 'Reaper'
+        assert data['squad_leader']['role'] == 'squad_leader'
+        assert (len(data['alpha_team']), len(data['bravo_team']), data['total_members']) == (4, 4, 9)
+        assert not Squad.objects.filter(pk=squad.pk).exists()
+        medics = [m for m in data['alpha_team'] + data['bravo_team'] if m['secondary_duty'] == 'medic']
+        assert len(medics) == 2 and all(50 <= m['medical'] <= 65 for m in medics)
+        assert 13 <= data['squad_leader']['intelligence'] <= 15
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "game_squadmember"')]
+        assert len(inserts) == 1
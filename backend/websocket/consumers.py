@@ -3,10 +3,11 @@ WebSocket Consumers
 
 Handles WebSocket connections and real-time game communication.
 """
-import json
 import logging
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
+from django.core.exceptions import ObjectDoesNotExist
 from django.utils import timezone
 
 logger = logging.getLogger('game')
@@ -93,7 +94,7 @@ class GameConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         """Handle incoming WebSocket messages"""
         try:
-            data = json.loads(text_data)
+            data = orjson.loads(text_data)
             message_type = data.get('type')
 
             if message_type == 'command':
@@ -103,7 +104,7 @@ class GameConsumer(AsyncWebsocketConsumer):
             else:
                 await self.send_error(f"Unknown message type: {message_type}")
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             await self.send_error("Invalid JSON")
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
@@ -257,7 +258,7 @@ class GameConsumer(AsyncWebsocketConsumer):
 
     async def send_message(self, message_dict):
         """Send a message to the client"""
-        await self.send(text_data=json.dumps(message_dict))
+        await self.send(text_data=orjson.dumps(message_dict).decode())
 
     async def send_error(self, error_message):
         """Send an error message to the client"""
@@ -271,7 +272,8 @@ class GameConsumer(AsyncWebsocketConsumer):
         """Get the player for this user"""
         try:
             return self.user.player
-        except:
+        except (ObjectDoesNotExist, AttributeError):
+            # No player yet, or an anonymous user
             return None
 
     @database_sync_to_async
@@ -341,7 +343,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
     async def receive(self, text_data):
         """Handle incoming chat messages"""
         try:
-            data = json.loads(text_data)
+            data = orjson.loads(text_data)
             message = data.get('message', '').strip()
 
             if not message:
@@ -362,8 +364,8 @@ class ChatConsumer(AsyncWebsocketConsumer):
 
     async def chat_message(self, event):
         """Send chat message to client"""
-        await self.send(text_data=json.dumps({
+        await self.send(text_data=orjson.dumps({
             'type': 'chat',
             'username': event['username'],
             'message': event['message']
-        }))
+        }).decode())